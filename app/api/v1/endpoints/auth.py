@@ -1,17 +1,42 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.api.v1.schemas.user_schema import UserCreate, UserRead
 from app.api.v1.schemas.auth_schema import LoginRequest, Token
 from app.services import auth_service, user_service
+from app.config.settings import settings
 from app.dependencies import get_db, get_current_user
-from app.models.user_model import User
+from app.services.login_limiter import login_limiter
+from app.utils.hash import PasswordHashPoolBusy
 
 router = APIRouter(tags=["Users", "Authentication"])
 
 DbSession = Annotated[Session, Depends(get_db)]
 
 
+def _client_ip(request: Request) -> str:
+    """
+    Returns the address login attempts are counted under.
+
+    Behind a reverse proxy the peer address is the proxy's, so the client address is taken from
+    LOGIN_CLIENT_IP_HEADER when it is configured. Only its last entry is used: that is the one
+    appended by the trusted proxy, earlier entries are whatever the client sent.
+
+    Args:
+        request (Request): Incoming request.
+
+    Returns:
+        str: The client address, or "unknown" if there is none.
+    """
+    if settings.LOGIN_CLIENT_IP_HEADER:
+        forwarded = request.headers.get(settings.LOGIN_CLIENT_IP_HEADER, "")
+        address = forwarded.rsplit(",", 1)[-1].strip()
+        if address:
+            return address
+    return request.client.host if request.client else "unknown"
+
+
 @router.post(
     "/register",
     response_model=UserRead,
@@ -36,7 +61,7 @@ async def register_user(user: UserCreate, db: DbSession):
         201 Created: Successfully created user.
         400 Bad Request: Username already exists.
     """
-    new_user = user_service.create_user(db, user)
+    new_user = await user_service.create_user_async(db, user)
     return new_user
 
 
@@ -44,13 +69,21 @@ async def register_user(user: UserCreate, db: DbSession):
     "/login",
     response_model=Token,
     summary="Log in user and get a JWT",
+    responses={
+        429: {"description": "Too many login attempts for this username or client, retry later"},
+        503: {"description": "Too many logins being verified, retry later"},
+    },
 )
-async def login_for_access_token(login_data: LoginRequest, db: DbSession):
+async def login_for_access_token(login_data: LoginRequest, request: Request, db: DbSession):
     """
     Authenticates a user with username and password and returns a JWT access token.
 
+    Attempts are counted per username and failed attempts per client IP in a sliding window,
+    and rejected before the password is hashed once either limit is reached.
+
     Args:
         login_data (LoginRequest): Username and password.
+        request (Request): Incoming request, used for the client address.
         db (Session): Database session dependency.
 
     Returns:
@@ -58,18 +91,39 @@ async def login_for_access_token(login_data: LoginRequest, db: DbSession):
 
     Raises:
         HTTPException 401: If authentication fails.
+        HTTPException 429: If the username or client IP has used up its login attempts.
+        HTTPException 503: If the maximum number of password verifications is already pending.
 
     Responses:
         200 OK: Successfully authenticated, returns JWT token.
         401 Unauthorized: Incorrect username or password.
+        429 Too Many Requests: Too many login attempts; see Retry-After.
+        503 Service Unavailable: Password verification capacity exhausted; see Retry-After.
     """
-    user = auth_service.authenticate_user(db, login_data.username, login_data.password)
+    client_ip = _client_ip(request)
+    # The attempt store may be the database, so keep its round-trips off the event loop
+    retry_after = await run_in_threadpool(login_limiter.admit, login_data.username, client_ip)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts",
+            headers={"Retry-After": str(max(1, round(retry_after)))},
+        )
+    try:
+        user = await auth_service.authenticate_user(db, login_data.username, login_data.password)
+    except PasswordHashPoolBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many logins in progress",
+            headers={"Retry-After": "1"},
+        )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    await run_in_threadpool(login_limiter.succeeded, login_data.username, client_ip)
     access_token = auth_service.create_access_token_for_user(user)
     return {"access_token": access_token, "token_type": "bearer"}
 
@@ -79,12 +133,12 @@ async def login_for_access_token(login_data: LoginRequest, db: DbSession):
     response_model=UserRead,
     summary="Get your own user",
 )
-async def fetch_current_user(current_user: Annotated[User, Depends(get_current_user)]):
+async def fetch_current_user(current_user: Annotated[UserRead, Depends(get_current_user)]):
     """
     Fetch the currently authenticated user's information.
 
     Args:
-        current_user (User): Injected via JWT authentication dependency.
+        current_user (UserRead): Injected via JWT authentication dependency.
 
     Returns:
         UserRead: The currently authenticated user's details.
@@ -1,18 +1,42 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from typing import Literal
 from uuid import UUID
+from app.config.settings import settings
+from app.db.connection import SessionLocal
 from app.dependencies import get_db
+from app.utils.ndjson import iter_ndjson_lines, NDJSONLineTooLong
+from app.utils.device_payload import MEDIA_TYPE, DevicePayloadError, decode_device_payload
 from app.api.v1.schemas.control_unit_schema import (
     DeviceData,
+    TimestampGroup,
     ControlUnitDataCreate,
     ControlUnitDataUpdate,
     ControlUnitDataRead,
+    ControlUnitDataAggregate,
+    ReadingStatistics,
+    ReadingField,
+    AggregateFunction,
 )
+from app.services.ingest_queue import ingest_queue, IngestQueueFull
+from app.services.analytics_service import DEFAULT_ACTIVATION_ENERGY, compute_reading_statistics
+from app.services.export_service import COMPRESSION_CODECS, EXPORT_FORMATS, iter_reading_batches, stream_readings
+from app.services.shipment_service import get_shipment_by_id
+from app.services.latest_reading_cache import latest_readings
+from app.services.live_feed import live_feed, stream_events
 from app.services.control_unit_service import (
-    save_device_data,
+    flatten_device_data,
+    flatten_timestamp_group,
+    save_readings,
+    aggregate_control_unit_data,
     create_control_unit_data,
-    get_all_control_unit_data,
+    get_control_unit_data_page,
     get_control_unit_data_by_id,
     update_control_unit_data,
     delete_control_unit_data,
@@ -54,31 +78,128 @@ def create(data: ControlUnitDataCreate, db: Session = Depends(get_db)):
     "/",
     status_code=status.HTTP_201_CREATED,
     summary="Receive grouped readings from a control unit",
+    responses={
+        202: {"description": "Readings queued for a background write"},
+        429: {"description": "Ingest queue is full, retry later"},
+    },
 )
-def receive_device_data(data: DeviceData, db: Session = Depends(get_db)):
+def receive_device_data(data: DeviceData, response: Response, db: Session = Depends(get_db)):
     """
     Save grouped sensor readings sent by a control unit.
 
+    Uploads are idempotent: readings whose (control_unit_id, sensor_unit_id, timestamp)
+    already exist are skipped and reported as duplicates, so devices can safely retry.
+    When the write-behind ingest queue is running, the readings are queued and
+    written in batches by a background worker instead of inside the request.
+
     Args:
         data (DeviceData): Pydantic model with grouped readings.
+        response (Response): Outgoing response, used to switch to 202 when queued.
         db (Session): Database session dependency.
 
     Returns:
-        dict: Status and number of saved readings.
+        dict: Status and number of new and duplicate readings (or queued readings).
 
     Raises:
         HTTPException 400: For unexpected errors.
+        HTTPException 429: If the ingest queue is full.
         HTTPException 500: For database errors.
 
     Responses:
         201 Created: Successfully saved readings.
+        202 Accepted: Readings queued for a background write.
         400 Bad Request: Unexpected input error.
+        429 Too Many Requests: Ingest queue is full.
+        500 Internal Server Error: Database failure.
+    """
+    return _store_rows(flatten_device_data(data), response, db)
+
+
+@router.post(
+    "/binary",
+    status_code=status.HTTP_201_CREATED,
+    summary="Receive grouped readings in the compact binary format",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}}},
+        }
+    },
+    responses={
+        202: {"description": "Readings queued for a background write"},
+        415: {"description": f"Content-Type is not {MEDIA_TYPE}"},
+        429: {"description": "Ingest queue is full, retry later"},
+    },
+)
+async def receive_device_data_binary(request: Request, response: Response, db: Session = Depends(get_db)):
+    """
+    Save grouped sensor readings sent in the compact binary format.
+
+    The payload carries each sensor unit ID once and is decoded directly into
+    row tuples (see app.utils.device_payload for the layout).
+
+    Args:
+        request (Request): Incoming request with the binary body.
+        response (Response): Outgoing response, used to switch to 202 when queued.
+        db (Session): Database session dependency.
+
+    Returns:
+        dict: Status and number of new and duplicate readings (or queued readings).
+
+    Raises:
+        HTTPException 400: If the payload is malformed.
+        HTTPException 415: If the Content-Type is not the binary media type.
+        HTTPException 429: If the ingest queue is full.
+        HTTPException 500: For database errors.
+
+    Responses:
+        201 Created: Successfully saved readings.
+        202 Accepted: Readings queued for a background write.
+        400 Bad Request: Malformed payload.
+        415 Unsupported Media Type: Wrong Content-Type.
+        429 Too Many Requests: Ingest queue is full.
         500 Internal Server Error: Database failure.
     """
+    if request.headers.get("content-type", "").split(";")[0].strip() != MEDIA_TYPE:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=f"Expected Content-Type {MEDIA_TYPE}")
+    try:
+        _, rows = decode_device_payload(await request.body())
+    except DevicePayloadError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid payload: {str(e)}")
+    return await run_in_threadpool(_store_rows, rows, response, db)
+
+
+def _store_rows(rows: list[tuple], response: Response, db: Session) -> dict:
+    """
+    Queues or saves flattened readings for the grouped ingest endpoints.
+
+    Args:
+        rows (list[tuple]): Row tuples ordered as READING_COLUMNS.
+        response (Response): Outgoing response, switched to 202 when the rows are queued.
+        db (Session): Database session used when the ingest queue is not running.
+
+    Returns:
+        dict: Status and number of new and duplicate readings (or queued readings).
+
+    Raises:
+        HTTPException 400: For unexpected errors.
+        HTTPException 429: If the ingest queue is full.
+        HTTPException 500: For database errors.
+    """
+    if ingest_queue.running:
+        try:
+            queued = ingest_queue.submit(rows)
+        except IngestQueueFull:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Ingest queue is full",
+                headers={"Retry-After": str(max(1, round(ingest_queue.flush_interval)))},
+            )
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {"status": "accepted", "queued": queued}
     try:
-        save_device_data(data, db)
-        total_readings = sum(len(group.sensor_units) for group in data.timestamp_groups)
-        return {"status": "ok", "saved": total_readings}
+        saved = save_readings(db, rows)
+        return {"status": "ok", "saved": saved, "duplicates": len(rows) - saved}
     except SQLAlchemyError as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -86,25 +207,469 @@ def receive_device_data(data: DeviceData, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail=f"Unexpected error: {str(e)}")
 
 
+@router.post(
+    "/stream",
+    status_code=status.HTTP_201_CREATED,
+    summary="Stream grouped readings from a control unit as NDJSON",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {
+                    "schema": {"type": "string", "description": "One TimestampGroup JSON object per line"},
+                }
+            },
+        }
+    },
+)
+async def receive_device_data_stream(control_unit_id: UUID, request: Request, db: Session = Depends(get_db)):
+    """
+    Save a backlog of grouped readings streamed as NDJSON, one TimestampGroup per line.
+
+    The body is parsed line by line as it arrives and written in batches of
+    INGEST_BATCH_SIZE readings, so memory use does not depend on the backlog size.
+    Batches written before an invalid line stay committed; the error reports the
+    line number and how many readings were saved, so the device can resume.
+
+    Args:
+        control_unit_id (UUID): UUID of the control unit sending the backlog.
+        request (Request): Incoming request whose body is streamed.
+        db (Session): Database session dependency.
+
+    Returns:
+        dict: Status and number of new and duplicate readings.
+
+    Raises:
+        HTTPException 413: If a single line exceeds NDJSON_MAX_LINE_BYTES.
+        HTTPException 422: If a line is not a valid TimestampGroup.
+        HTTPException 500: For database errors.
+
+    Responses:
+        201 Created: Successfully saved readings.
+        413 Content Too Large: A line is too large.
+        422 Unprocessable Entity: Invalid line.
+        500 Internal Server Error: Database failure.
+    """
+    batch_size = settings.INGEST_BATCH_SIZE
+    rows: list[tuple] = []
+    received = 0
+    saved = 0
+    line_number = 0
+    try:
+        async for line_number, line in iter_ndjson_lines(request.stream(), settings.NDJSON_MAX_LINE_BYTES):
+            flatten_timestamp_group(control_unit_id, TimestampGroup.model_validate_json(line), rows)
+            if len(rows) >= batch_size:
+                received += len(rows)
+                saved += await run_in_threadpool(save_readings, db, rows)
+                rows = []
+        if rows:
+            received += len(rows)
+            saved += await run_in_threadpool(save_readings, db, rows)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "message": f"Invalid timestamp group on line {line_number}",
+                "line": line_number,
+                "saved": saved,
+                "errors": e.errors(include_url=False, include_context=False, include_input=False),
+            },
+        )
+    except NDJSONLineTooLong as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail={"message": str(e), "line": e.line_number, "saved": saved},
+        )
+    except SQLAlchemyError as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+    return {"status": "ok", "saved": saved, "duplicates": received - saved}
+
+
 @router.get(
     "/",
     response_model=list[ControlUnitDataRead],
-    summary="Read all control unit data",
+    summary="Read control unit data, one page at a time",
 )
-def read_all(db: Session = Depends(get_db)):
+def read_all(
+    response: Response,
+    sensor_unit_id: UUID | None = None,
+    control_unit_id: UUID | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int = Query(settings.PAGE_DEFAULT_SIZE, ge=1, le=settings.PAGE_MAX_SIZE),
+    cursor: str | None = None,
+    db: Session = Depends(get_db),
+):
     """
-    Retrieve all control unit readings from the database.
+    Retrieve control unit readings ordered by timestamp, one page at a time.
+
+    When more readings match, the response carries an `X-Next-Cursor` header;
+    pass its value as `cursor` (with the same filters) to fetch the next page.
 
     Args:
+        response (Response): Response used to set the next-page cursor header.
+        sensor_unit_id (UUID | None): Only return readings from this sensor unit.
+        control_unit_id (UUID | None): Only return readings from this control unit.
+        start (datetime | None): Only return readings at or after this time.
+        end (datetime | None): Only return readings before this time.
+        limit (int): Page size, at most PAGE_MAX_SIZE. Defaults to PAGE_DEFAULT_SIZE.
+        cursor (str | None): Cursor from the previous page's `X-Next-Cursor` header.
         db (Session): Database session dependency.
 
     Returns:
-        List[ControlUnitDataRead]: All control unit data objects.
+        List[ControlUnitDataRead]: One page of control unit data objects.
+
+    Raises:
+        HTTPException 400: If the cursor is invalid.
 
     Responses:
         200 OK: Successfully retrieved data.
+        400 Bad Request: Invalid cursor.
+        422 Unprocessable Entity: Invalid query parameters.
+    """
+    try:
+        items, next_cursor = get_control_unit_data_page(
+            db,
+            limit,
+            cursor=cursor,
+            sensor_unit_id=sensor_unit_id,
+            control_unit_id=control_unit_id,
+            start=start,
+            end=end,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
+
+
+@router.get(
+    "/latest",
+    response_model=list[ControlUnitDataRead],
+    summary="Read the latest reading per sensor unit",
+)
+def read_latest(
+    sensor_unit_id: UUID | None = None,
+    control_unit_id: UUID | None = None,
+    shipment_id: UUID | None = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve the most recent reading of a sensor unit, of the sensor on a shipment,
+    or of every sensor unit reporting through a control unit.
+
+    Served from the in-memory latest-reading cache; the database is only
+    queried to resolve a shipment's sensor unit.
+
+    Args:
+        sensor_unit_id (UUID | None): Sensor unit to look up.
+        control_unit_id (UUID | None): Control unit whose sensors to look up.
+        shipment_id (UUID | None): Shipment whose sensor unit to look up.
+        db (Session): Database session dependency.
+
+    Returns:
+        List[ControlUnitDataRead]: The latest readings (empty if none are known).
+
+    Raises:
+        HTTPException 400: If not exactly one of the filters is given.
+        HTTPException 404: If the shipment does not exist or has no sensor unit.
+
+    Responses:
+        200 OK: Latest readings returned.
+        400 Bad Request: Missing or conflicting filters.
+        404 Not Found: Shipment not found.
+    """
+    if sum(value is not None for value in (sensor_unit_id, control_unit_id, shipment_id)) != 1:
+        raise HTTPException(
+            status_code=400,
+            detail="Exactly one of sensor_unit_id, control_unit_id or shipment_id is required",
+        )
+    if shipment_id is not None:
+        shipment = get_shipment_by_id(db, shipment_id)
+        if not shipment or shipment.sensor_unit_id is None:
+            raise HTTPException(status_code=404, detail="Shipment not found or has no sensor unit")
+        sensor_unit_id = shipment.sensor_unit_id
+
+    if sensor_unit_id is not None:
+        row = latest_readings.get_sensor(sensor_unit_id)
+        rows = [row] if row is not None else []
+    else:
+        rows = latest_readings.get_control_unit(control_unit_id)
+    return [
+        {
+            "id": row_id,
+            "sensor_unit_id": sensor,
+            "control_unit_id": control_unit,
+            "timestamp": timestamp,
+            "humidity": {"value": humidity},
+            "temperature": {"value": temperature},
+        }
+        for row_id, sensor, control_unit, timestamp, humidity, temperature in rows
+    ]
+
+
+@router.get(
+    "/live",
+    response_class=StreamingResponse,
+    summary="Subscribe to new readings of a sensor unit or shipment (Server-Sent Events)",
+)
+async def live(sensor_unit_id: UUID | None = None, shipment_id: UUID | None = None, db: Session = Depends(get_db)):
+    """
+    Push new readings of a sensor unit, or of the sensor on a shipment, as they are saved.
+
+    Replaces polling: the response is a text/event-stream that sends one "reading" event per
+    saved reading (data: the reading as JSON, id: the reading ID) and keep-alive comments while idle.
+    A client that falls more than LIVE_FEED_BUFFER_SIZE readings behind receives a "dropped"
+    event and the stream ends; EventSource clients reconnect automatically.
+
+    Args:
+        sensor_unit_id (UUID | None): Sensor unit to follow.
+        shipment_id (UUID | None): Shipment whose sensor unit to follow.
+        db (Session): Database session dependency, used to resolve the shipment.
+
+    Returns:
+        StreamingResponse: Server-Sent Events stream.
+
+    Raises:
+        HTTPException 400: If not exactly one of sensor_unit_id or shipment_id is given.
+        HTTPException 404: If the shipment does not exist or has no sensor unit.
+
+    Responses:
+        200 OK: Event stream opened.
+        400 Bad Request: Missing or conflicting filters.
+        404 Not Found: Shipment not found.
+    """
+    if (sensor_unit_id is None) == (shipment_id is None):
+        raise HTTPException(status_code=400, detail="Exactly one of sensor_unit_id or shipment_id is required")
+    if shipment_id is not None:
+        shipment = await run_in_threadpool(get_shipment_by_id, db, shipment_id)
+        if not shipment or shipment.sensor_unit_id is None:
+            raise HTTPException(status_code=404, detail="Shipment not found or has no sensor unit")
+        sensor_unit_id = shipment.sensor_unit_id
+
+    # Subscribe before responding so no reading saved after the response starts is missed
+    subscription = live_feed.subscribe(sensor_unit_id, settings.LIVE_FEED_BUFFER_SIZE)
+    return StreamingResponse(
+        stream_events(subscription, settings.LIVE_FEED_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # Also runs when the client disconnects before the stream generator starts
+        background=BackgroundTask(live_feed.unsubscribe, subscription),
+    )
+
+
+@router.get(
+    "/aggregate",
+    response_model=ControlUnitDataAggregate,
+    summary="Aggregate readings into time buckets",
+)
+def aggregate(
+    start: datetime,
+    end: datetime,
+    sensor_unit_id: UUID | None = None,
+    control_unit_id: UUID | None = None,
+    bucket_seconds: int = Query(300, ge=1, le=86_400),
+    aggregates: list[AggregateFunction] = Query(["avg", "min", "max"]),
+    fields: list[ReadingField] = Query(["temperature", "humidity"]),
+    db: Session = Depends(get_db),
+):
+    """
+    Aggregate readings per sensor into fixed-width time buckets, e.g. the average,
+    minimum and maximum temperature of a sensor per 5 minutes between two times.
+
+    Bucketing and aggregation run in the database; the result is returned as
+    parallel arrays (one entry per sensor and non-empty bucket).
+
+    Args:
+        start (datetime): Inclusive start of the time range.
+        end (datetime): Exclusive end of the time range.
+        sensor_unit_id (UUID | None): Sensor unit to aggregate.
+        control_unit_id (UUID | None): Control unit whose sensors to aggregate.
+        bucket_seconds (int): Bucket width in seconds (1 to 86400). Defaults to 300.
+        aggregates (list[str]): Any of avg, min, max, sum, count. Defaults to avg, min, max.
+        fields (list[str]): Any of temperature, humidity. Defaults to both.
+        db (Session): Database session dependency.
+
+    Returns:
+        ControlUnitDataAggregate: Columnar bucket aggregates.
+
+    Raises:
+        HTTPException 400: If no sensor or control unit is given, the range is empty,
+            or it spans more than AGGREGATE_MAX_BUCKETS buckets.
+
+    Responses:
+        200 OK: Aggregates returned (possibly empty).
+        400 Bad Request: Invalid filter or range.
+        422 Unprocessable Entity: Invalid query parameters.
+    """
+    if sensor_unit_id is None and control_unit_id is None:
+        raise HTTPException(status_code=400, detail="sensor_unit_id or control_unit_id is required")
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if (end - start).total_seconds() / bucket_seconds > settings.AGGREGATE_MAX_BUCKETS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range spans more than {settings.AGGREGATE_MAX_BUCKETS} buckets; increase bucket_seconds",
+        )
+    return aggregate_control_unit_data(
+        db,
+        start,
+        end,
+        bucket_seconds,
+        list(dict.fromkeys(aggregates)),
+        list(dict.fromkeys(fields)),
+        sensor_unit_id=sensor_unit_id,
+        control_unit_id=control_unit_id,
+    )
+
+
+@router.get(
+    "/statistics",
+    response_model=ReadingStatistics,
+    summary="Compute statistics over a sensor's readings",
+)
+def statistics(
+    start: datetime,
+    end: datetime,
+    sensor_unit_id: UUID | None = None,
+    shipment_id: UUID | None = None,
+    percentiles: list[float] = Query([5, 50, 95]),
+    temperature_above: float | None = None,
+    temperature_below: float | None = None,
+    activation_energy: float = Query(DEFAULT_ACTIVATION_ENERGY, gt=0),
+    db: Session = Depends(get_db),
+):
+    """
+    Compute mean, standard deviation, min/max and percentiles of temperature and humidity,
+    time spent above/below a temperature threshold and the mean kinetic temperature
+    for the readings of a sensor unit, or of the sensor on a shipment, in a time range.
+
+    Readings are loaded column-wise into NumPy arrays and analysed vectorised on the server,
+    so clients do not need to download and loop over individual readings.
+
+    Args:
+        start (datetime): Inclusive start of the time range.
+        end (datetime): Exclusive end of the time range.
+        sensor_unit_id (UUID | None): Sensor unit to analyse.
+        shipment_id (UUID | None): Shipment whose sensor unit to analyse.
+        percentiles (list[float]): Percentiles between 0 and 100. Defaults to 5, 50 and 95.
+        temperature_above (float | None): Report the seconds spent above this temperature.
+        temperature_below (float | None): Report the seconds spent below this temperature.
+        activation_energy (float): Activation energy in kJ/mol for the mean kinetic temperature. Defaults to 83.144.
+        db (Session): Database session dependency.
+
+    Returns:
+        ReadingStatistics: The statistics (null values when there are no readings).
+
+    Raises:
+        HTTPException 400: If not exactly one of sensor_unit_id or shipment_id is given,
+            the range is empty, or a percentile is outside 0-100.
+        HTTPException 404: If the shipment does not exist or has no sensor unit.
+
+    Responses:
+        200 OK: Statistics returned.
+        400 Bad Request: Invalid filter, range or percentile.
+        404 Not Found: Shipment not found.
+        422 Unprocessable Entity: Invalid query parameters.
+    """
+    if (sensor_unit_id is None) == (shipment_id is None):
+        raise HTTPException(status_code=400, detail="Exactly one of sensor_unit_id or shipment_id is required")
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if any(not 0 <= percentile <= 100 for percentile in percentiles):
+        raise HTTPException(status_code=400, detail="Percentiles must be between 0 and 100")
+    if shipment_id is not None:
+        shipment = get_shipment_by_id(db, shipment_id)
+        if not shipment or shipment.sensor_unit_id is None:
+            raise HTTPException(status_code=404, detail="Shipment not found or has no sensor unit")
+        sensor_unit_id = shipment.sensor_unit_id
+    return compute_reading_statistics(
+        db,
+        sensor_unit_id,
+        start,
+        end,
+        list(dict.fromkeys(percentiles)),
+        temperature_above=temperature_above,
+        temperature_below=temperature_below,
+        activation_energy=activation_energy,
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Stream readings as NDJSON, CSV, Parquet or Arrow",
+)
+def export(
+    export_format: Literal["ndjson", "csv", "parquet", "arrow"] = Query("ndjson", alias="format"),
+    compression: str | None = None,
+    shipment_id: UUID | None = None,
+    sensor_unit_id: UUID | None = None,
+    control_unit_id: UUID | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Stream all matching readings ordered by timestamp for bulk analysis.
+
+    Rows are read through a server-side cursor and written out batch by batch,
+    so memory stays bounded and the first bytes are sent before the query completes.
+    Parquet and Arrow IPC files are built column-wise, one row group / record batch
+    per fetched batch, and can be loaded directly with pandas or pyarrow.
+    The export uses its own database session for the lifetime of the stream.
+
+    Args:
+        export_format (str): "ndjson" (default), "csv", "parquet" or "arrow", passed as `format`.
+        compression (str | None): Codec for parquet (none, snappy, gzip, brotli, lz4, zstd)
+            or arrow (none, lz4, zstd). Defaults to zstd.
+        shipment_id (UUID | None): Only export readings from the shipment's sensor unit.
+        sensor_unit_id (UUID | None): Only export readings from this sensor unit.
+        control_unit_id (UUID | None): Only export readings from this control unit.
+        start (datetime | None): Only export readings at or after this time.
+        end (datetime | None): Only export readings before this time.
+        db (Session): Database session dependency, used to resolve the shipment.
+
+    Returns:
+        StreamingResponse: The readings with columns id, sensor_unit_id, control_unit_id,
+            timestamp, humidity_value and temperature_value.
+
+    Raises:
+        HTTPException 400: If the compression codec is not supported by the format.
+        HTTPException 404: If the shipment does not exist or has no sensor unit.
+
+    Responses:
+        200 OK: Export streamed.
+        400 Bad Request: Unsupported compression.
+        404 Not Found: Shipment not found.
+        422 Unprocessable Entity: Invalid query parameters.
     """
-    return get_all_control_unit_data(db)
+    if compression is not None and compression not in COMPRESSION_CODECS.get(export_format, ()):
+        raise HTTPException(status_code=400, detail=f"Unsupported compression for {export_format}: {compression}")
+    if shipment_id is not None:
+        shipment = get_shipment_by_id(db, shipment_id)
+        if not shipment or shipment.sensor_unit_id is None:
+            raise HTTPException(status_code=404, detail="Shipment not found or has no sensor unit")
+        if sensor_unit_id is not None and sensor_unit_id != shipment.sensor_unit_id:
+            raise HTTPException(status_code=400, detail="sensor_unit_id does not match the shipment")
+        sensor_unit_id = shipment.sensor_unit_id
+
+    batch_size = settings.EXPORT_COLUMNAR_BATCH_SIZE if export_format in COMPRESSION_CODECS else settings.EXPORT_BATCH_SIZE
+    batches = iter_reading_batches(
+        SessionLocal,
+        batch_size,
+        sensor_unit_id=sensor_unit_id,
+        control_unit_id=control_unit_id,
+        start=start,
+        end=end,
+    )
+    return StreamingResponse(
+        stream_readings(batches, export_format, compression),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="control_unit_data.{export_format}"'},
+    )
 
 
 @router.get(
@@ -159,8 +724,9 @@ def update(data_id: UUID, update: ControlUnitDataUpdate, db: Session = Depends(g
     Responses:
         200 OK: Successfully updated.
         404 Not Found: Data not found.
+        422 Unprocessable Entity: A field is null or invalid.
     """
-    item = update_control_unit_data(db, str(data_id), update.model_dump(exclude_unset=True))
+    item = update_control_unit_data(db, str(data_id), update)
     if not item:
         raise HTTPException(status_code=404, detail="ControlUnitData not found")
     return item
@@ -1,11 +1,13 @@
+from datetime import datetime
 from typing import Annotated, List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from uuid import UUID
 from app.dependencies import get_db, require_roles, get_current_user
 from app.services import shipment_service
-from app.api.v1.schemas.shipment_schema import ShipmentCreate, ShipmentRead
-from app.models.user_model import User
+from app.api.v1.schemas.shipment_schema import ShipmentCreate, ShipmentRead, ShipmentReadings
+from app.config.settings import settings
+from app.api.v1.schemas.user_schema import UserRead
 
 router = APIRouter(tags=["Shipments"])
 
@@ -68,7 +70,7 @@ async def list_shipments(db: DbSession, _: AdminOnly):
     response_model=List[ShipmentRead],
     summary="Get current user's shipments (driver or customer)",
 )
-async def fetch_current_users_shipments(db: DbSession, current_user: Annotated[User, Depends(get_current_user)]):
+async def fetch_current_users_shipments(db: DbSession, current_user: Annotated[UserRead, Depends(get_current_user)]):
     """
     Returns all shipments linked to the currently authenticated user.
 
@@ -78,7 +80,7 @@ async def fetch_current_users_shipments(db: DbSession, current_user: Annotated[U
 
     Args:
         db (DbSession): Database session dependency.
-        current_user (User): Currently authenticated user.
+        current_user (UserRead): Currently authenticated user.
 
     Returns:
         List[ShipmentRead]: List of shipments for the current user.
@@ -124,19 +126,62 @@ async def get_shipment(shipment_id: UUID, db: DbSession):
     return shipment
 
 
+@router.get("/{shipment_id}/readings", response_model=ShipmentReadings, summary="Get a shipment's sensor readings")
+def get_shipment_readings(
+    shipment_id: UUID,
+    db: DbSession,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    max_points: int = Query(settings.SHIPMENT_READINGS_MAX_POINTS, ge=0),
+):
+    """
+    Retrieve the temperature and humidity history of a shipment's sensor unit for charting.
+
+    The window defaults to the shipment's creation time until now. Long histories are
+    downsampled with LTTB to at most `max_points` readings, keeping peaks and troughs.
+
+    Args:
+        shipment_id (UUID): The unique ID of the shipment.
+        db (DbSession): Database session dependency.
+        start (datetime | None): Window start. Defaults to the shipment's creation time.
+        end (datetime | None): Window end. Defaults to now.
+        max_points (int): Maximum number of readings to return; 0 disables downsampling.
+            Defaults to SHIPMENT_READINGS_MAX_POINTS.
+
+    Returns:
+        ShipmentReadings: Columnar readings of the shipment's sensor unit.
+
+    Raises:
+        HTTPException 404: If the shipment does not exist or has no sensor unit.
+
+    Responses:
+        200 OK: Returns the readings (possibly empty).
+        404 Not Found: Shipment not found or has no sensor unit.
+        422 Unprocessable Entity: Invalid query parameters.
+    """
+    shipment = shipment_service.get_shipment_by_id(db, shipment_id)
+    if not shipment:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shipment not found")
+    if shipment.sensor_unit_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shipment has no sensor unit")
+    return shipment_service.get_shipment_readings(db, shipment, start=start, end=end, max_points=max_points)
+
+
 @router.patch("/{shipment_id}", response_model=ShipmentRead, summary="Update shipment (admin only)")
 async def update_shipment(
     shipment_id: UUID,
     driver_id: UUID | None = None,
+    sensor_unit_id: UUID | None = None,
     db: DbSession = DbSession,
     _: AdminOnly = AdminOnly,
 ):
     """
-    Update an existing shipment's driver assignment.
+    Update an existing shipment's driver or sensor unit assignment.
 
     Args:
         shipment_id (UUID): The unique ID of the shipment to update.
         driver_id (UUID | None): Optional driver UUID to assign.
+        sensor_unit_id (UUID | None): Optional sensor unit UUID to assign; the shipment's threshold rules follow it.
         db (DbSession): Database session dependency.
         _ (None): Dummy dependency to enforce admin-only access.
 
@@ -152,7 +197,7 @@ async def update_shipment(
         401 Unauthorized: Caller is not an admin.
         404 Not Found: Shipment not found.
     """
-    updated = shipment_service.update_shipment(db, shipment_id, driver_id)
+    updated = shipment_service.update_shipment(db, shipment_id, driver_id, sensor_unit_id=sensor_unit_id)
     if not updated:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shipment not found")
     return updated
@@ -0,0 +1,134 @@
+from typing import Annotated, List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from uuid import UUID
+from app.dependencies import get_db, require_roles
+from app.api.v1.schemas.threshold_schema import ThresholdRuleCreate, ThresholdRuleRead, ThresholdExcursionRead
+from app.services import threshold_service
+from app.services.shipment_service import get_shipment_by_id
+
+router = APIRouter(tags=["Thresholds"])
+
+# Dependencies
+DbSession = Annotated[Session, Depends(get_db)]
+AdminOnly = Annotated[None, Depends(require_roles(["admin"]))]
+
+
+@router.post(
+    "/rules",
+    response_model=ThresholdRuleRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create threshold rule (admin only)",
+)
+def create_rule(payload: ThresholdRuleCreate, db: DbSession, _: AdminOnly):
+    """
+    Create a temperature/humidity band for a sensor unit or a shipment.
+
+    Readings ingested after the rule is created are checked against it.
+
+    Args:
+        payload (ThresholdRuleCreate): Rule target and bounds.
+        db (DbSession): Database session dependency.
+        _ (AdminOnly): Dependency enforcing admin-only access.
+
+    Returns:
+        ThresholdRuleRead: The created rule.
+
+    Raises:
+        HTTPException 404: If the shipment does not exist.
+
+    Responses:
+        201 Created: Rule created.
+        401 Unauthorized / 403 Forbidden: Caller is not an admin.
+        404 Not Found: Shipment not found.
+        422 Unprocessable Entity: Missing target or bounds, or minimum above maximum.
+    """
+    if payload.shipment_id is not None and not get_shipment_by_id(db, payload.shipment_id):
+        raise HTTPException(status_code=404, detail="Shipment not found")
+    return threshold_service.create_rule(db, payload)
+
+
+@router.get("/rules", response_model=List[ThresholdRuleRead], summary="List threshold rules (admin only)")
+def list_rules(db: DbSession, _: AdminOnly, sensor_unit_id: UUID | None = None, shipment_id: UUID | None = None):
+    """
+    Retrieve threshold rules, optionally filtered by sensor unit or shipment.
+
+    Args:
+        db (DbSession): Database session dependency.
+        _ (AdminOnly): Dependency enforcing admin-only access.
+        sensor_unit_id (UUID | None): Only return rules for this sensor unit.
+        shipment_id (UUID | None): Only return rules for this shipment.
+
+    Returns:
+        List[ThresholdRuleRead]: Matching rules.
+
+    Responses:
+        200 OK: Rules returned.
+        401 Unauthorized / 403 Forbidden: Caller is not an admin.
+    """
+    return threshold_service.get_rules(db, sensor_unit_id=sensor_unit_id, shipment_id=shipment_id)
+
+
+@router.delete("/rules/{rule_id}", response_model=ThresholdRuleRead, summary="Delete threshold rule (admin only)")
+def delete_rule(rule_id: UUID, db: DbSession, _: AdminOnly):
+    """
+    Delete a threshold rule and its recorded excursions.
+
+    Args:
+        rule_id (UUID): ID of the rule to delete.
+        db (DbSession): Database session dependency.
+        _ (AdminOnly): Dependency enforcing admin-only access.
+
+    Returns:
+        ThresholdRuleRead: The deleted rule.
+
+    Raises:
+        HTTPException 404: If the rule does not exist.
+
+    Responses:
+        200 OK: Rule deleted.
+        401 Unauthorized / 403 Forbidden: Caller is not an admin.
+        404 Not Found: Rule not found.
+    """
+    rule = threshold_service.delete_rule(db, rule_id)
+    if not rule:
+        raise HTTPException(status_code=404, detail="Threshold rule not found")
+    return rule
+
+
+@router.get("/excursions", response_model=List[ThresholdExcursionRead], summary="List threshold excursions")
+def list_excursions(
+    db: DbSession,
+    sensor_unit_id: UUID | None = None,
+    shipment_id: UUID | None = None,
+    rule_id: UUID | None = None,
+    open_only: bool = False,
+    limit: int = Query(100, ge=1, le=1_000),
+):
+    """
+    Retrieve recorded excursions, newest first.
+
+    Args:
+        db (DbSession): Database session dependency.
+        sensor_unit_id (UUID | None): Only return excursions of this sensor unit.
+        shipment_id (UUID | None): Only return excursions of this shipment's sensor unit.
+        rule_id (UUID | None): Only return excursions of this rule.
+        open_only (bool): Only return ongoing excursions.
+        limit (int): Maximum number of excursions to return.
+
+    Returns:
+        List[ThresholdExcursionRead]: Matching excursions.
+
+    Raises:
+        HTTPException 404: If the shipment does not exist or has no sensor unit.
+
+    Responses:
+        200 OK: Excursions returned.
+        404 Not Found: Shipment not found.
+    """
+    if shipment_id is not None:
+        shipment = get_shipment_by_id(db, shipment_id)
+        if not shipment or shipment.sensor_unit_id is None:
+            raise HTTPException(status_code=404, detail="Shipment not found or has no sensor unit")
+        sensor_unit_id = shipment.sensor_unit_id
+    return threshold_service.get_excursions(db, sensor_unit_id, rule_id, open_only=open_only, limit=limit)
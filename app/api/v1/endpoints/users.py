@@ -97,7 +97,7 @@ async def update_user(user_id: uuid.UUID, payload: UserUpdate, db: DbSession, _:
     update_dict = payload.model_dump(exclude_unset=True)
     if not update_dict:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No fields to update")
-    updated = user_service.update_user(db, user_id, update_dict)
+    updated = await user_service.update_user_async(db, user_id, update_dict)
     if not updated:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return updated
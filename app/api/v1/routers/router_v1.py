@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, users, shipment, control_unit
+from app.api.v1.endpoints import auth, users, shipment, control_unit, thresholds
 
 router = APIRouter()
 
@@ -30,3 +30,10 @@ router.include_router(shipment.router, prefix="/shipments", tags=["Shipments"])
 # Mounted under /control-unit
 # Handles creating, reading, updating, deleting, and receiving grouped sensor data
 router.include_router(control_unit.router, prefix="/control-unit", tags=["Control Unit"])
+
+# ----------------------------
+# Threshold endpoints
+# ----------------------------
+# Mounted under /thresholds
+# Admin-only rule management; excursions recorded at ingest time
+router.include_router(thresholds.router, prefix="/thresholds", tags=["Thresholds"])
@@ -42,7 +42,10 @@ class TokenData(BaseModel):
     Attributes:
         user_id (uuid.UUID): The unique ID of the user.
         role (Role): The role of the user (customer, driver, or admin).
+        version (int): Token version of the user when the token was issued ("ver" claim).
+            Tokens issued before the claim existed count as version 0.
     """
 
     user_id: uuid.UUID
     role: Role
+    version: int = 0
@@ -1,14 +1,40 @@
 from pydantic import BaseModel, field_validator
 from uuid import UUID
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal
 from datetime import datetime
 
 """
 Module: control_unit_schema.py
 Description: Defines Pydantic models (schemas) for Control Unit Data,
-including individual readings, grouped readings, creation, updates, and reading.
+including individual readings, grouped readings, creation, updates, reading,
+time-bucketed aggregates and range statistics.
 """
 
+# Reading fields and aggregate functions accepted by the aggregation endpoint
+ReadingField = Literal["temperature", "humidity"]
+AggregateFunction = Literal["avg", "min", "max", "sum", "count"]
+
+
+def _validate_reading(v: Any) -> Dict[str, Any]:
+    """
+    Checks that a reading is a non-empty dictionary with a numeric "value".
+
+    Args:
+        v (Any): The reading to validate.
+
+    Returns:
+        Dict[str, Any]: The validated reading.
+
+    Raises:
+        ValueError: If the reading is not a non-empty dictionary with a numeric "value" key.
+    """
+    if not isinstance(v, dict) or not v:
+        raise ValueError("Field cannot be empty")
+    value = v.get("value")
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError("Field must contain a numeric 'value'")
+    return v
+
 
 class ControlUnitDataBase(BaseModel):
     """
@@ -17,8 +43,8 @@ class ControlUnitDataBase(BaseModel):
     Attributes:
         sensor_unit_id (UUID): UUID of the sensor unit.
         control_unit_id (UUID): UUID of the control unit.
-        humidity (Dict[str, Any]): Humidity data, typically with "value" key.
-        temperature (Dict[str, Any]): Temperature data, typically with "value" key.
+        humidity (Dict[str, Any]): Humidity data with a numeric "value" key.
+        temperature (Dict[str, Any]): Temperature data with a numeric "value" key.
         timestamp (Optional[datetime]): Timestamp of the reading.
     """
 
@@ -31,7 +57,7 @@ class ControlUnitDataBase(BaseModel):
     @field_validator("humidity", "temperature")
     def must_not_be_empty(cls, v):
         """
-        Validates that the field is not empty.
+        Validates that the field is not empty and carries a numeric "value".
 
         Args:
             v (Dict[str, Any]): The value to validate.
@@ -40,11 +66,9 @@ class ControlUnitDataBase(BaseModel):
             Dict[str, Any]: The validated field.
 
         Raises:
-            ValueError: If the dictionary is empty or invalid.
+            ValueError: If the dictionary is empty or has no numeric "value" key.
         """
-        if not isinstance(v, dict) or not v:
-            raise ValueError("Field cannot be empty")
-        return v
+        return _validate_reading(v)
 
 
 class ControlUnitDataCreate(ControlUnitDataBase):
@@ -70,6 +94,42 @@ class ControlUnitDataUpdate(BaseModel):
     temperature: Optional[Dict[str, Any]] = None
     timestamp: Optional[datetime] = None
 
+    @field_validator("humidity", "temperature")
+    def reading_must_not_be_null(cls, v):
+        """
+        Validates an updated reading; an explicit null is rejected, omit the field to keep its value.
+
+        Args:
+            v (Optional[Dict[str, Any]]): The value to validate.
+
+        Returns:
+            Dict[str, Any]: The validated field.
+
+        Raises:
+            ValueError: If the field is null, empty or has no numeric "value" key.
+        """
+        if v is None:
+            raise ValueError("Field cannot be null")
+        return _validate_reading(v)
+
+    @field_validator("timestamp")
+    def timestamp_must_not_be_null(cls, v):
+        """
+        Rejects an explicit null timestamp, which the reading cannot be stored without.
+
+        Args:
+            v (Optional[datetime]): The value to validate.
+
+        Returns:
+            datetime: The validated timestamp.
+
+        Raises:
+            ValueError: If the timestamp is null.
+        """
+        if v is None:
+            raise ValueError("Field cannot be null")
+        return v
+
 
 class ControlUnitDataRead(ControlUnitDataBase):
     """
@@ -124,3 +184,71 @@ class DeviceData(BaseModel):
 
     control_unit_id: UUID
     timestamp_groups: List[TimestampGroup] = []
+
+
+class ControlUnitDataAggregate(BaseModel):
+    """
+    Time-bucketed aggregates in columnar form: entry i of every list describes the same bucket.
+
+    Attributes:
+        bucket_seconds (int): Width of each bucket in seconds.
+        sensor_unit_id (List[UUID]): Sensor unit of each bucket.
+        bucket_start (List[datetime]): Start of each bucket.
+        values (Dict[str, List[Optional[int | float]]]): Aggregate columns keyed as "<field>_<function>",
+            plus "count" when requested.
+    """
+
+    bucket_seconds: int
+    sensor_unit_id: List[UUID]
+    bucket_start: List[datetime]
+    values: Dict[str, List[Optional[int | float]]]
+
+
+class FieldStatistics(BaseModel):
+    """
+    Summary statistics of one reading field; values are None when there are no readings.
+
+    Attributes:
+        count (int): Number of readings.
+        mean (Optional[float]): Arithmetic mean.
+        std (Optional[float]): Population standard deviation.
+        min (Optional[float]): Lowest value.
+        max (Optional[float]): Highest value.
+        percentiles (Dict[str, Optional[float]]): Requested percentiles keyed as "p<percentile>", e.g. "p95".
+    """
+
+    count: int
+    mean: Optional[float] = None
+    std: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    percentiles: Dict[str, Optional[float]]
+
+
+class ReadingStatistics(BaseModel):
+    """
+    Statistics over a sensor's readings in a time range.
+
+    Attributes:
+        sensor_unit_id (UUID): Analysed sensor unit.
+        start (datetime): Inclusive start of the time range.
+        end (datetime): Exclusive end of the time range.
+        count (int): Number of readings in the range.
+        duration_seconds (float): Time between the first and last reading.
+        temperature (FieldStatistics): Temperature statistics.
+        humidity (FieldStatistics): Humidity statistics.
+        seconds_above (Optional[float]): Time the temperature was above temperature_above, if requested.
+        seconds_below (Optional[float]): Time the temperature was below temperature_below, if requested.
+        mean_kinetic_temperature (Optional[float]): Mean kinetic temperature in degrees Celsius.
+    """
+
+    sensor_unit_id: UUID
+    start: datetime
+    end: datetime
+    count: int
+    duration_seconds: float
+    temperature: FieldStatistics
+    humidity: FieldStatistics
+    seconds_above: Optional[float] = None
+    seconds_below: Optional[float] = None
+    mean_kinetic_temperature: Optional[float] = None
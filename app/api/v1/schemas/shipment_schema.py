@@ -1,12 +1,12 @@
 from pydantic import BaseModel, field_validator
 from uuid import UUID
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 """
 Module: shipment_schema.py
 Description: Defines Pydantic models (schemas) for Shipment-related operations,
-including validation, creation, and reading.
+including validation, creation, reading, and the shipment's sensor history.
 """
 
 
@@ -71,3 +71,28 @@ class ShipmentRead(ShipmentBase):
 
     class Config:
         orm_mode = True
+
+
+class ShipmentReadings(BaseModel):
+    """
+    Sensor history of a shipment in columnar form: entry i of every list describes the same reading.
+
+    Attributes:
+        shipment_id (UUID): ID of the shipment.
+        sensor_unit_id (UUID): Sensor unit linked to the shipment.
+        start (datetime): Inclusive start of the time window.
+        end (datetime): Exclusive end of the time window.
+        total_points (int): Number of readings in the window before downsampling.
+        timestamp (List[datetime]): Reading timestamps, ascending.
+        temperature (List[float]): Temperature readings.
+        humidity (List[float]): Humidity readings.
+    """
+
+    shipment_id: UUID
+    sensor_unit_id: UUID
+    start: datetime
+    end: datetime
+    total_points: int
+    timestamp: List[datetime]
+    temperature: List[float]
+    humidity: List[float]
@@ -0,0 +1,104 @@
+from pydantic import BaseModel, model_validator
+from uuid import UUID
+from typing import Optional
+from datetime import datetime
+from app.api.v1.schemas.control_unit_schema import ReadingField
+
+"""
+Module: threshold_schema.py
+Description: Defines Pydantic models (schemas) for cold-chain threshold rules
+and the excursions recorded when readings leave a rule's band.
+"""
+
+
+class ThresholdRuleBase(BaseModel):
+    """
+    Base schema for threshold rules.
+
+    Attributes:
+        sensor_unit_id (Optional[UUID]): Sensor unit the rule applies to.
+        shipment_id (Optional[UUID]): Shipment whose sensor unit the rule applies to.
+        temperature_min (Optional[float]): Lowest allowed temperature.
+        temperature_max (Optional[float]): Highest allowed temperature.
+        humidity_min (Optional[float]): Lowest allowed humidity.
+        humidity_max (Optional[float]): Highest allowed humidity.
+    """
+
+    sensor_unit_id: Optional[UUID] = None
+    shipment_id: Optional[UUID] = None
+    temperature_min: Optional[float] = None
+    temperature_max: Optional[float] = None
+    humidity_min: Optional[float] = None
+    humidity_max: Optional[float] = None
+
+
+class ThresholdRuleCreate(ThresholdRuleBase):
+    """
+    Schema used when creating a threshold rule.
+    """
+
+    @model_validator(mode="after")
+    def check_target_and_bounds(self):
+        """
+        Validates that the rule has exactly one target and at least one consistent bound.
+
+        Returns:
+            ThresholdRuleCreate: The validated rule.
+
+        Raises:
+            ValueError: If not exactly one of sensor_unit_id and shipment_id is set,
+                if no bound is set, or if a minimum is greater than its maximum.
+        """
+        if (self.sensor_unit_id is None) == (self.shipment_id is None):
+            raise ValueError("Exactly one of sensor_unit_id or shipment_id is required")
+        bounds = (self.temperature_min, self.temperature_max, self.humidity_min, self.humidity_max)
+        if all(bound is None for bound in bounds):
+            raise ValueError("At least one bound is required")
+        for low, high in ((self.temperature_min, self.temperature_max), (self.humidity_min, self.humidity_max)):
+            if low is not None and high is not None and low > high:
+                raise ValueError("Minimum must not be greater than maximum")
+        return self
+
+
+class ThresholdRuleRead(ThresholdRuleBase):
+    """
+    Schema used for reading threshold rules from the database.
+
+    Attributes:
+        id (UUID): Unique identifier of the rule.
+        created_at (datetime): Timestamp when the rule was created.
+    """
+
+    id: UUID
+    created_at: datetime
+
+    class Config:
+        orm_mode = True
+
+
+class ThresholdExcursionRead(BaseModel):
+    """
+    Schema used for reading threshold excursions from the database.
+
+    Attributes:
+        id (UUID): Unique identifier of the excursion.
+        rule_id (UUID): The violated rule.
+        sensor_unit_id (UUID): Sensor unit whose readings left the band.
+        field (ReadingField): "temperature" or "humidity".
+        started_at (datetime): Timestamp of the first out-of-band reading.
+        ended_at (Optional[datetime]): Timestamp of the first reading back in band; None while ongoing.
+        peak_value (float): Value furthest outside the band.
+        reading_count (int): Number of out-of-band readings.
+    """
+
+    id: UUID
+    rule_id: UUID
+    sensor_unit_id: UUID
+    field: ReadingField
+    started_at: datetime
+    ended_at: Optional[datetime] = None
+    peak_value: float
+    reading_count: int
+
+    class Config:
+        orm_mode = True
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
+from typing import Literal
 
 """
 Module: settings.py
@@ -19,6 +20,47 @@ class Settings(BaseSettings):
         ACCESS_TOKEN_EXPIRE_MINUTES (int): Expiration time in minutes for access tokens.
         ENV (str): Environment type (e.g., "development", "production"). Defaults to "development".
         FRONTEND_URL (str): URL of the frontend application. Defaults to "http://localhost:5173".
+        INGEST_QUEUE_ENABLED (bool): Accept grouped readings into the write-behind queue (202) instead of
+            committing them inside the request (201). Defaults to False.
+        INGEST_QUEUE_CAPACITY (int): Maximum number of queued readings before uploads are rejected with 429.
+        INGEST_BATCH_SIZE (int): Number of readings written per batch by the ingest paths.
+        INGEST_FLUSH_INTERVAL_SECONDS (float): Maximum time a queued reading waits before being flushed.
+        NDJSON_MAX_LINE_BYTES (int): Maximum size of one timestamp group line in NDJSON uploads.
+        REQUEST_MAX_DECOMPRESSED_BYTES (int): Maximum decompressed size of a gzip/zstd request body.
+        REQUEST_DECOMPRESSION_PATHS (list[str]): Path prefixes that accept compressed request bodies.
+        PARTITION_INTERVAL (str): Range partition size for control_unit_data, "daily" or "monthly".
+        PARTITION_PREMAKE (int): Number of future partitions kept created ahead of time.
+        PARTITION_RETENTION_DAYS (int | None): Partitions older than this are detached. None keeps all data.
+        PARTITION_DROP_EXPIRED (bool): Drop expired partitions instead of only detaching them.
+        PARTITION_MAINTENANCE_INTERVAL_SECONDS (float): Time between background partition maintenance runs.
+        AGGREGATE_MAX_BUCKETS (int): Maximum number of time buckets per sensor an aggregation request may span.
+        PAGE_DEFAULT_SIZE (int): Number of readings per page when a listing does not specify a limit.
+        PAGE_MAX_SIZE (int): Maximum number of readings a listing returns per page.
+        EXPORT_BATCH_SIZE (int): Number of rows fetched from the server-side cursor per export chunk.
+        EXPORT_COLUMNAR_BATCH_SIZE (int): Rows per Parquet row group / Arrow record batch in columnar exports.
+        SHIPMENT_READINGS_MAX_POINTS (int): Default number of points a shipment's readings are downsampled to.
+        LIVE_FEED_BUFFER_SIZE (int): Undelivered readings a live subscriber may fall behind before it is dropped.
+        LIVE_FEED_HEARTBEAT_SECONDS (float): Idle time after which a keep-alive comment is sent to live subscribers.
+        PASSWORD_HASH_WORKERS (int): Maximum number of bcrypt hashes/verifications running at once; further
+            calls wait in the hashing pool's queue.
+        USER_CACHE_TTL_SECONDS (float): Lifetime of a cached authenticated user principal.
+        USER_CACHE_MAX_SIZE (int): Maximum number of cached user principals; least recently used ones are evicted.
+        USER_CACHE_INVALIDATION (str): How user cache invalidations reach other worker processes: "postgres"
+            (LISTEN/NOTIFY), "local" (this process only; other workers rely on the TTL) or "auto" (postgres
+            when running on PostgreSQL).
+        AUTH_CLAIMS_ONLY (bool): Role-gated routes authorize from the verified token's role and version claims
+            instead of loading the user. Defaults to False.
+        JWT_DECODE_CACHE_SIZE (int): Maximum number of verified access tokens whose payload is cached; 0 disables it.
+        LOGIN_RATE_LIMIT_WINDOW_SECONDS (float): Length of the sliding window login attempts are counted in.
+        LOGIN_MAX_ATTEMPTS_PER_USERNAME (int): Login attempts allowed per username within the window.
+        LOGIN_MAX_ATTEMPTS_PER_IP (int): Failed login attempts allowed per client IP within the window.
+        LOGIN_CLIENT_IP_HEADER (str | None): Header in which the trusted reverse proxy passes the client address
+            (e.g. X-Forwarded-For); its last address, the one appended by the proxy, is the client IP. Unset uses
+            the connection's peer address, which is only right when clients connect directly.
+        LOGIN_RATE_LIMIT_STORE (str): Where login attempts are counted: "memory" (per process) or "database"
+            (login_attempts table, shared by all workers).
+        LOGIN_MAX_PENDING_VERIFICATIONS (int): Maximum number of password verifications running or queued at once;
+            further logins are rejected with 503.
     """
 
     DATABASE_URL: str
@@ -27,6 +69,38 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     ENV: str = "development"
     FRONTEND_URL: str = "http://localhost:5173"
+    INGEST_QUEUE_ENABLED: bool = False
+    INGEST_QUEUE_CAPACITY: int = 100_000
+    INGEST_BATCH_SIZE: int = 5_000
+    INGEST_FLUSH_INTERVAL_SECONDS: float = 1.0
+    NDJSON_MAX_LINE_BYTES: int = 1_048_576
+    REQUEST_MAX_DECOMPRESSED_BYTES: int = 50 * 1_048_576
+    REQUEST_DECOMPRESSION_PATHS: list[str] = ["/api/v1/control-unit"]
+    PARTITION_INTERVAL: Literal["daily", "monthly"] = "monthly"
+    PARTITION_PREMAKE: int = 3
+    PARTITION_RETENTION_DAYS: int | None = None
+    PARTITION_DROP_EXPIRED: bool = False
+    PARTITION_MAINTENANCE_INTERVAL_SECONDS: float = 6 * 3600
+    AGGREGATE_MAX_BUCKETS: int = 10_000
+    PAGE_DEFAULT_SIZE: int = 100
+    PAGE_MAX_SIZE: int = 1_000
+    EXPORT_BATCH_SIZE: int = 5_000
+    EXPORT_COLUMNAR_BATCH_SIZE: int = 65_536
+    SHIPMENT_READINGS_MAX_POINTS: int = 1_000
+    LIVE_FEED_BUFFER_SIZE: int = 1_000
+    LIVE_FEED_HEARTBEAT_SECONDS: float = 15.0
+    PASSWORD_HASH_WORKERS: int = 4
+    USER_CACHE_TTL_SECONDS: float = 60.0
+    USER_CACHE_MAX_SIZE: int = 10_000
+    USER_CACHE_INVALIDATION: Literal["auto", "local", "postgres"] = "auto"
+    AUTH_CLAIMS_ONLY: bool = False
+    JWT_DECODE_CACHE_SIZE: int = 10_000
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: float = 300.0
+    LOGIN_MAX_ATTEMPTS_PER_USERNAME: int = 10
+    LOGIN_MAX_ATTEMPTS_PER_IP: int = 100
+    LOGIN_CLIENT_IP_HEADER: str | None = None
+    LOGIN_RATE_LIMIT_STORE: Literal["memory", "database"] = "memory"
+    LOGIN_MAX_PENDING_VERIFICATIONS: int = 32
 
     # Pydantic configuration for loading .env file
     model_config = SettingsConfigDict(env_file=Path(__file__).parent.parent.parent / ".env", extra="ignore")
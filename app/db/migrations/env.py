@@ -5,6 +5,9 @@ from app.db.connection import Base
 from app.models.user_model import User
 from app.models.shipment_model import Shipment
 from app.models.control_unit_model import ControlUnitData
+from app.models.sensor_rollup_model import SensorRollup1m, SensorRollup1h
+from app.models.threshold_model import ThresholdRule, ThresholdExcursion
+from app.models.login_attempt_model import LoginAttempt
 
 import os
 from dotenv import load_dotenv
@@ -0,0 +1,62 @@
+"""Threshold rules and excursions
+
+Revision ID: 3d7c1e9a5b20
+Revises: 8f3b6a1d4c27
+Create Date: 2026-10-17 14:42:37.118304
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3d7c1e9a5b20"
+down_revision: Union[str, Sequence[str], None] = "8f3b6a1d4c27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "threshold_rules",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("sensor_unit_id", sa.UUID(), nullable=True),
+        sa.Column("shipment_id", sa.UUID(), nullable=True),
+        sa.Column("temperature_min", sa.Float(), nullable=True),
+        sa.Column("temperature_max", sa.Float(), nullable=True),
+        sa.Column("humidity_min", sa.Float(), nullable=True),
+        sa.Column("humidity_max", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["shipment_id"], ["shipments.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_threshold_rules_sensor_unit_id"), "threshold_rules", ["sensor_unit_id"], unique=False)
+    op.create_index(op.f("ix_threshold_rules_shipment_id"), "threshold_rules", ["shipment_id"], unique=False)
+    op.create_table(
+        "threshold_excursions",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("rule_id", sa.UUID(), nullable=False),
+        sa.Column("sensor_unit_id", sa.UUID(), nullable=False),
+        sa.Column("field", sa.String(length=20), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("ended_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("peak_value", sa.Float(), nullable=False),
+        sa.Column("reading_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["rule_id"], ["threshold_rules.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_threshold_excursions_rule_id"), "threshold_excursions", ["rule_id"], unique=False)
+    op.create_index("ix_threshold_excursions_sensor_unit_id_started_at", "threshold_excursions", ["sensor_unit_id", "started_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_threshold_excursions_sensor_unit_id_started_at", table_name="threshold_excursions")
+    op.drop_index(op.f("ix_threshold_excursions_rule_id"), table_name="threshold_excursions")
+    op.drop_table("threshold_excursions")
+    op.drop_index(op.f("ix_threshold_rules_shipment_id"), table_name="threshold_rules")
+    op.drop_index(op.f("ix_threshold_rules_sensor_unit_id"), table_name="threshold_rules")
+    op.drop_table("threshold_rules")
@@ -0,0 +1,49 @@
+"""Sensor rollup tables
+
+Revision ID: 5a2d8e3c9b71
+Revises: c4e91a7d2f10
+Create Date: 2026-10-17 11:58:21.904517
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5a2d8e3c9b71"
+down_revision: Union[str, Sequence[str], None] = "c4e91a7d2f10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLLUP_TABLES = ("sensor_rollup_1m", "sensor_rollup_1h")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ROLLUP_TABLES:
+        op.create_table(
+            table,
+            sa.Column("sensor_unit_id", sa.UUID(), nullable=False),
+            sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("control_unit_id", sa.UUID(), nullable=False),
+            sa.Column("reading_count", sa.Integer(), nullable=False),
+            sa.Column("temperature_min", sa.Float(), nullable=False),
+            sa.Column("temperature_max", sa.Float(), nullable=False),
+            sa.Column("temperature_sum", sa.Float(), nullable=False),
+            sa.Column("temperature_last", sa.Float(), nullable=False),
+            sa.Column("humidity_min", sa.Float(), nullable=False),
+            sa.Column("humidity_max", sa.Float(), nullable=False),
+            sa.Column("humidity_sum", sa.Float(), nullable=False),
+            sa.Column("humidity_last", sa.Float(), nullable=False),
+            sa.Column("last_timestamp", sa.DateTime(timezone=True), nullable=False),
+            sa.PrimaryKeyConstraint("sensor_unit_id", "bucket_start"),
+        )
+    # Existing readings are not rolled up here; run `python -m app.services.rollup_service` afterwards
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(ROLLUP_TABLES):
+        op.drop_table(table)
@@ -0,0 +1,28 @@
+"""User token version
+
+Revision ID: 5a9e2c7f1b84
+Revises: 3d7c1e9a5b20
+Create Date: 2026-10-17 16:08:51.402617
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5a9e2c7f1b84"
+down_revision: Union[str, Sequence[str], None] = "3d7c1e9a5b20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("users", sa.Column("token_version", sa.Integer(), server_default="0", nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "token_version")
@@ -0,0 +1,64 @@
+"""Control unit data lookup indexes
+
+Revision ID: 8f3b6a1d4c27
+Revises: 5a2d8e3c9b71
+Create Date: 2026-10-17 13:21:08.552160
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8f3b6a1d4c27"
+down_revision: Union[str, Sequence[str], None] = "5a2d8e3c9b71"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# name -> (index method, columns); must match ControlUnitData.__table_args__
+INDEXES = {
+    "ix_control_unit_data_sensor_unit_id_timestamp": ("btree", "sensor_unit_id, timestamp"),
+    "ix_control_unit_data_control_unit_id_timestamp": ("btree", "control_unit_id, timestamp"),
+    "ix_control_unit_data_timestamp_brin": ("brin", "timestamp"),
+}
+
+
+def _partitions(bind) -> list[str]:
+    return (
+        bind.execute(
+            sa.text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'control_unit_data'::regclass ORDER BY c.relname"
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    partitions = _partitions(bind)
+    # CREATE INDEX CONCURRENTLY cannot run on a partitioned table or inside a transaction:
+    # create each index ON ONLY the parent (invalid until complete), build it concurrently
+    # on every partition, then attach; partitions created later inherit the indexes
+    with op.get_context().autocommit_block():
+        for name, (method, columns) in INDEXES.items():
+            if not partitions:
+                op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON control_unit_data USING {method} ({columns})")
+                continue
+            op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY control_unit_data USING {method} ({columns})")
+            for partition in partitions:
+                partition_index = f"{partition}_{name.removeprefix('ix_control_unit_data_')}"
+                op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition_index} ON {partition} USING {method} ({columns})")
+                op.execute(f"ALTER INDEX {name} ATTACH PARTITION {partition_index}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Dropping the parent index also drops the attached partition indexes
+    for name in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,82 @@
+"""Typed float columns for temperature and humidity
+
+Revision ID: bd786e6990e0
+Revises: 287246b0adf9
+Create Date: 2026-10-17 09:12:41.318205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "bd786e6990e0"
+down_revision: Union[str, Sequence[str], None] = "287246b0adf9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows converted per backfill statement; each chunk commits on its own
+BACKFILL_CHUNK_SIZE = 10000
+
+NIL_UUID = "00000000-0000-0000-0000-000000000000"
+
+
+def _backfill(statement: str) -> None:
+    """Run a keyset-chunked UPDATE over control_unit_data, committing after every chunk."""
+    bind = op.get_bind()
+    last_id = NIL_UUID
+    with op.get_context().autocommit_block():
+        while True:
+            ids = bind.execute(sa.text(statement), {"last_id": last_id, "chunk": BACKFILL_CHUNK_SIZE}).scalars().all()
+            if not ids:
+                break
+            last_id = max(ids)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("control_unit_data", sa.Column("humidity_value", sa.Float(), nullable=True))
+    op.add_column("control_unit_data", sa.Column("temperature_value", sa.Float(), nullable=True))
+    _backfill(
+        """
+        WITH chunk AS (
+            SELECT id FROM control_unit_data WHERE id > CAST(:last_id AS uuid) ORDER BY id LIMIT :chunk
+        )
+        UPDATE control_unit_data AS d
+        SET humidity_value = (d.humidity ->> 'value')::double precision,
+            temperature_value = (d.temperature ->> 'value')::double precision
+        FROM chunk
+        WHERE d.id = chunk.id
+        RETURNING d.id
+        """
+    )
+    op.alter_column("control_unit_data", "humidity_value", nullable=False)
+    op.alter_column("control_unit_data", "temperature_value", nullable=False)
+    op.drop_column("control_unit_data", "humidity")
+    op.drop_column("control_unit_data", "temperature")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column("control_unit_data", sa.Column("humidity", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column("control_unit_data", sa.Column("temperature", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    _backfill(
+        """
+        WITH chunk AS (
+            SELECT id FROM control_unit_data WHERE id > CAST(:last_id AS uuid) ORDER BY id LIMIT :chunk
+        )
+        UPDATE control_unit_data AS d
+        SET humidity = jsonb_build_object('value', d.humidity_value),
+            temperature = jsonb_build_object('value', d.temperature_value)
+        FROM chunk
+        WHERE d.id = chunk.id
+        RETURNING d.id
+        """
+    )
+    op.alter_column("control_unit_data", "humidity", nullable=False)
+    op.alter_column("control_unit_data", "temperature", nullable=False)
+    op.drop_column("control_unit_data", "humidity_value")
+    op.drop_column("control_unit_data", "temperature_value")
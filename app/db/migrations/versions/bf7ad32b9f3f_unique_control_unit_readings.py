@@ -0,0 +1,45 @@
+"""Unique control unit readings
+
+Revision ID: bf7ad32b9f3f
+Revises: bd786e6990e0
+Create Date: 2026-10-17 10:04:55.671903
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "bf7ad32b9f3f"
+down_revision: Union[str, Sequence[str], None] = "bd786e6990e0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep one row (the lowest id) per reading before enforcing uniqueness
+    op.execute(
+        sa.text(
+            """
+            DELETE FROM control_unit_data AS d
+            USING control_unit_data AS keep
+            WHERE d.control_unit_id = keep.control_unit_id
+              AND d.sensor_unit_id = keep.sensor_unit_id
+              AND d.timestamp = keep.timestamp
+              AND d.id > keep.id
+            """
+        )
+    )
+    op.create_unique_constraint(
+        "uq_control_unit_data_reading",
+        "control_unit_data",
+        ["control_unit_id", "sensor_unit_id", "timestamp"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("uq_control_unit_data_reading", "control_unit_data", type_="unique")
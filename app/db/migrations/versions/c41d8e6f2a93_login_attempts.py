@@ -0,0 +1,36 @@
+"""Login attempts
+
+Revision ID: c41d8e6f2a93
+Revises: 5a9e2c7f1b84
+Create Date: 2026-10-17 17:31:12.845093
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c41d8e6f2a93"
+down_revision: Union[str, Sequence[str], None] = "5a9e2c7f1b84"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "login_attempts",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("key", sa.String(length=320), nullable=False),
+        sa.Column("attempted_at", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_login_attempts_key_attempted_at", "login_attempts", ["key", "attempted_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_login_attempts_key_attempted_at", table_name="login_attempts")
+    op.drop_table("login_attempts")
@@ -0,0 +1,71 @@
+"""Partition control_unit_data by timestamp
+
+Revision ID: c4e91a7d2f10
+Revises: bf7ad32b9f3f
+Create Date: 2026-10-17 11:12:40.318274
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e91a7d2f10"
+down_revision: Union[str, Sequence[str], None] = "bf7ad32b9f3f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = "id, sensor_unit_id, control_unit_id, timestamp, humidity_value, temperature_value"
+
+
+def _reading_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("sensor_unit_id", sa.UUID(), nullable=False),
+        sa.Column("control_unit_id", sa.UUID(), nullable=False),
+        sa.Column("timestamp", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("humidity_value", sa.Float(), nullable=False),
+        sa.Column("temperature_value", sa.Float(), nullable=False),
+    ]
+
+
+def _rename_old_table(new_name: str) -> None:
+    op.rename_table("control_unit_data", new_name)
+    op.execute(f"ALTER INDEX control_unit_data_pkey RENAME TO {new_name}_pkey")
+    op.execute(f"ALTER TABLE {new_name} RENAME CONSTRAINT uq_control_unit_data_reading TO uq_{new_name}_reading")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rename_old_table("control_unit_data_unpartitioned")
+
+    # The partition key must be part of every unique constraint, so the primary key becomes (id, timestamp)
+    op.create_table(
+        "control_unit_data",
+        *_reading_columns(),
+        sa.PrimaryKeyConstraint("id", "timestamp", name="control_unit_data_pkey"),
+        sa.UniqueConstraint("control_unit_id", "sensor_unit_id", "timestamp", name="uq_control_unit_data_reading"),
+        postgresql_partition_by="RANGE (timestamp)",
+    )
+    # Existing rows land in the default partition; partition maintenance
+    # (app.services.partition_service) moves them into per-period partitions
+    op.execute("CREATE TABLE control_unit_data_default PARTITION OF control_unit_data DEFAULT")
+    op.execute(f"INSERT INTO control_unit_data ({COLUMNS}) SELECT {COLUMNS} FROM control_unit_data_unpartitioned")
+    op.drop_table("control_unit_data_unpartitioned")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rename_old_table("control_unit_data_partitioned")
+
+    op.create_table(
+        "control_unit_data",
+        *_reading_columns(),
+        sa.PrimaryKeyConstraint("id", name="control_unit_data_pkey"),
+        sa.UniqueConstraint("control_unit_id", "sensor_unit_id", "timestamp", name="uq_control_unit_data_reading"),
+    )
+    op.execute(f"INSERT INTO control_unit_data ({COLUMNS}) SELECT {COLUMNS} FROM control_unit_data_partitioned")
+    # Dropping the parent drops its attached partitions; detached (expired) partitions are left untouched
+    op.drop_table("control_unit_data_partitioned")
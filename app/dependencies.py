@@ -4,14 +4,18 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.db.connection import SessionLocal
 from app.utils.JWT import decode_access_token
-from app.models.user_model import User
 from app.api.v1.schemas.auth_schema import TokenData
+from app.api.v1.schemas.user_schema import UserRead
+from app.config.settings import settings
+from app.services.token_versions import token_versions
+from app.services.user_cache import user_cache
 from app.services.user_service import get_user_by_id
 
 """
 Module: auth_dependencies.py
 Description: Provides authentication and authorization dependencies for FastAPI routes,
 including JWT validation, current user retrieval, and role-based access control.
+The authenticated user is served from the user principal cache when possible.
 """
 
 # Bearer scheme for JWT authentication
@@ -40,68 +44,141 @@ def get_db():
 DbSession = Annotated[Session, Depends(get_db)]
 
 
-async def get_current_user(
-    token: Annotated[HTTPAuthorizationCredentials, Depends(bearer_scheme)],
-    db: DbSession,
-) -> User:
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def decode_token_data(token: HTTPAuthorizationCredentials) -> TokenData:
     """
-    Validates a Bearer JWT token, decodes it, and fetches the corresponding User object.
+    Verifies a Bearer JWT and extracts its claims.
 
     Args:
         token (HTTPAuthorizationCredentials): The JWT provided in the Authorization header.
-        db (Session): SQLAlchemy database session.
 
     Returns:
-        User: Authenticated User object.
+        TokenData: User ID, role and token version from the token.
 
     Raises:
-        HTTPException: Raises 401 Unauthorized if the token is invalid, expired, or the user does not exist.
+        HTTPException: Raises 401 Unauthorized if the token is invalid, expired, or lacks the user ID or role.
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
     try:
         payload = decode_access_token(token.credentials)
         if payload is None:
-            raise credentials_exception
+            raise _credentials_exception()
 
         user_id: str = payload.get("sub")
         user_role: str = payload.get("role")
         if user_id is None or user_role is None:
-            raise credentials_exception
+            raise _credentials_exception()
 
-        token_data = TokenData(user_id=user_id, role=user_role)
+        return TokenData(user_id=user_id, role=user_role, version=payload.get("ver", 0))
     except Exception:
-        raise credentials_exception
+        raise _credentials_exception()
+
+
+async def get_current_user(
+    token: Annotated[HTTPAuthorizationCredentials, Depends(bearer_scheme)],
+    db: DbSession,
+) -> UserRead:
+    """
+    Validates a Bearer JWT token, decodes it, and returns the corresponding user.
+
+    The user is looked up in the user principal cache first and only loaded from the
+    database on a miss; updating or deleting a user invalidates its entry.
+
+    Args:
+        token (HTTPAuthorizationCredentials): The JWT provided in the Authorization header.
+        db (Session): SQLAlchemy database session.
+
+    Returns:
+        UserRead: The authenticated user.
 
-    user = get_user_by_id(db, user_id=token_data.user_id)
-    if user is None:
-        raise credentials_exception
+    Raises:
+        HTTPException: Raises 401 Unauthorized if the token is invalid, expired, or the user does not exist.
+    """
+    token_data = decode_token_data(token)
+
+    user = user_cache.get(token_data.user_id)
+    if user is not None:
+        return user
+
+    generation = user_cache.generation
+    db_user = get_user_by_id(db, user_id=token_data.user_id)
+    if db_user is None:
+        raise _credentials_exception()
+    user = UserRead.model_validate(db_user)
+    user_cache.put(user, generation)
     return user
 
 
-def require_roles(roles: list[str]):
+async def get_token_claims(
+    token: Annotated[HTTPAuthorizationCredentials, Depends(bearer_scheme)],
+    db: DbSession,
+) -> TokenData:
+    """
+    Validates a Bearer JWT token and returns its claims without loading the user.
+
+    The token is only accepted while its "ver" claim equals the user's current token version,
+    so tokens of deleted users and tokens issued before a role or password change are rejected.
+    The version comes from the token version registry and costs no query once known.
+
+    Args:
+        token (HTTPAuthorizationCredentials): The JWT provided in the Authorization header.
+        db (Session): SQLAlchemy database session, only used when the user's version is not yet known.
+
+    Returns:
+        TokenData: The verified claims.
+
+    Raises:
+        HTTPException: Raises 401 Unauthorized if the token is invalid, expired, or revoked.
+    """
+    token_data = decode_token_data(token)
+    if not token_versions.is_current(db, token_data.user_id, token_data.version):
+        raise _credentials_exception()
+    return token_data
+
+
+def require_roles(roles: list[str], claims_only: bool | None = None):
     """
     Creates a dependency function to enforce role-based access control on routes.
 
+    By default the role of the current user is checked. In claims-only mode the role claim of
+    the verified token is checked instead (see get_token_claims), which skips loading the user.
+
     Args:
         roles (list[str]): List of roles allowed to access the route.
+        claims_only (bool | None): Authorize from the token claims alone. Defaults to the AUTH_CLAIMS_ONLY setting.
 
     Returns:
-        Callable: A dependency function to use with FastAPI routes that validates the current user's role.
+        Callable: A dependency function to use with FastAPI routes that validates the caller's role.
 
     Raises:
-        HTTPException: Raises 403 Forbidden if the current user's role is not in the allowed roles.
+        HTTPException: Raises 403 Forbidden if the caller's role is not in the allowed roles.
     """
+    if claims_only is None:
+        claims_only = settings.AUTH_CLAIMS_ONLY
 
-    def role_checker(current_user: Annotated[User, Depends(get_current_user)]):
-        if current_user.role not in roles:
+    def check_role(role: str) -> None:
+        if role not in roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to perform this action",
             )
+
+    if claims_only:
+
+        def claims_checker(claims: Annotated[TokenData, Depends(get_token_claims)]):
+            check_role(claims.role)
+            return claims
+
+        return claims_checker
+
+    def role_checker(current_user: Annotated[UserRead, Depends(get_current_user)]):
+        check_role(current_user.role)
         return current_user
 
     return role_checker
@@ -1,12 +1,23 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.routers.router_v1 import router as v1_router
 from app.config.settings import settings
+from app.db.connection import engine
+from app.services.ingest_queue import ingest_queue
+from app.services.latest_reading_cache import warm_latest_readings
+from app.services.partition_service import partition_maintenance_loop
+from app.services.user_cache import create_invalidation_channel, user_cache
+from app.utils.metrics import metrics
+from app.utils.request_decompression import RequestDecompressionMiddleware
 
 """
 Module: main.py
-Description: Initializes the FastAPI application, configures CORS middleware,
-includes API routers, and defines basic health check endpoint.
+Description: Initializes the FastAPI application, configures CORS and request decompression middleware,
+includes API routers, manages background workers over the application lifespan,
+and defines basic health check and metrics endpoints.
 """
 
 # CORS configuration depending on environment
@@ -18,11 +29,47 @@ if settings.ENV == "development":
 else:
     allow_origins = [settings.FRONTEND_URL]
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Starts background workers on startup and drains them on shutdown.
+
+    Args:
+        app (FastAPI): The application instance.
+    """
+    # Load the latest reading per sensor before serving lookups
+    await run_in_threadpool(warm_latest_readings)
+    if settings.INGEST_QUEUE_ENABLED:
+        ingest_queue.start()
+    # Receive user cache invalidations from the other worker processes
+    user_cache.attach(create_invalidation_channel(engine, settings.USER_CACHE_INVALIDATION))
+    # Keeps upcoming control_unit_data partitions created and expires old ones (no-op outside PostgreSQL)
+    partition_task = asyncio.create_task(partition_maintenance_loop(engine, settings.PARTITION_MAINTENANCE_INTERVAL_SECONDS))
+    try:
+        yield
+    finally:
+        partition_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await partition_task
+        # Flush readings still waiting in the write-behind queue
+        ingest_queue.stop()
+        user_cache.detach()
+
+
 # Create FastAPI app
 app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
+)
+
+# Decompress gzip/zstd request bodies on the device ingestion routes
+app.add_middleware(
+    RequestDecompressionMiddleware,
+    max_size=settings.REQUEST_MAX_DECOMPRESSED_BYTES,
+    path_prefixes=settings.REQUEST_DECOMPRESSION_PATHS,
 )
 
 # Add CORS middleware
@@ -32,6 +79,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include API routers
@@ -47,3 +95,14 @@ def health_check():
         dict: Status message indicating API is operational.
     """
     return {"status": "ok", "message": "API is running"}
+
+
+@app.get("/metrics")
+def read_metrics():
+    """
+    Returns process-local metrics such as ingest queue depth, batch sizes and flush latency.
+
+    Returns:
+        dict: Counters, gauges and summaries keyed by metric name.
+    """
+    return metrics.snapshot()
@@ -1,21 +1,33 @@
-from sqlalchemy import Column, DateTime, JSON
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, DateTime, Float, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
-from app.db.connection import Base, settings
+from app.db.connection import Base
 import uuid
 
 """
 Module: control_unit_model.py
 Description: Defines the ControlUnitData SQLAlchemy model for storing sensor readings
-from control units, including humidity and temperature data in JSON format.
-The JSON type is dynamic depending on the database backend.
+from control units. Humidity and temperature are stored as native float columns;
+the `humidity` and `temperature` attributes expose them in the `{"value": x}` shape
+used by the API schemas. A reading is unique per (control_unit_id, sensor_unit_id, timestamp),
+so retried uploads do not create duplicates. On PostgreSQL the table is range-partitioned
+by timestamp (see partition_service), and its primary key there is (id, timestamp).
 """
 
-# Dynamic JSON type depending on database
-if settings.DATABASE_URL.startswith("sqlite"):
-    JSONType = JSON  # SQLite uses TEXT
-else:
-    JSONType = JSONB  # PostgreSQL uses JSONB
+
+def _reading_value(value) -> float:
+    """
+    Extracts the numeric reading from either a `{"value": x}` dict or a plain number.
+
+    Args:
+        value (dict | float): The reading to convert.
+
+    Returns:
+        float: The numeric reading.
+    """
+    if isinstance(value, dict):
+        value = value["value"]
+    return float(value)
 
 
 class ControlUnitData(Base):
@@ -27,15 +39,41 @@ class ControlUnitData(Base):
         sensor_unit_id (UUID): Identifier of the sensor unit that generated the reading.
         control_unit_id (UUID): Identifier of the control unit the sensor belongs to.
         timestamp (datetime): Timestamp when the reading was recorded. Defaults to current time.
-        humidity (dict): Humidity reading stored as JSON.
-        temperature (dict): Temperature reading stored as JSON.
+        humidity_value (float): Humidity reading.
+        temperature_value (float): Temperature reading.
+        humidity (dict): Humidity reading as `{"value": x}`, backed by humidity_value.
+        temperature (dict): Temperature reading as `{"value": x}`, backed by temperature_value.
     """
 
     __tablename__ = "control_unit_data"
+    __table_args__ = (
+        UniqueConstraint("control_unit_id", "sensor_unit_id", "timestamp", name="uq_control_unit_data_reading"),
+        # Per-sensor / per-control-unit time range lookups
+        Index("ix_control_unit_data_sensor_unit_id_timestamp", "sensor_unit_id", "timestamp"),
+        Index("ix_control_unit_data_control_unit_id_timestamp", "control_unit_id", "timestamp"),
+        # Compact block-range index for time range scans across all sensors (a plain index outside PostgreSQL)
+        Index("ix_control_unit_data_timestamp_brin", "timestamp", postgresql_using="brin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     sensor_unit_id = Column(UUID(as_uuid=True), nullable=False)
     control_unit_id = Column(UUID(as_uuid=True), nullable=False)
     timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    humidity = Column(JSONType, nullable=False)
-    temperature = Column(JSONType, nullable=False)
+    humidity_value = Column(Float, nullable=False)
+    temperature_value = Column(Float, nullable=False)
+
+    @property
+    def humidity(self) -> dict:
+        return {"value": self.humidity_value}
+
+    @humidity.setter
+    def humidity(self, value) -> None:
+        self.humidity_value = _reading_value(value)
+
+    @property
+    def temperature(self) -> dict:
+        return {"value": self.temperature_value}
+
+    @temperature.setter
+    def temperature(self, value) -> None:
+        self.temperature_value = _reading_value(value)
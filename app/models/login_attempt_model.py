@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Float, Index, String
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.connection import Base
+import uuid
+
+"""
+Module: login_attempt_model.py
+Description: Defines the LoginAttempt model, the shared sliding-window log used by the
+login limiter when LOGIN_RATE_LIMIT_STORE is "database", so every worker process counts
+the same attempts.
+"""
+
+
+class LoginAttempt(Base):
+    """
+    One login attempt counted against a limiter key.
+
+    Attributes:
+        id (UUID): Unique identifier for the attempt, primary key.
+        key (str): Limiter key, "username:<username>" or "ip:<address>".
+        attempted_at (float): Time of the attempt as UNIX seconds.
+    """
+
+    __tablename__ = "login_attempts"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    key = Column(String(320), nullable=False)
+    attempted_at = Column(Float, nullable=False)
+
+    __table_args__ = (Index("ix_login_attempts_key_attempted_at", "key", "attempted_at"),)
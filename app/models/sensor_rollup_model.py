@@ -0,0 +1,61 @@
+from sqlalchemy import Column, DateTime, Float, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.connection import Base
+
+"""
+Module: sensor_rollup_model.py
+Description: Defines the per-sensor rollup tables that summarise control unit readings
+into 1-minute and 1-hour buckets. Rows are maintained incrementally by the ingest path
+(see rollup_service) so history views do not have to scan raw readings.
+"""
+
+
+class SensorRollupMixin:
+    """
+    Columns shared by all rollup granularities.
+
+    Attributes:
+        sensor_unit_id (UUID): Sensor unit the bucket belongs to, part of the primary key.
+        bucket_start (datetime): Start of the bucket, part of the primary key.
+        control_unit_id (UUID): Control unit of the most recent reading in the bucket.
+        reading_count (int): Number of readings in the bucket.
+        temperature_min (float): Lowest temperature in the bucket.
+        temperature_max (float): Highest temperature in the bucket.
+        temperature_sum (float): Sum of temperatures; divide by reading_count for the mean.
+        temperature_last (float): Temperature of the most recent reading.
+        humidity_min (float): Lowest humidity in the bucket.
+        humidity_max (float): Highest humidity in the bucket.
+        humidity_sum (float): Sum of humidity values; divide by reading_count for the mean.
+        humidity_last (float): Humidity of the most recent reading.
+        last_timestamp (datetime): Timestamp of the most recent reading in the bucket.
+    """
+
+    sensor_unit_id = Column(UUID(as_uuid=True), primary_key=True)
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+    control_unit_id = Column(UUID(as_uuid=True), nullable=False)
+    reading_count = Column(Integer, nullable=False)
+    temperature_min = Column(Float, nullable=False)
+    temperature_max = Column(Float, nullable=False)
+    temperature_sum = Column(Float, nullable=False)
+    temperature_last = Column(Float, nullable=False)
+    humidity_min = Column(Float, nullable=False)
+    humidity_max = Column(Float, nullable=False)
+    humidity_sum = Column(Float, nullable=False)
+    humidity_last = Column(Float, nullable=False)
+    last_timestamp = Column(DateTime(timezone=True), nullable=False)
+
+
+class SensorRollup1m(SensorRollupMixin, Base):
+    """
+    1-minute rollup of sensor readings.
+    """
+
+    __tablename__ = "sensor_rollup_1m"
+
+
+class SensorRollup1h(SensorRollupMixin, Base):
+    """
+    1-hour rollup of sensor readings.
+    """
+
+    __tablename__ = "sensor_rollup_1h"
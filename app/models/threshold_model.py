@@ -0,0 +1,68 @@
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime, timezone
+from app.db.connection import Base
+import uuid
+
+"""
+Module: threshold_model.py
+Description: Defines the cold-chain threshold tables: allowed temperature/humidity
+bands for a sensor unit or a shipment, and the excursions recorded when readings
+leave a band. Excursions are written by the ingest path (see threshold_service)
+as one row per out-of-band period instead of one row per reading.
+"""
+
+
+class ThresholdRule(Base):
+    """
+    Allowed temperature and humidity band for a sensor unit or for the sensor unit of a shipment.
+
+    Attributes:
+        id (UUID): Unique identifier for the rule, primary key.
+        sensor_unit_id (UUID | None): Sensor unit the rule applies to. Set when shipment_id is not.
+        shipment_id (UUID | None): Shipment whose sensor unit the rule applies to. Set when sensor_unit_id is not.
+        temperature_min (float | None): Lowest allowed temperature, if bounded.
+        temperature_max (float | None): Highest allowed temperature, if bounded.
+        humidity_min (float | None): Lowest allowed humidity, if bounded.
+        humidity_max (float | None): Highest allowed humidity, if bounded.
+        created_at (datetime): Timestamp of when the rule was created.
+    """
+
+    __tablename__ = "threshold_rules"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    sensor_unit_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+    shipment_id = Column(UUID(as_uuid=True), ForeignKey("shipments.id", ondelete="CASCADE"), nullable=True, index=True)
+    temperature_min = Column(Float, nullable=True)
+    temperature_max = Column(Float, nullable=True)
+    humidity_min = Column(Float, nullable=True)
+    humidity_max = Column(Float, nullable=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+
+class ThresholdExcursion(Base):
+    """
+    A period during which a sensor's readings were outside a rule's band for one field.
+
+    Attributes:
+        id (UUID): Unique identifier for the excursion, primary key.
+        rule_id (UUID): Foreign key referencing the violated rule.
+        sensor_unit_id (UUID): Sensor unit whose readings left the band.
+        field (str): "temperature" or "humidity".
+        started_at (datetime): Timestamp of the first out-of-band reading.
+        ended_at (datetime | None): Timestamp of the first reading back in band; None while ongoing.
+        peak_value (float): Value furthest outside the band during the excursion.
+        reading_count (int): Number of out-of-band readings in the excursion.
+    """
+
+    __tablename__ = "threshold_excursions"
+    __table_args__ = (Index("ix_threshold_excursions_sensor_unit_id_started_at", "sensor_unit_id", "started_at"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    rule_id = Column(UUID(as_uuid=True), ForeignKey("threshold_rules.id", ondelete="CASCADE"), nullable=False, index=True)
+    sensor_unit_id = Column(UUID(as_uuid=True), nullable=False)
+    field = Column(String(20), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    ended_at = Column(DateTime(timezone=True), nullable=True)
+    peak_value = Column(Float, nullable=False)
+    reading_count = Column(Integer, nullable=False, default=1)
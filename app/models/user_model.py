@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime, timezone
 from app.db.connection import Base
@@ -21,6 +21,8 @@ class User(Base):
         hashed_password (str): Securely hashed password of the user.
         role (str): Role of the user ('customer', 'driver', 'admin').
         created_at (datetime): Timestamp of when the user was created.
+        token_version (int): Carried in access tokens as the "ver" claim; incremented when the user's
+            role or password changes, which revokes every token issued before.
     """
 
     __tablename__ = "users"
@@ -30,3 +32,4 @@ class User(Base):
     hashed_password = Column(String, nullable=False)
     role = Column(String, nullable=False, default="customer")  # customer | driver | admin
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
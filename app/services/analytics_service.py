@@ -0,0 +1,183 @@
+from datetime import datetime
+from itertools import chain
+from uuid import UUID
+import numpy as np
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.orm import Session
+from app.models.control_unit_model import ControlUnitData
+
+"""
+Module: analytics_service.py
+Description: Computes summary statistics over a sensor's readings in a time range with NumPy.
+Readings are fetched as three plain columns (epoch seconds, temperature, humidity) and
+copied straight into float64 arrays, so mean, standard deviation, percentiles,
+time above/below a threshold and mean kinetic temperature are computed vectorised
+instead of looping over ControlUnitDataRead objects.
+"""
+
+# Universal gas constant in J/(mol*K)
+GAS_CONSTANT = 8.314462618
+
+# Activation energy conventionally used for mean kinetic temperature (USP <1079.2>), in kJ/mol;
+# gives delta H / R of about 10000 K
+DEFAULT_ACTIVATION_ENERGY = 83.144
+
+READING_FIELDS = ("temperature", "humidity")
+
+
+def _epoch_expression(dialect_name: str):
+    """
+    Returns a SQL expression for the reading timestamp as (fractional) UNIX epoch seconds.
+    """
+    if dialect_name == "postgresql":
+        return func.date_part("epoch", ControlUnitData.timestamp)
+    # SQLite stores timestamps as text: whole epoch seconds plus the milliseconds from %f (SS.SSS)
+    whole_seconds = "CAST(strftime('%s', timestamp) AS INTEGER)"
+    fraction = "CAST(strftime('%f', timestamp) AS REAL) - CAST(strftime('%S', timestamp) AS INTEGER)"
+    return literal_column(f"({whole_seconds} + {fraction})")
+
+
+def load_reading_arrays(db: Session, sensor_unit_id: UUID, start: datetime, end: datetime) -> dict[str, np.ndarray]:
+    """
+    Loads a sensor's readings in [start, end) into NumPy arrays ordered by time.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        sensor_unit_id (UUID): Sensor unit to load.
+        start (datetime): Inclusive start of the time range.
+        end (datetime): Exclusive end of the time range.
+
+    Returns:
+        dict[str, np.ndarray]: float64 arrays "epoch" (UNIX seconds), "temperature" and "humidity".
+    """
+    stmt = (
+        select(
+            _epoch_expression(db.get_bind().dialect.name),
+            ControlUnitData.temperature_value,
+            ControlUnitData.humidity_value,
+        )
+        .where(
+            ControlUnitData.sensor_unit_id == sensor_unit_id,
+            ControlUnitData.timestamp >= start,
+            ControlUnitData.timestamp < end,
+        )
+        .order_by(ControlUnitData.timestamp)
+    )
+    rows = db.execute(stmt).all()
+    data = np.fromiter(chain.from_iterable(rows), dtype=np.float64, count=3 * len(rows)).reshape(-1, 3)
+    return {"epoch": data[:, 0], "temperature": data[:, 1], "humidity": data[:, 2]}
+
+
+def summarize(values: np.ndarray, percentiles: list[float]) -> dict:
+    """
+    Computes count, mean, population standard deviation, min, max and percentiles of a series.
+
+    Args:
+        values (np.ndarray): The series.
+        percentiles (list[float]): Percentiles to compute, between 0 and 100.
+
+    Returns:
+        dict: Statistics matching FieldStatistics; every value is None for an empty series.
+            Percentiles are keyed as "p<percentile>", e.g. "p95" or "p99.5".
+    """
+    keys = [f"p{percentile:g}" for percentile in percentiles]
+    if not values.size:
+        return {"count": 0, "mean": None, "std": None, "min": None, "max": None, "percentiles": dict.fromkeys(keys)}
+    quantiles = np.percentile(values, percentiles) if percentiles else []
+    return {
+        "count": int(values.size),
+        "mean": float(values.mean()),
+        "std": float(values.std()),
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "percentiles": {key: float(value) for key, value in zip(keys, quantiles)},
+    }
+
+
+def seconds_beyond(epoch: np.ndarray, values: np.ndarray, above: float | None = None, below: float | None = None) -> float:
+    """
+    Returns the time a series spent above and/or below a threshold.
+
+    Each reading is taken to hold until the next one, so the last reading adds no time.
+
+    Args:
+        epoch (np.ndarray): Reading times in seconds, ascending.
+        values (np.ndarray): Reading values.
+        above (float | None): Count time while the value is greater than this.
+        below (float | None): Count time while the value is less than this.
+
+    Returns:
+        float: Seconds spent beyond the threshold(s).
+    """
+    if values.size < 2:
+        return 0.0
+    held = values[:-1]
+    outside = np.zeros(held.size, dtype=bool)
+    if above is not None:
+        outside |= held > above
+    if below is not None:
+        outside |= held < below
+    return float(np.diff(epoch)[outside].sum())
+
+
+def mean_kinetic_temperature(celsius: np.ndarray, activation_energy: float = DEFAULT_ACTIVATION_ENERGY) -> float | None:
+    """
+    Computes the mean kinetic temperature (MKT) of temperature readings.
+
+    MKT = (dH/R) / -ln(mean(exp(-dH / (R * T_i)))) with T_i in kelvin, i.e. the single
+    temperature that would cause the same thermal degradation as the observed series.
+    Readings are weighted equally, as in the standard formula for regularly sampled data.
+
+    Args:
+        celsius (np.ndarray): Temperatures in degrees Celsius.
+        activation_energy (float): Activation energy dH in kJ/mol. Defaults to 83.144 (dH/R of about 10000 K).
+
+    Returns:
+        float | None: MKT in degrees Celsius, or None for an empty series.
+    """
+    if not celsius.size:
+        return None
+    h_over_r = activation_energy * 1_000 / GAS_CONSTANT
+    kelvin = celsius + 273.15
+    return float(h_over_r / -np.log(np.mean(np.exp(-h_over_r / kelvin))) - 273.15)
+
+
+def compute_reading_statistics(
+    db: Session,
+    sensor_unit_id: UUID,
+    start: datetime,
+    end: datetime,
+    percentiles: list[float],
+    temperature_above: float | None = None,
+    temperature_below: float | None = None,
+    activation_energy: float = DEFAULT_ACTIVATION_ENERGY,
+) -> dict:
+    """
+    Computes statistics over a sensor's readings in [start, end).
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        sensor_unit_id (UUID): Sensor unit to analyse.
+        start (datetime): Inclusive start of the time range.
+        end (datetime): Exclusive end of the time range.
+        percentiles (list[float]): Percentiles to compute for each field, between 0 and 100.
+        temperature_above (float | None): Threshold for seconds_above.
+        temperature_below (float | None): Threshold for seconds_below.
+        activation_energy (float): Activation energy in kJ/mol for the mean kinetic temperature.
+
+    Returns:
+        dict: Statistics matching ReadingStatistics.
+    """
+    arrays = load_reading_arrays(db, sensor_unit_id, start, end)
+    epoch, temperature = arrays["epoch"], arrays["temperature"]
+    return {
+        "sensor_unit_id": sensor_unit_id,
+        "start": start,
+        "end": end,
+        "count": int(epoch.size),
+        "duration_seconds": float(epoch[-1] - epoch[0]) if epoch.size else 0.0,
+        **{field: summarize(arrays[field], percentiles) for field in READING_FIELDS},
+        "seconds_above": None if temperature_above is None else seconds_beyond(epoch, temperature, above=temperature_above),
+        "seconds_below": None if temperature_below is None else seconds_beyond(epoch, temperature, below=temperature_below),
+        "mean_kinetic_temperature": mean_kinetic_temperature(temperature, activation_energy),
+    }
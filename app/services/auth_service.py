@@ -1,6 +1,6 @@
 from sqlalchemy.orm import Session
 from app.models.user_model import User
-from app.utils.hash import verify_password
+from app.utils.hash import verify_dummy_password_async, verify_password_async
 from app.utils.JWT import create_access_token
 from app.services.user_service import get_user_by_username
 from datetime import timedelta
@@ -13,10 +13,14 @@ and JWT access token creation.
 """
 
 
-def authenticate_user(db: Session, username: str, password: str) -> User | None:
+async def authenticate_user(db: Session, username: str, password: str) -> User | None:
     """
     Authenticates a user by verifying their username and password.
 
+    The bcrypt verification runs on the password hashing pool, so it does not block the event loop.
+    For an unknown username the password is checked against a dummy hash, so the response time
+    does not reveal whether the username exists.
+
     Args:
         db (Session): SQLAlchemy database session for querying users.
         username (str): The username of the user attempting to authenticate.
@@ -24,11 +28,15 @@ def authenticate_user(db: Session, username: str, password: str) -> User | None:
 
     Returns:
         User | None: The authenticated User object if credentials are valid; otherwise None.
+
+    Raises:
+        PasswordHashPoolBusy: If the maximum number of password verifications is already pending.
     """
     user = get_user_by_username(db, username)
     if not user:
+        await verify_dummy_password_async(password)
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password_async(password, user.hashed_password):
         return None
     return user
 
@@ -37,7 +45,7 @@ def create_access_token_for_user(user: User) -> str:
     """
     Generates a JWT access token for a given user.
 
-    The token payload includes the user's ID and role, and it expires
+    The token payload includes the user's ID, role and token version, and it expires
     according to the configured ACCESS_TOKEN_EXPIRE_MINUTES setting.
 
     Args:
@@ -48,6 +56,6 @@ def create_access_token_for_user(user: User) -> str:
     """
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return create_access_token(
-        data={"sub": str(user.id), "role": user.role},
+        data={"sub": str(user.id), "role": user.role, "ver": user.token_version},
         expires_delta=access_token_expires,
     )
@@ -1,49 +1,303 @@
+from sqlalchemy import func, literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from uuid import UUID
 from app.models.control_unit_model import ControlUnitData
 from app.api.v1.schemas.control_unit_schema import (
-    ControlUnitDataBase,
+    DeviceData,
+    TimestampGroup,
     ControlUnitDataCreate,
     ControlUnitDataUpdate,
 )
-from datetime import datetime
+from app.services.latest_reading_cache import latest_readings
+from app.services.live_feed import live_feed
+from app.services.rollup_service import ROLLUPS, recompute_rollup_buckets, update_rollups
+from app.services.rollup_service import bucket_start as rollup_bucket_start
+from app.services.threshold_service import threshold_rules
+from datetime import datetime, timezone
+import base64
+import json
+import uuid
 
 """
 Module: control_unit_service.py
 Description: Contains database operations for ControlUnitData,
 including creating, reading, updating, and deleting sensor readings.
+Grouped device uploads are flattened into row tuples and written in bulk
+(COPY on PostgreSQL, executemany elsewhere), skipping readings that already exist,
+and the newly inserted readings are added to the per-sensor rollups and checked against
+the threshold rules (threshold_service) in the same transaction.
+Time-bucketed aggregates are computed in SQL (date_bin on PostgreSQL, strftime on SQLite),
+and listings are paginated with an opaque keyset cursor over (timestamp, id).
+Every write keeps the in-memory latest-reading cache (latest_reading_cache) current,
+and newly saved readings are published to live subscribers (live_feed).
 """
 
+# Column order of the row tuples produced by flatten_device_data
+READING_COLUMNS = ("id", "sensor_unit_id", "control_unit_id", "timestamp", "humidity_value", "temperature_value")
 
-def save_device_data(data: ControlUnitDataCreate, db: Session) -> None:
+# Per-connection temporary table used to COPY readings before the deduplicating INSERT
+STAGING_TABLE = "control_unit_data_staging"
+
+
+def flatten_timestamp_group(control_unit_id: UUID, group: TimestampGroup, rows: list[tuple] | None = None) -> list[tuple]:
+    """
+    Flattens the readings of one timestamp group into row tuples.
+
+    Args:
+        control_unit_id (UUID): UUID of the control unit that sent the group.
+        group (TimestampGroup): Validated group of readings sharing a timestamp.
+        rows (list[tuple] | None): Optional list to append to, so callers can accumulate a batch.
+
+    Returns:
+        list[tuple]: The row list, with one tuple per reading ordered as READING_COLUMNS.
+    """
+    if rows is None:
+        rows = []
+    append = rows.append
+    ts = datetime.fromtimestamp(group.timestamp)
+    for unit in group.sensor_units:
+        append((uuid.uuid4(), unit.sensor_unit_id, control_unit_id, ts, unit.humidity, unit.temperature))
+    return rows
+
+
+def flatten_device_data(data: DeviceData) -> list[tuple]:
+    """
+    Flattens grouped device readings into row tuples ready for bulk insertion.
+
+    The readings have already been validated as part of DeviceData, so no
+    per-reading Pydantic or ORM objects are created.
+
+    Args:
+        data (DeviceData): Pydantic model containing the grouped sensor readings.
+
+    Returns:
+        list[tuple]: One tuple per reading, ordered as READING_COLUMNS.
+    """
+    rows = []
+    for group in data.timestamp_groups:
+        flatten_timestamp_group(data.control_unit_id, group, rows)
+    return rows
+
+
+def _insert_readings_copy(db: Session, rows: list[tuple]) -> list[tuple]:
+    """
+    Inserts row tuples on PostgreSQL via COPY into a staging table followed by
+    a single INSERT ... SELECT ... ON CONFLICT DO NOTHING.
+
+    The staging table is a per-connection temporary table that is emptied on
+    commit, and everything runs on the session's own connection, so the rows
+    are part of the current transaction.
+
+    Args:
+        db (Session): SQLAlchemy database session bound to a psycopg engine.
+        rows (list[tuple]): Row tuples ordered as READING_COLUMNS.
+
+    Returns:
+        list[tuple]: The rows that were actually inserted, ordered as READING_COLUMNS.
+    """
+    table = ControlUnitData.__tablename__
+    columns = ", ".join(f'"{name}"' for name in READING_COLUMNS)
+    connection = db.connection()
+    like = f"(LIKE {table} INCLUDING DEFAULTS)"
+    connection.exec_driver_sql(f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} {like} ON COMMIT DELETE ROWS")
+    with connection.connection.cursor() as cursor:
+        with cursor.copy(f"COPY {STAGING_TABLE} ({columns}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(row)
+    result = connection.exec_driver_sql(
+        f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {STAGING_TABLE} ON CONFLICT DO NOTHING RETURNING {columns}"
+    )
+    inserted = [tuple(row) for row in result]
+    connection.exec_driver_sql(f"TRUNCATE {STAGING_TABLE}")
+    return inserted
+
+
+def bulk_insert_readings(db: Session, rows: list[tuple]) -> list[tuple]:
+    """
+    Inserts flattened readings in bulk without committing, skipping duplicates.
+
+    A reading is a duplicate when (control_unit_id, sensor_unit_id, timestamp)
+    already exists, e.g. because a device retried an upload. PostgreSQL (psycopg)
+    uses COPY into a staging table; other backends use a single executemany
+    INSERT ... ON CONFLICT DO NOTHING, which SQLAlchemy batches into multi-row VALUES.
+
+    Args:
+        db (Session): SQLAlchemy database session for performing operations.
+        rows (list[tuple]): Row tuples ordered as READING_COLUMNS.
+
+    Returns:
+        list[tuple]: The rows that were actually inserted, ordered as READING_COLUMNS.
+    """
+    if not rows:
+        return []
+    dialect = db.get_bind().dialect
+    if dialect.name == "postgresql" and dialect.driver == "psycopg":
+        return _insert_readings_copy(db, rows)
+    table = ControlUnitData.__table__
+    dialect_insert = postgresql_insert if dialect.name == "postgresql" else sqlite_insert
+    stmt = dialect_insert(table).on_conflict_do_nothing().returning(*(table.c[name] for name in READING_COLUMNS))
+    result = db.execute(stmt, [dict(zip(READING_COLUMNS, row)) for row in rows])
+    return [tuple(row) for row in result]
+
+
+def save_readings(db: Session, rows: list[tuple]) -> int:
+    """
+    Bulk-inserts flattened readings, updates the sensor rollups, records threshold excursions and commits.
+    Duplicate readings are skipped; the saved readings are then published to live subscribers.
+
+    Args:
+        db (Session): SQLAlchemy database session for performing operations.
+        rows (list[tuple]): Row tuples ordered as READING_COLUMNS.
+
+    Returns:
+        int: Number of new readings saved; len(rows) minus this is the number of duplicates.
+    """
+    inserted = bulk_insert_readings(db, rows)
+    update_rollups(db, inserted)
+    with threshold_rules.evaluating(db, inserted):
+        db.commit()
+    latest_readings.update(inserted)
+    live_feed.publish(inserted)
+    return len(inserted)
+
+
+def save_device_data(data: DeviceData, db: Session) -> int:
     """
     Saves multiple sensor readings from grouped timestamps into the database.
 
     Args:
-        data (ControlUnitDataCreate): Pydantic model containing the grouped sensor readings.
+        data (DeviceData): Pydantic model containing the grouped sensor readings.
         db (Session): SQLAlchemy database session for performing operations.
 
     Returns:
-        None
+        int: Number of new readings saved (duplicates are skipped).
     """
-    for group in data.timestamp_groups:
-        ts = datetime.fromtimestamp(group.timestamp)
-        for unit in group.sensor_units:
-            validated = ControlUnitDataBase(
-                sensor_unit_id=unit.sensor_unit_id,
-                control_unit_id=data.control_unit_id,
-                timestamp=ts,
-                humidity={"value": unit.humidity},
-                temperature={"value": unit.temperature},
-            )
-            record = ControlUnitData(**validated.model_dump())
-            db.add(record)
-    db.commit()
+    return save_readings(db, flatten_device_data(data))
+
+
+def _bucket_expression(dialect_name: str, bucket_seconds: int, column: str = "timestamp"):
+    """
+    Returns a SQL expression mapping each row's timestamp column to the start of its bucket.
+
+    The width is rendered as a literal (it is a validated int) so the identical
+    expression can be used in SELECT, GROUP BY and ORDER BY.
+    """
+    seconds = int(bucket_seconds)
+    if dialect_name == "postgresql":
+        return literal_column(f"date_bin(INTERVAL '{seconds} seconds', {column}, TIMESTAMPTZ '2000-01-01 00:00:00+00')")
+    # SQLite: bucket as UNIX epoch seconds, converted back to datetimes in Python
+    return literal_column(f"(CAST(strftime('%s', {column}) AS INTEGER) / {seconds}) * {seconds}")
+
+
+def _rollup_for(bucket_seconds: int, start: datetime, end: datetime, control_unit_id: UUID | None):
+    """
+    Returns the widest rollup table that answers an aggregation exactly, or None to scan raw readings.
+
+    A rollup qualifies when its width divides the bucket width and both range boundaries, so each
+    of its buckets lies inside the range and inside a single result bucket. Rollups only keep the
+    control unit of a bucket's latest reading, so control unit filters always scan raw readings.
+    """
+    if control_unit_id is not None:
+        return None
+    for model, width in reversed(ROLLUPS):
+        aligned = rollup_bucket_start(start, width) == start and rollup_bucket_start(end, width) == end
+        if bucket_seconds % width.total_seconds() == 0 and aligned:
+            return model
+    return None
+
+
+def aggregate_control_unit_data(
+    db: Session,
+    start: datetime,
+    end: datetime,
+    bucket_seconds: int,
+    aggregates: list[str],
+    fields: list[str],
+    sensor_unit_id: UUID | None = None,
+    control_unit_id: UUID | None = None,
+) -> dict:
+    """
+    Aggregates readings per sensor into fixed-width time buckets.
+
+    Ranges and bucket widths aligned to whole minutes or hours are answered from the 1-minute
+    or 1-hour rollups instead of raw readings, unless the aggregation is filtered by control unit.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        start (datetime): Inclusive start of the time range.
+        end (datetime): Exclusive end of the time range.
+        bucket_seconds (int): Bucket width in seconds.
+        aggregates (list[str]): Aggregate functions: avg, min, max, sum and/or count.
+        fields (list[str]): Reading fields to aggregate: temperature and/or humidity.
+        sensor_unit_id (UUID | None): Only aggregate readings from this sensor unit.
+        control_unit_id (UUID | None): Only aggregate readings from this control unit.
+
+    Returns:
+        dict: Columnar result matching ControlUnitDataAggregate; one entry per (sensor, bucket)
+            that has readings, ordered by sensor and bucket start.
+    """
+    dialect_name = db.get_bind().dialect.name
+    rollup = _rollup_for(bucket_seconds, start, end, control_unit_id)
+    columns = {}
+    if rollup is None:
+        source, timestamp = ControlUnitData, ControlUnitData.timestamp
+        bucket = _bucket_expression(dialect_name, bucket_seconds).label("bucket_start")
+        sql_functions = {"avg": func.avg, "min": func.min, "max": func.max, "sum": func.sum}
+        for field in fields:
+            column = getattr(ControlUnitData, f"{field}_value")
+            for name in aggregates:
+                if name in sql_functions:
+                    columns[f"{field}_{name}"] = sql_functions[name](column)
+        count = func.count()
+    else:
+        source, timestamp = rollup, rollup.bucket_start
+        bucket_column = f"{rollup.__tablename__}.bucket_start"
+        bucket = _bucket_expression(dialect_name, bucket_seconds, bucket_column).label("bucket_start")
+        count = func.sum(rollup.reading_count)
+        for field in fields:
+            rollup_functions = {
+                "avg": func.sum(getattr(rollup, f"{field}_sum")) / count,
+                "min": func.min(getattr(rollup, f"{field}_min")),
+                "max": func.max(getattr(rollup, f"{field}_max")),
+                "sum": func.sum(getattr(rollup, f"{field}_sum")),
+            }
+            for name in aggregates:
+                if name in rollup_functions:
+                    columns[f"{field}_{name}"] = rollup_functions[name]
+    if "count" in aggregates:
+        columns["count"] = count
+
+    labelled = (expr.label(key) for key, expr in columns.items())
+    stmt = select(source.sensor_unit_id, bucket, *labelled).where(timestamp >= start, timestamp < end)
+    if sensor_unit_id is not None:
+        stmt = stmt.where(source.sensor_unit_id == sensor_unit_id)
+    if control_unit_id is not None:
+        stmt = stmt.where(ControlUnitData.control_unit_id == control_unit_id)
+    stmt = stmt.group_by(source.sensor_unit_id, bucket).order_by(source.sensor_unit_id, bucket)
+
+    result = {
+        "bucket_seconds": bucket_seconds,
+        "sensor_unit_id": [],
+        "bucket_start": [],
+        "values": {key: [] for key in columns},
+    }
+    value_lists = list(result["values"].values())
+    for row in db.execute(stmt):
+        result["sensor_unit_id"].append(row[0])
+        bucket_start = row[1]
+        if not isinstance(bucket_start, datetime):
+            bucket_start = datetime.fromtimestamp(bucket_start, timezone.utc)
+        result["bucket_start"].append(bucket_start)
+        for values, value in zip(value_lists, row[2:]):
+            values.append(value)
+    return result
 
 
 def create_control_unit_data(db: Session, data: ControlUnitDataCreate) -> ControlUnitData:
     """
-    Creates a single ControlUnitData record in the database.
+    Creates a single ControlUnitData record in the database, adds it to the rollups and records threshold excursions.
 
     Args:
         db (Session): SQLAlchemy database session for performing operations.
@@ -54,8 +308,15 @@ def create_control_unit_data(db: Session, data: ControlUnitDataCreate) -> Contro
     """
     db_item = ControlUnitData(**data.model_dump())
     db.add(db_item)
-    db.commit()
+    db.flush()
+    # Reloaded so the row carries the timestamp as stored, like the rows returned by bulk inserts
     db.refresh(db_item)
+    row = tuple(getattr(db_item, name) for name in READING_COLUMNS)
+    update_rollups(db, [row])
+    with threshold_rules.evaluating(db, [row]):
+        db.commit()
+    latest_readings.update([row])
+    live_feed.publish([row])
     return db_item
 
 
@@ -72,6 +333,90 @@ def get_all_control_unit_data(db: Session) -> list[ControlUnitData]:
     return db.query(ControlUnitData).all()
 
 
+def encode_cursor(item: ControlUnitData) -> str:
+    """
+    Encodes the (timestamp, id) position of a reading as an opaque cursor.
+
+    Args:
+        item (ControlUnitData): The last reading of a page.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    position = json.dumps({"t": item.timestamp.isoformat(), "i": str(item.id)})
+    return base64.urlsafe_b64encode(position.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decodes a cursor produced by encode_cursor.
+
+    Args:
+        cursor (str): Cursor string.
+
+    Returns:
+        tuple[datetime, UUID]: The (timestamp, id) position.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return datetime.fromisoformat(position["t"]), UUID(position["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def get_control_unit_data_page(
+    db: Session,
+    limit: int,
+    cursor: str | None = None,
+    sensor_unit_id: UUID | None = None,
+    control_unit_id: UUID | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> tuple[list[ControlUnitData], str | None]:
+    """
+    Retrieves one page of ControlUnitData records ordered by (timestamp, id).
+
+    Pages are located with a keyset predicate instead of OFFSET, so every page
+    costs the same regardless of how deep into the table it is.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        limit (int): Maximum number of records to return.
+        cursor (str | None): Cursor returned with the previous page, or None for the first page.
+        sensor_unit_id (UUID | None): Only return readings from this sensor unit.
+        control_unit_id (UUID | None): Only return readings from this control unit.
+        start (datetime | None): Only return readings at or after this time.
+        end (datetime | None): Only return readings before this time.
+
+    Returns:
+        tuple[list[ControlUnitData], str | None]: The records and the cursor of the next page,
+            or None when this is the last page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    query = db.query(ControlUnitData)
+    if sensor_unit_id is not None:
+        query = query.filter(ControlUnitData.sensor_unit_id == sensor_unit_id)
+    if control_unit_id is not None:
+        query = query.filter(ControlUnitData.control_unit_id == control_unit_id)
+    if start is not None:
+        query = query.filter(ControlUnitData.timestamp >= start)
+    if end is not None:
+        query = query.filter(ControlUnitData.timestamp < end)
+    if cursor is not None:
+        query = query.filter(tuple_(ControlUnitData.timestamp, ControlUnitData.id) > decode_cursor(cursor))
+
+    items = query.order_by(ControlUnitData.timestamp, ControlUnitData.id).limit(limit + 1).all()
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    return items, encode_cursor(items[-1])
+
+
 def get_control_unit_data_by_id(db: Session, data_id: str | UUID) -> ControlUnitData | None:
     """
     Retrieves a single ControlUnitData record by its ID.
@@ -90,7 +435,7 @@ def get_control_unit_data_by_id(db: Session, data_id: str | UUID) -> ControlUnit
 
 def update_control_unit_data(db: Session, data_id: str | UUID, update_data: ControlUnitDataUpdate) -> ControlUnitData | None:
     """
-    Updates an existing ControlUnitData record with new values.
+    Updates an existing ControlUnitData record with new values and recomputes the rollup buckets it left and entered.
 
     Args:
         db (Session): SQLAlchemy database session.
@@ -106,16 +451,20 @@ def update_control_unit_data(db: Session, data_id: str | UUID, update_data: Cont
     if not db_item:
         return None
     data_dict = update_data.model_dump(exclude_unset=True)
+    old_timestamp = db_item.timestamp
     for key, value in data_dict.items():
         setattr(db_item, key, value)
+    db.flush()
+    recompute_rollup_buckets(db, db_item.sensor_unit_id, [old_timestamp, db_item.timestamp])
     db.commit()
     db.refresh(db_item)
+    latest_readings.refresh_sensor(db, db_item.sensor_unit_id)
     return db_item
 
 
 def delete_control_unit_data(db: Session, data_id: str | UUID) -> ControlUnitData | None:
     """
-    Deletes a ControlUnitData record from the database.
+    Deletes a ControlUnitData record from the database and recomputes the rollup buckets it was in.
 
     Args:
         db (Session): SQLAlchemy database session.
@@ -129,6 +478,10 @@ def delete_control_unit_data(db: Session, data_id: str | UUID) -> ControlUnitDat
     db_item = db.query(ControlUnitData).filter(ControlUnitData.id == data_id).first()
     if not db_item:
         return None
+    sensor_unit_id = db_item.sensor_unit_id
     db.delete(db_item)
+    db.flush()
+    recompute_rollup_buckets(db, sensor_unit_id, [db_item.timestamp])
     db.commit()
+    latest_readings.refresh_sensor(db, sensor_unit_id)
     return db_item
@@ -0,0 +1,218 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterator
+from uuid import UUID
+import pyarrow as pa
+import pyarrow.ipc
+import pyarrow.parquet as pq
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+from app.models.control_unit_model import ControlUnitData
+from app.services.control_unit_service import READING_COLUMNS
+
+"""
+Module: export_service.py
+Description: Streams control unit readings out of the database for bulk export.
+Rows are fetched through a server-side cursor in batches of plain column tuples
+(no ORM or Pydantic objects), and each batch is serialised to one chunk of
+NDJSON or CSV, or to one Arrow record batch / Parquet row group, so memory use
+is bounded by the batch size and not the export size.
+"""
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+}
+
+# Compression codecs supported by the columnar formats
+COMPRESSION_CODECS = {
+    "parquet": ("none", "snappy", "gzip", "brotli", "lz4", "zstd"),
+    "arrow": ("none", "lz4", "zstd"),
+}
+
+ARROW_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("sensor_unit_id", pa.string()),
+        ("control_unit_id", pa.string()),
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("humidity_value", pa.float64()),
+        ("temperature_value", pa.float64()),
+    ]
+)
+
+
+def iter_reading_batches(
+    session_factory: sessionmaker,
+    batch_size: int,
+    sensor_unit_id: UUID | None = None,
+    control_unit_id: UUID | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> Iterator[list[tuple]]:
+    """
+    Yields batches of reading tuples ordered by (timestamp, id) using a server-side cursor.
+
+    The generator owns its session, so it can outlive the request's dependencies
+    while a StreamingResponse is being sent.
+
+    Args:
+        session_factory (sessionmaker): Factory for the session used by the export.
+        batch_size (int): Number of rows fetched and yielded per batch.
+        sensor_unit_id (UUID | None): Only export readings from this sensor unit.
+        control_unit_id (UUID | None): Only export readings from this control unit.
+        start (datetime | None): Only export readings at or after this time.
+        end (datetime | None): Only export readings before this time.
+
+    Yields:
+        list[tuple]: Rows ordered as READING_COLUMNS.
+    """
+    stmt = select(*(getattr(ControlUnitData, name) for name in READING_COLUMNS))
+    if sensor_unit_id is not None:
+        stmt = stmt.where(ControlUnitData.sensor_unit_id == sensor_unit_id)
+    if control_unit_id is not None:
+        stmt = stmt.where(ControlUnitData.control_unit_id == control_unit_id)
+    if start is not None:
+        stmt = stmt.where(ControlUnitData.timestamp >= start)
+    if end is not None:
+        stmt = stmt.where(ControlUnitData.timestamp < end)
+    stmt = stmt.order_by(ControlUnitData.timestamp, ControlUnitData.id).execution_options(yield_per=batch_size)
+
+    with session_factory() as db:
+        for partition in db.execute(stmt).partitions():
+            yield partition
+
+
+def _ndjson_chunk(rows: list[tuple]) -> bytes:
+    lines = []
+    for row_id, sensor_unit_id, control_unit_id, timestamp, humidity, temperature in rows:
+        lines.append(
+            json.dumps(
+                {
+                    "id": str(row_id),
+                    "sensor_unit_id": str(sensor_unit_id),
+                    "control_unit_id": str(control_unit_id),
+                    "timestamp": timestamp.isoformat(),
+                    "humidity_value": humidity,
+                    "temperature_value": temperature,
+                }
+            )
+        )
+    lines.append("")
+    return "\n".join(lines).encode()
+
+
+def _csv_chunk(rows: list[tuple], header: bool) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(READING_COLUMNS)
+    writer.writerows(
+        (row_id, sensor_unit_id, control_unit_id, timestamp.isoformat(), humidity, temperature)
+        for row_id, sensor_unit_id, control_unit_id, timestamp, humidity, temperature in rows
+    )
+    return buffer.getvalue().encode()
+
+
+class _ChunkSink:
+    """
+    Write-only file object that collects written bytes until drained.
+
+    Tracks the absolute position so Parquet/Arrow writers compute correct
+    file offsets while earlier bytes are already being sent to the client.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _record_batch(rows: list[tuple]) -> pa.RecordBatch:
+    ids, sensor_unit_ids, control_unit_ids, timestamps, humidity, temperature = zip(*rows)
+    return pa.record_batch(
+        [
+            pa.array([str(value) for value in ids], pa.string()),
+            pa.array([str(value) for value in sensor_unit_ids], pa.string()),
+            pa.array([str(value) for value in control_unit_ids], pa.string()),
+            pa.array(timestamps, ARROW_SCHEMA.field("timestamp").type),
+            pa.array(humidity, pa.float64()),
+            pa.array(temperature, pa.float64()),
+        ],
+        schema=ARROW_SCHEMA,
+    )
+
+
+def _stream_columnar(batches: Iterator[list[tuple]], export_format: str, compression: str) -> Iterator[bytes]:
+    """
+    Writes batches as Parquet row groups or Arrow IPC record batches, yielding bytes as they are produced.
+    """
+    sink = _ChunkSink()
+    output = pa.PythonFile(sink, mode="w")
+    codec = None if compression == "none" else compression
+    if export_format == "parquet":
+        writer = pq.ParquetWriter(output, ARROW_SCHEMA, compression=codec or "none")
+    else:
+        writer = pa.ipc.new_file(output, ARROW_SCHEMA, options=pa.ipc.IpcWriteOptions(compression=codec))
+    try:
+        for rows in batches:
+            if rows:
+                writer.write_batch(_record_batch(rows))
+                yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def stream_readings(batches: Iterator[list[tuple]], export_format: str, compression: str | None = None) -> Iterator[bytes]:
+    """
+    Serialises reading batches to NDJSON, CSV, Parquet or Arrow IPC, one chunk per batch.
+
+    Args:
+        batches (Iterator[list[tuple]]): Batches from iter_reading_batches.
+        export_format (str): One of EXPORT_FORMATS.
+        compression (str | None): Codec for parquet/arrow (see COMPRESSION_CODECS). Defaults to zstd.
+
+    Yields:
+        bytes: Encoded chunks. CSV output starts with a header row, even when there are no readings;
+            Parquet and Arrow output is a complete file (one row group / record batch per batch).
+    """
+    if export_format in COMPRESSION_CODECS:
+        yield from _stream_columnar(batches, export_format, compression or "zstd")
+        return
+    if export_format == "csv":
+        header = True
+        for rows in batches:
+            yield _csv_chunk(rows, header)
+            header = False
+        if header:
+            yield _csv_chunk([], header)
+        return
+    for rows in batches:
+        yield _ndjson_chunk(rows)
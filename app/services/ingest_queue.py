@@ -0,0 +1,214 @@
+import logging
+import time
+from collections import deque
+from threading import Condition, Thread
+from sqlalchemy.orm import sessionmaker
+from app.config.settings import settings
+from app.db.connection import SessionLocal
+from app.services.control_unit_service import save_readings
+from app.utils.metrics import metrics
+
+"""
+Module: ingest_queue.py
+Description: In-process write-behind queue for control unit readings. Requests enqueue
+flattened rows and return immediately; a background thread flushes them to the
+database in batches when either the batch size or the flush interval is reached.
+
+Accepted readings have already been acknowledged to the client, so a batch that fails to
+write is put back at the front of the queue and retried with exponential backoff instead
+of being discarded. Readings being flushed still count toward the capacity, so a retried
+batch always fits back in.
+"""
+
+logger = logging.getLogger(__name__)
+
+# Delay before the first retry of a failed batch, doubled per consecutive failure up to the maximum
+_RETRY_INITIAL_SECONDS = 0.5
+_RETRY_MAX_SECONDS = 30.0
+
+
+class IngestQueueFull(Exception):
+    """
+    Raised when a submission would exceed the queue capacity.
+    """
+
+
+class IngestQueue:
+    """
+    Bounded write-behind queue of reading rows with a single flushing worker thread.
+
+    Attributes:
+        capacity (int): Maximum number of readings waiting to be flushed.
+        batch_size (int): Number of readings that triggers an immediate flush.
+        flush_interval (float): Maximum seconds a reading waits before being flushed.
+    """
+
+    def __init__(self, session_factory: sessionmaker, capacity: int, batch_size: int, flush_interval: float):
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._session_factory = session_factory
+        self._rows: deque = deque()
+        # Readings taken by the worker and not yet written
+        self._in_flight = 0
+        self._oldest_enqueued_at: float | None = None
+        self._condition = Condition()
+        self._stopping = False
+        self._worker: Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """
+        bool: True while the worker thread is accepting and flushing readings.
+        """
+        return self._worker is not None and not self._stopping
+
+    @property
+    def depth(self) -> int:
+        """
+        int: Number of readings waiting to be flushed.
+        """
+        return len(self._rows)
+
+    def start(self) -> None:
+        """
+        Starts the background flushing thread, or lets a worker that is still finishing a stop() keep running.
+        """
+        with self._condition:
+            self._stopping = False
+            if self._worker is not None:
+                return
+            self._worker = Thread(target=self._run, name="ingest-queue", daemon=True)
+            self._worker.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stops accepting readings, flushes everything still queued and joins the worker.
+
+        If the worker is still flushing (e.g. retrying a failed batch) when the timeout expires,
+        it keeps running and is reused by the next start().
+
+        Args:
+            timeout (float | None): Maximum seconds to wait for the final flush.
+        """
+        with self._condition:
+            worker = self._worker
+            if worker is None:
+                return
+            self._stopping = True
+            self._condition.notify()
+        worker.join(timeout)
+        if worker.is_alive():
+            logger.warning("Ingest queue worker is still flushing %d readings", len(self._rows) + self._in_flight)
+
+    def submit(self, rows: list[tuple]) -> int:
+        """
+        Enqueues reading rows for a later flush.
+
+        Args:
+            rows (list[tuple]): Row tuples ordered as control_unit_service.READING_COLUMNS.
+
+        Returns:
+            int: Number of readings accepted.
+
+        Raises:
+            IngestQueueFull: If accepting the rows would exceed the capacity, or the queue is shutting down.
+        """
+        with self._condition:
+            if self._stopping or len(self._rows) + self._in_flight + len(rows) > self.capacity:
+                metrics.increment("ingest_queue.rejected_readings", len(rows))
+                raise IngestQueueFull()
+            if not self._rows:
+                self._oldest_enqueued_at = time.monotonic()
+            self._rows.extend(rows)
+            metrics.set_gauge("ingest_queue.depth", len(self._rows))
+            if len(self._rows) >= self.batch_size:
+                self._condition.notify()
+        return len(rows)
+
+    def _take_batch(self) -> list[tuple] | None:
+        """
+        Waits until a flush is due and removes the next batch from the queue.
+
+        Returns:
+            list[tuple] | None: The rows to flush, or None once stopped and drained; the worker then exits.
+        """
+        with self._condition:
+            while True:
+                if self._rows:
+                    waited = time.monotonic() - self._oldest_enqueued_at
+                    if self._stopping or len(self._rows) >= self.batch_size or waited >= self.flush_interval:
+                        break
+                    self._condition.wait(self.flush_interval - waited)
+                elif self._stopping:
+                    self._worker = None
+                    return None
+                else:
+                    self._condition.wait()
+            count = min(self.batch_size, len(self._rows))
+            batch = [self._rows.popleft() for _ in range(count)]
+            self._in_flight = count
+            self._oldest_enqueued_at = time.monotonic() if self._rows else None
+            metrics.set_gauge("ingest_queue.depth", len(self._rows))
+            return batch
+
+    def _requeue(self, batch: list[tuple]) -> None:
+        """
+        Puts a batch that failed to write back at the front of the queue, due for an immediate flush.
+        """
+        with self._condition:
+            self._rows.extendleft(reversed(batch))
+            self._in_flight = 0
+            self._oldest_enqueued_at = time.monotonic() - self.flush_interval
+            metrics.set_gauge("ingest_queue.depth", len(self._rows))
+
+    def _flush(self, batch: list[tuple]) -> bool:
+        """
+        Writes one batch to the database and records batch metrics.
+
+        Args:
+            batch (list[tuple]): Row tuples to write.
+
+        Returns:
+            bool: True if the batch was written, False if it failed and should be retried.
+        """
+        started = time.perf_counter()
+        db = self._session_factory()
+        try:
+            saved = save_readings(db, batch)
+            metrics.increment("ingest_queue.flushed_readings", saved)
+            metrics.increment("ingest_queue.duplicate_readings", len(batch) - saved)
+            return True
+        except Exception:
+            db.rollback()
+            metrics.increment("ingest_queue.failed_readings", len(batch))
+            logger.exception("Failed to flush %d queued readings; retrying", len(batch))
+            return False
+        finally:
+            db.close()
+            metrics.observe("ingest_queue.batch_size", len(batch))
+            metrics.observe("ingest_queue.flush_seconds", time.perf_counter() - started)
+
+    def _run(self) -> None:
+        """
+        Worker loop: flush batches until stopped and drained, retrying failed batches with backoff.
+        """
+        failures = 0
+        while (batch := self._take_batch()) is not None:
+            if self._flush(batch):
+                failures = 0
+                with self._condition:
+                    self._in_flight = 0
+                continue
+            self._requeue(batch)
+            failures += 1
+            time.sleep(min(_RETRY_INITIAL_SECONDS * 2 ** (failures - 1), _RETRY_MAX_SECONDS))
+
+
+# Process-wide queue, started from the application lifespan when INGEST_QUEUE_ENABLED is set
+ingest_queue = IngestQueue(
+    SessionLocal,
+    capacity=settings.INGEST_QUEUE_CAPACITY,
+    batch_size=settings.INGEST_BATCH_SIZE,
+    flush_interval=settings.INGEST_FLUSH_INTERVAL_SECONDS,
+)
@@ -0,0 +1,169 @@
+import logging
+from threading import Lock
+from uuid import UUID
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from app.db.connection import SessionLocal
+from app.models.control_unit_model import ControlUnitData
+
+"""
+Module: latest_reading_cache.py
+Description: Process-local index of the most recent reading per sensor unit, with a
+secondary index from control unit to its sensors. It is updated by the ingest path after
+each commit and warmed from the database at startup, so "current temperature" lookups
+are dictionary reads instead of ordered scans of control_unit_data.
+
+The cache lives in the API process; with several worker processes each keeps its own
+copy, fed by the readings that process ingests.
+"""
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = (
+    ControlUnitData.id,
+    ControlUnitData.sensor_unit_id,
+    ControlUnitData.control_unit_id,
+    ControlUnitData.timestamp,
+    ControlUnitData.humidity_value,
+    ControlUnitData.temperature_value,
+)
+
+
+class LatestReadingCache:
+    """
+    Latest reading per sensor unit, as row tuples ordered like control_unit_service.READING_COLUMNS.
+
+    Attributes:
+        size (int): Number of sensor units in the cache.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._by_sensor: dict[UUID, tuple] = {}
+        self._by_control_unit: dict[UUID, set[UUID]] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self._by_sensor)
+
+    def _set(self, row: tuple) -> None:
+        sensor_unit_id, control_unit_id = row[1], row[2]
+        previous = self._by_sensor.get(sensor_unit_id)
+        if previous is not None and previous[2] != control_unit_id:
+            self._by_control_unit.get(previous[2], set()).discard(sensor_unit_id)
+        self._by_sensor[sensor_unit_id] = row
+        self._by_control_unit.setdefault(control_unit_id, set()).add(sensor_unit_id)
+
+    def _remove(self, sensor_unit_id: UUID) -> None:
+        previous = self._by_sensor.pop(sensor_unit_id, None)
+        if previous is not None:
+            self._by_control_unit.get(previous[2], set()).discard(sensor_unit_id)
+
+    def update(self, rows: list[tuple]) -> None:
+        """
+        Records readings that are newer than the cached reading of their sensor.
+
+        Args:
+            rows (list[tuple]): Committed reading tuples ordered as READING_COLUMNS.
+        """
+        with self._lock:
+            for row in rows:
+                current = self._by_sensor.get(row[1])
+                if current is None or (row[3], row[0]) > (current[3], current[0]):
+                    self._set(row)
+
+    def get_sensor(self, sensor_unit_id: UUID) -> tuple | None:
+        """
+        Returns the latest reading of a sensor unit.
+
+        Args:
+            sensor_unit_id (UUID): Sensor unit to look up.
+
+        Returns:
+            tuple | None: The reading tuple, or None if the sensor has no readings.
+        """
+        return self._by_sensor.get(sensor_unit_id)
+
+    def get_control_unit(self, control_unit_id: UUID) -> list[tuple]:
+        """
+        Returns the latest reading of every sensor unit whose latest reading came from a control unit.
+
+        Args:
+            control_unit_id (UUID): Control unit to look up.
+
+        Returns:
+            list[tuple]: Reading tuples ordered by sensor unit ID.
+        """
+        with self._lock:
+            sensors = sorted(self._by_control_unit.get(control_unit_id, ()))
+            return [self._by_sensor[sensor_unit_id] for sensor_unit_id in sensors]
+
+    def refresh_sensor(self, db: Session, sensor_unit_id: UUID) -> None:
+        """
+        Reloads the latest reading of one sensor from the database, e.g. after it was updated or deleted.
+
+        Args:
+            db (Session): SQLAlchemy database session.
+            sensor_unit_id (UUID): Sensor unit to reload.
+        """
+        row = db.execute(
+            select(*_COLUMNS)
+            .where(ControlUnitData.sensor_unit_id == sensor_unit_id)
+            .order_by(ControlUnitData.timestamp.desc(), ControlUnitData.id.desc())
+            .limit(1)
+        ).first()
+        with self._lock:
+            if row is None:
+                self._remove(sensor_unit_id)
+            else:
+                self._set(tuple(row))
+
+    def warm(self, db: Session) -> int:
+        """
+        Loads the latest reading of every sensor with a single query.
+
+        PostgreSQL uses DISTINCT ON (sensor_unit_id); other backends use ROW_NUMBER().
+
+        Args:
+            db (Session): SQLAlchemy database session.
+
+        Returns:
+            int: Number of sensor units in the cache afterwards.
+        """
+        newest_first = (ControlUnitData.sensor_unit_id, ControlUnitData.timestamp.desc(), ControlUnitData.id.desc())
+        if db.get_bind().dialect.name == "postgresql":
+            stmt = select(*_COLUMNS).distinct(ControlUnitData.sensor_unit_id).order_by(*newest_first)
+        else:
+            rank = func.row_number().over(partition_by=newest_first[0], order_by=newest_first[1:]).label("rank")
+            ranked = select(*_COLUMNS, rank).subquery()
+            stmt = select(*(ranked.c[column.key] for column in _COLUMNS)).where(ranked.c.rank == 1)
+        self.update([tuple(row) for row in db.execute(stmt)])
+        return self.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_sensor.clear()
+            self._by_control_unit.clear()
+
+
+def warm_latest_readings() -> int:
+    """
+    Warms the process-wide cache from the database; called from the application lifespan.
+
+    A failure is logged rather than raised, so the API still starts and the cache
+    fills from new readings.
+
+    Returns:
+        int: Number of sensor units loaded.
+    """
+    try:
+        with SessionLocal() as db:
+            return latest_readings.warm(db)
+    except SQLAlchemyError:
+        logger.exception("Could not warm the latest reading cache")
+        return 0
+
+
+# Process-wide cache, updated by control_unit_service
+latest_readings = LatestReadingCache()
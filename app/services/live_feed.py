@@ -0,0 +1,216 @@
+import asyncio
+import json
+from threading import Lock
+from typing import AsyncIterator
+from uuid import UUID
+from app.utils.metrics import metrics
+
+"""
+Module: live_feed.py
+Description: In-process publish/subscribe of newly committed readings, used by the
+Server-Sent Events endpoint so clients receive readings as they arrive instead of polling.
+
+save_readings publishes every committed batch from whatever thread it runs on; each
+subscriber owns a bounded asyncio.Queue on the event loop that created it, and readings are
+handed over with loop.call_soon_threadsafe. Publishing never blocks the ingest path: a
+subscriber whose buffer fills up is a slow consumer and is dropped (its stream ends with a
+"dropped" event and the client reconnects) instead of buffering without limit. A single
+batch larger than the whole buffer (e.g. a backlog upload) only delivers its newest
+readings, so it does not disconnect clients that keep up.
+
+Subscriptions are per process; with several worker processes a client receives the
+readings ingested by the process it is connected to.
+"""
+
+
+class Subscription:
+    """
+    One client's subscription to the readings of a sensor unit.
+
+    Attributes:
+        sensor_unit_id (UUID): Sensor unit whose readings are delivered.
+        dropped (bool): True once the subscriber fell behind and was disconnected.
+    """
+
+    def __init__(self, sensor_unit_id: UUID, loop: asyncio.AbstractEventLoop, buffer_size: int):
+        self.sensor_unit_id = sensor_unit_id
+        self.dropped = False
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue(buffer_size)
+
+    def _offer(self, rows: list[tuple]) -> None:
+        """
+        Enqueues a batch on the subscriber's event loop, or drops the subscriber if its buffer fills up.
+        """
+        if self.dropped:
+            return
+        skipped = len(rows) - self._queue.maxsize
+        if skipped > 0:
+            rows = rows[skipped:]
+            metrics.increment("live_feed.skipped_readings", skipped)
+        for row in rows:
+            try:
+                self._queue.put_nowait(row)
+            except asyncio.QueueFull:
+                self._drop()
+                return
+
+    def _drop(self) -> None:
+        self.dropped = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        # Wakes the consumer so it can end the stream
+        self._queue.put_nowait(None)
+        metrics.increment("live_feed.dropped_subscribers")
+
+    async def get(self, max_rows: int) -> list[tuple] | None:
+        """
+        Waits for the next readings.
+
+        Args:
+            max_rows (int): Maximum number of already buffered readings to return at once.
+
+        Returns:
+            list[tuple] | None: Reading tuples ordered as READING_COLUMNS, or None if the subscriber was dropped.
+        """
+        row = await self._queue.get()
+        rows = []
+        while row is not None:
+            rows.append(row)
+            if len(rows) >= max_rows or self._queue.empty():
+                return rows
+            row = self._queue.get_nowait()
+        return None
+
+
+class LiveFeed:
+    """
+    Fans committed readings out to the subscribers of their sensor unit.
+
+    Attributes:
+        subscriber_count (int): Number of active subscriptions.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._subscribers: dict[UUID, set[Subscription]] = {}
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscribers.values())
+
+    def subscribe(self, sensor_unit_id: UUID, buffer_size: int) -> Subscription:
+        """
+        Subscribes to a sensor unit's new readings. Must be called from the event loop that consumes them.
+
+        Args:
+            sensor_unit_id (UUID): Sensor unit to follow.
+            buffer_size (int): Maximum number of undelivered readings before the subscriber is dropped.
+
+        Returns:
+            Subscription: The new subscription; pass it to unsubscribe when done.
+        """
+        subscription = Subscription(sensor_unit_id, asyncio.get_running_loop(), buffer_size)
+        with self._lock:
+            self._subscribers.setdefault(sensor_unit_id, set()).add(subscription)
+        metrics.set_gauge("live_feed.subscribers", self.subscriber_count)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Removes a subscription; unknown subscriptions are ignored.
+
+        Args:
+            subscription (Subscription): Subscription returned by subscribe.
+        """
+        with self._lock:
+            subscriptions = self._subscribers.get(subscription.sensor_unit_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscribers[subscription.sensor_unit_id]
+        metrics.set_gauge("live_feed.subscribers", self.subscriber_count)
+
+    def publish(self, rows: list[tuple]) -> None:
+        """
+        Hands committed readings to the subscribers of their sensor units without blocking.
+
+        Args:
+            rows (list[tuple]): Committed reading tuples ordered as READING_COLUMNS.
+        """
+        if not self._subscribers:
+            return
+        with self._lock:
+            targets = {sensor_unit_id: list(subscriptions) for sensor_unit_id, subscriptions in self._subscribers.items()}
+        by_sensor: dict[UUID, list[tuple]] = {}
+        for row in rows:
+            if row[1] in targets:
+                by_sensor.setdefault(row[1], []).append(row)
+        for sensor_unit_id, sensor_rows in by_sensor.items():
+            sensor_rows.sort(key=lambda row: (row[3], row[0]))
+            for subscription in targets[sensor_unit_id]:
+                try:
+                    subscription._loop.call_soon_threadsafe(subscription._offer, sensor_rows)
+                except RuntimeError:
+                    # The subscriber's event loop is closed
+                    self.unsubscribe(subscription)
+
+
+def format_reading_event(row: tuple) -> str:
+    """
+    Formats a reading tuple as a Server-Sent Events "reading" event.
+
+    Args:
+        row (tuple): Reading tuple ordered as READING_COLUMNS.
+
+    Returns:
+        str: The event, terminated by a blank line.
+    """
+    row_id, sensor_unit_id, control_unit_id, timestamp, humidity, temperature = row
+    data = {
+        "id": str(row_id),
+        "sensor_unit_id": str(sensor_unit_id),
+        "control_unit_id": str(control_unit_id),
+        "timestamp": timestamp.isoformat(),
+        "humidity_value": humidity,
+        "temperature_value": temperature,
+    }
+    return f"event: reading\nid: {row_id}\ndata: {json.dumps(data)}\n\n"
+
+
+async def stream_events(subscription: Subscription, heartbeat_seconds: float, max_rows: int = 500) -> AsyncIterator[str]:
+    """
+    Yields Server-Sent Events for a subscription until it is dropped or the client disconnects.
+
+    A comment is sent immediately and then whenever no reading arrived for heartbeat_seconds,
+    which keeps proxies from closing idle connections. The subscription is removed when the
+    generator finishes or is cancelled; a generator that never starts does not run that cleanup,
+    so the response should also unsubscribe in a background task.
+
+    Args:
+        subscription (Subscription): Subscription created by live_feed.subscribe.
+        heartbeat_seconds (float): Idle time after which a keep-alive comment is sent.
+        max_rows (int): Maximum number of buffered readings written per chunk.
+
+    Yields:
+        str: One or more SSE events.
+    """
+    try:
+        yield ": subscribed\n\n"
+        while True:
+            try:
+                rows = await asyncio.wait_for(subscription.get(max_rows), heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if rows is None:
+                yield 'event: dropped\ndata: {"reason": "slow consumer"}\n\n'
+                return
+            yield "".join(format_reading_event(row) for row in rows)
+    finally:
+        live_feed.unsubscribe(subscription)
+
+
+# Process-wide feed, published to by control_unit_service.save_readings
+live_feed = LiveFeed()
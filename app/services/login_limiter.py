@@ -0,0 +1,238 @@
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from threading import Lock
+from typing import Callable
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from app.config.settings import settings
+from app.db.connection import SessionLocal
+from app.models.login_attempt_model import LoginAttempt
+from app.utils.metrics import metrics
+
+"""
+Module: login_limiter.py
+Description: Sliding-window limits on login attempts per username and per client IP,
+checked by the login endpoint before any password hashing happens, so a credential-stuffing
+burst costs at most the allowed number of bcrypt verifications per window.
+
+An attempt is admitted when neither its username nor its client IP has used up its
+attempts within the last LOGIN_RATE_LIMIT_WINDOW_SECONDS; admitted attempts are recorded
+in both logs, rejected ones are not. A successful login clears the username's log and takes
+its own attempt back out of the client IP's log, so the IP limit only counts failed logins
+(a shared NAT or office address is not locked out by its users logging in).
+
+Attempt logs live in an AttemptStore: MemoryAttemptStore keeps them per process (each worker
+enforces the limits separately), DatabaseAttemptStore keeps them in the login_attempts table
+shared by all workers.
+"""
+
+# Number of admitted attempts between sweeps of expired attempts of all keys
+_SWEEP_EVERY = 1_000
+
+
+class AttemptStore(ABC):
+    """
+    Storage of timestamped attempts per limiter key.
+    """
+
+    @abstractmethod
+    def admit(self, limits: dict[str, int], window_seconds: float, now: float) -> float:
+        """
+        Records an attempt under every key, unless any key already holds its limit of attempts in the window.
+
+        Args:
+            limits (dict[str, int]): Maximum number of attempts per key within the window.
+            window_seconds (float): Length of the sliding window.
+            now (float): Time of the attempt as UNIX seconds.
+
+        Returns:
+            float: 0 if the attempt was admitted, otherwise the seconds until it would be.
+        """
+
+    @abstractmethod
+    def reset(self, key: str) -> None:
+        """
+        Forgets every attempt recorded under a key.
+
+        Args:
+            key (str): Limiter key.
+        """
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        """
+        Forgets the most recent attempt recorded under a key.
+
+        Args:
+            key (str): Limiter key.
+        """
+
+
+class MemoryAttemptStore(AttemptStore):
+    """
+    Process-local attempt logs.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._attempts: dict[str, deque[float]] = {}
+        self._admitted = 0
+
+    def _sweep(self, cutoff: float) -> None:
+        for key in [key for key, attempts in self._attempts.items() if attempts[-1] <= cutoff]:
+            del self._attempts[key]
+
+    def admit(self, limits: dict[str, int], window_seconds: float, now: float) -> float:
+        cutoff = now - window_seconds
+        with self._lock:
+            retry_after = 0.0
+            for key, limit in limits.items():
+                attempts = self._attempts.get(key)
+                if attempts is None:
+                    continue
+                while attempts and attempts[0] <= cutoff:
+                    attempts.popleft()
+                if len(attempts) >= limit:
+                    retry_after = max(retry_after, attempts[-limit] - cutoff)
+            if retry_after:
+                return retry_after
+            for key in limits:
+                self._attempts.setdefault(key, deque()).append(now)
+            self._admitted += 1
+            if self._admitted % _SWEEP_EVERY == 0:
+                self._sweep(cutoff)
+            return 0.0
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._attempts.pop(key, None)
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            attempts = self._attempts.get(key)
+            if attempts:
+                attempts.pop()
+
+
+class DatabaseAttemptStore(AttemptStore):
+    """
+    Attempt logs in the login_attempts table, shared by all worker processes.
+
+    The check and the insert run in one short transaction; concurrent attempts in different
+    workers may each see the other's attempt missing, so a burst can exceed a limit by at most
+    the number of attempts checked at the same moment.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        self._session_factory = session_factory
+        self._lock = Lock()
+        self._admitted = 0
+
+    def admit(self, limits: dict[str, int], window_seconds: float, now: float) -> float:
+        cutoff = now - window_seconds
+        with self._session_factory() as db:
+            retry_after = 0.0
+            for key, limit in limits.items():
+                stmt = (
+                    select(LoginAttempt.attempted_at)
+                    .where(LoginAttempt.key == key, LoginAttempt.attempted_at > cutoff)
+                    .order_by(LoginAttempt.attempted_at.desc())
+                    .limit(limit)
+                )
+                attempts = db.scalars(stmt).all()
+                if len(attempts) >= limit:
+                    retry_after = max(retry_after, attempts[-1] - cutoff)
+            if retry_after:
+                return retry_after
+            db.add_all(LoginAttempt(key=key, attempted_at=now) for key in limits)
+            with self._lock:
+                self._admitted += 1
+                sweep = self._admitted % _SWEEP_EVERY == 0
+            if sweep:
+                db.execute(delete(LoginAttempt).where(LoginAttempt.attempted_at <= cutoff))
+            db.commit()
+            return 0.0
+
+    def reset(self, key: str) -> None:
+        with self._session_factory() as db:
+            db.execute(delete(LoginAttempt).where(LoginAttempt.key == key))
+            db.commit()
+
+    def release(self, key: str) -> None:
+        with self._session_factory() as db:
+            stmt = select(LoginAttempt.id).where(LoginAttempt.key == key).order_by(LoginAttempt.attempted_at.desc()).limit(1)
+            attempt_id = db.scalar(stmt)
+            if attempt_id is not None:
+                db.execute(delete(LoginAttempt).where(LoginAttempt.id == attempt_id))
+                db.commit()
+
+
+class LoginLimiter:
+    """
+    Sliding-window limits on login attempts per username and per client IP.
+
+    Attributes:
+        store (AttemptStore): Where attempts are recorded.
+        window_seconds (float): Length of the sliding window.
+        max_per_username (int): Attempts allowed per username within the window.
+        max_per_ip (int): Attempts allowed per client IP within the window.
+    """
+
+    def __init__(self, store: AttemptStore, window_seconds: float, max_per_username: int, max_per_ip: int):
+        self.store = store
+        self.window_seconds = window_seconds
+        self.max_per_username = max_per_username
+        self.max_per_ip = max_per_ip
+
+    def admit(self, username: str, client_ip: str) -> float:
+        """
+        Records a login attempt if both its username and its client IP are within their limits.
+
+        Args:
+            username (str): Submitted username.
+            client_ip (str): Address of the client.
+
+        Returns:
+            float: 0 if the attempt may proceed, otherwise the seconds until it would be admitted.
+        """
+        limits = {f"username:{username}": self.max_per_username, f"ip:{client_ip}": self.max_per_ip}
+        retry_after = self.store.admit(limits, self.window_seconds, time.time())
+        if retry_after:
+            metrics.increment("login_limiter.rejected")
+        return retry_after
+
+    def succeeded(self, username: str, client_ip: str) -> None:
+        """
+        Clears the attempts of a username after a successful login and uncounts it for the client IP.
+
+        Args:
+            username (str): The authenticated username.
+            client_ip (str): Address of the client, as passed to admit.
+        """
+        self.store.reset(f"username:{username}")
+        self.store.release(f"ip:{client_ip}")
+
+
+def create_attempt_store(kind: str) -> AttemptStore:
+    """
+    Returns the attempt store configured by LOGIN_RATE_LIMIT_STORE.
+
+    Args:
+        kind (str): "memory" or "database".
+
+    Returns:
+        AttemptStore: The store.
+    """
+    if kind == "database":
+        return DatabaseAttemptStore()
+    return MemoryAttemptStore()
+
+
+# Process-wide limiter used by the login endpoint
+login_limiter = LoginLimiter(
+    store=create_attempt_store(settings.LOGIN_RATE_LIMIT_STORE),
+    window_seconds=settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS,
+    max_per_username=settings.LOGIN_MAX_ATTEMPTS_PER_USERNAME,
+    max_per_ip=settings.LOGIN_MAX_ATTEMPTS_PER_IP,
+)
@@ -0,0 +1,252 @@
+import asyncio
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from app.config.settings import settings
+from app.models.control_unit_model import ControlUnitData
+
+"""
+Module: partition_service.py
+Description: Maintains the PostgreSQL range partitions of control_unit_data.
+Pre-creates partitions for upcoming periods, moves rows that landed in the default
+partition into proper partitions, and detaches (optionally drops) partitions older
+than the retention period, so retention is a metadata operation instead of a DELETE.
+Expired rows found in the default partition are moved into a partition of their own
+first, so they are expired the same way, or appended to the period's detached partition
+when an earlier run kept it.
+Does nothing on databases where the table is not partitioned (e.g. SQLite).
+
+Run once from the command line (e.g. from cron):
+    python -m app.services.partition_service
+"""
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = ControlUnitData.__tablename__
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+
+# Serialises maintenance runs across application instances
+ADVISORY_LOCK_KEY = 7_312_004_118
+
+_PARTITION_NAME = re.compile(rf"^{PARENT_TABLE}_p(\d{{6}}|\d{{8}})$")
+
+
+def period_start(ts: datetime, interval: str) -> datetime:
+    """
+    Returns the start (UTC) of the daily or monthly period containing a timestamp.
+
+    Args:
+        ts (datetime): Timestamp to align; naive values are treated as UTC.
+        interval (str): "daily" or "monthly".
+
+    Returns:
+        datetime: Timezone-aware start of the period.
+    """
+    ts = ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
+    start = ts.replace(hour=0, minute=0, second=0, microsecond=0)
+    return start.replace(day=1) if interval == "monthly" else start
+
+
+def next_period(start: datetime, interval: str) -> datetime:
+    """
+    Returns the start of the period following the one starting at `start`.
+
+    Args:
+        start (datetime): Start of a period.
+        interval (str): "daily" or "monthly".
+
+    Returns:
+        datetime: Start of the next period.
+    """
+    if interval == "monthly":
+        return start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+    return start + timedelta(days=1)
+
+
+def partition_name(start: datetime, interval: str) -> str:
+    """
+    Returns the partition table name for a period, e.g. control_unit_data_p202610 or _p20261017.
+
+    Args:
+        start (datetime): Start of the period.
+        interval (str): "daily" or "monthly".
+
+    Returns:
+        str: Partition table name.
+    """
+    return f"{PARENT_TABLE}_p{start.strftime('%Y%m' if interval == 'monthly' else '%Y%m%d')}"
+
+
+def parse_partition_name(name: str) -> tuple[datetime, datetime] | None:
+    """
+    Returns the [start, end) range encoded in a partition name.
+
+    Args:
+        name (str): Partition table name.
+
+    Returns:
+        tuple[datetime, datetime] | None: The range, or None for the default or foreign partitions.
+    """
+    match = _PARTITION_NAME.match(name)
+    if not match:
+        return None
+    digits = match.group(1)
+    interval = "monthly" if len(digits) == 6 else "daily"
+    start = datetime.strptime(digits, "%Y%m" if interval == "monthly" else "%Y%m%d").replace(tzinfo=timezone.utc)
+    return start, next_period(start, interval)
+
+
+def _is_partitioned(connection: Connection) -> bool:
+    return bool(
+        connection.execute(
+            text("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table)"),
+            {"table": PARENT_TABLE},
+        ).scalar()
+    )
+
+
+def _existing_partitions(connection: Connection) -> dict[str, tuple[datetime, datetime]]:
+    children = "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid"
+    query = text(f"{children} WHERE i.inhparent = to_regclass(:table)")
+    names = connection.execute(query, {"table": PARENT_TABLE}).scalars()
+    return {name: bounds for name in names if (bounds := parse_partition_name(name))}
+
+
+def _table_exists(connection: Connection, name: str) -> bool:
+    return connection.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar() is not None
+
+
+def _move_default_rows(connection: Connection, name: str, start: datetime, end: datetime) -> int:
+    """
+    Moves the rows for [start, end) out of the default partition into a table and returns how many were moved.
+    """
+    lower, upper = start.isoformat(), end.isoformat()
+    result = connection.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            f"WHERE timestamp >= '{lower}' AND timestamp < '{upper}' RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        )
+    )
+    return result.rowcount
+
+
+def _create_partition(connection: Connection, name: str, start: datetime, end: datetime) -> None:
+    """
+    Creates a partition for [start, end), moving any rows for that range out of the default partition.
+    """
+    connection.execute(text(f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    _move_default_rows(connection, name, start, end)
+    bounds = f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    connection.execute(text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} {bounds}"))
+
+
+def maintain_partitions(
+    engine: Engine,
+    now: datetime | None = None,
+    interval: str | None = None,
+    premake: int | None = None,
+    retention_days: int | None = None,
+    drop_expired: bool | None = None,
+) -> dict[str, list[str]]:
+    """
+    Creates upcoming partitions, drains the default partition and expires old partitions.
+
+    Arguments left as None fall back to the PARTITION_* settings.
+
+    Args:
+        engine (Engine): SQLAlchemy engine for the database.
+        now (datetime | None): Reference time. Defaults to the current UTC time.
+        interval (str | None): "daily" or "monthly" partitions.
+        premake (int | None): Number of future periods to create ahead of time.
+        retention_days (int | None): Partitions ending before now minus this many days are expired.
+        drop_expired (bool | None): Drop expired partitions instead of only detaching them.
+
+    Returns:
+        dict[str, list[str]]: Names of the created, detached and dropped partitions.
+    """
+    interval = interval or settings.PARTITION_INTERVAL
+    premake = settings.PARTITION_PREMAKE if premake is None else premake
+    retention_days = settings.PARTITION_RETENTION_DAYS if retention_days is None else retention_days
+    drop_expired = settings.PARTITION_DROP_EXPIRED if drop_expired is None else drop_expired
+    now = now or datetime.now(timezone.utc)
+    report: dict[str, list[str]] = {"created": [], "detached": [], "dropped": []}
+
+    if engine.dialect.name != "postgresql":
+        return report
+    with engine.begin() as connection:
+        if not _is_partitioned(connection):
+            return report
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": ADVISORY_LOCK_KEY})
+        existing = _existing_partitions(connection)
+
+        # Periods that need a partition: the current and upcoming ones, plus any with rows in the default partition
+        wanted = set()
+        start = period_start(now, interval)
+        for _ in range(premake + 1):
+            wanted.add(start)
+            start = next_period(start, interval)
+        unit = "month" if interval == "monthly" else "day"
+        truncated = f"date_trunc('{unit}', timestamp AT TIME ZONE 'UTC')"
+        stray = connection.execute(text(f"SELECT DISTINCT {truncated} FROM {DEFAULT_PARTITION}")).scalars()
+        wanted.update(period_start(ts, interval) for ts in stray)
+
+        # Expired periods with rows in the default partition get a partition too, so the expiry
+        # below detaches (or drops) those rows like any other expired partition
+        cutoff = now - timedelta(days=retention_days) if retention_days else None
+        for start in sorted(wanted):
+            end = next_period(start, interval)
+            if any(start < other_end and other_start < end for other_start, other_end in existing.values()):
+                continue
+            name = partition_name(start, interval)
+            if _table_exists(connection, name):
+                # Left behind by an earlier detach without PARTITION_DROP_EXPIRED: late rows for its
+                # expired period are appended to it; a non-expired one needs an operator to re-attach it
+                if cutoff is not None and end <= cutoff:
+                    moved = _move_default_rows(connection, name, start, end)
+                    logger.info("Moved %d late rows from %s into detached %s", moved, DEFAULT_PARTITION, name)
+                else:
+                    logger.warning("Not creating partition %s: a table with that name exists but is not attached", name)
+                continue
+            _create_partition(connection, name, start, end)
+            existing[name] = (start, end)
+            report["created"].append(name)
+
+        if cutoff is not None:
+            for name, (_, end) in sorted(existing.items()):
+                if end <= cutoff:
+                    connection.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+                    report["detached"].append(name)
+                    if drop_expired:
+                        connection.execute(text(f"DROP TABLE {name}"))
+                        report["dropped"].append(name)
+
+    if any(report.values()):
+        logger.info("Partition maintenance: %s", report)
+    return report
+
+
+async def partition_maintenance_loop(engine: Engine, interval_seconds: float) -> None:
+    """
+    Runs maintain_partitions periodically until cancelled.
+
+    Args:
+        engine (Engine): SQLAlchemy engine for the database.
+        interval_seconds (float): Seconds between runs.
+    """
+    while True:
+        try:
+            await run_in_threadpool(maintain_partitions, engine)
+        except Exception:
+            logger.exception("Partition maintenance failed")
+        await asyncio.sleep(interval_seconds)
+
+
+if __name__ == "__main__":
+    from app.db.connection import engine
+
+    logging.basicConfig(level=logging.INFO)
+    print(maintain_partitions(engine))
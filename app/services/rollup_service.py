@@ -0,0 +1,277 @@
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Iterable
+from uuid import UUID
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, sessionmaker
+from app.db.connection import SessionLocal
+from app.models.control_unit_model import ControlUnitData
+from app.models.sensor_rollup_model import SensorRollup1h, SensorRollup1m
+
+"""
+Module: rollup_service.py
+Description: Maintains the per-sensor 1-minute and 1-hour rollup tables, which
+control_unit_service.aggregate_control_unit_data reads for minute- or hour-aligned ranges.
+Each inserted batch of readings is pre-aggregated in memory per (sensor, bucket) and
+merged into the rollups with a single INSERT ... ON CONFLICT DO UPDATE per table, so the
+cost is proportional to the number of touched buckets rather than raw readings.
+Single readings that are updated or deleted cannot be merged that way, so the buckets
+containing them are recomputed from raw readings instead.
+Rollups can be rebuilt from raw readings in parallel, hour-aligned chunks:
+    python -m app.services.rollup_service --start 2026-10-01T00:00:00 --end 2026-10-17T00:00:00
+"""
+
+logger = logging.getLogger(__name__)
+
+# Rollup tables and their bucket widths; every width must divide one hour
+ROLLUPS = ((SensorRollup1m, timedelta(minutes=1)), (SensorRollup1h, timedelta(hours=1)))
+
+BACKFILL_FETCH_SIZE = 10_000
+
+# Raw reading columns in control_unit_service.READING_COLUMNS order
+_READING_COLUMNS = (
+    ControlUnitData.id,
+    ControlUnitData.sensor_unit_id,
+    ControlUnitData.control_unit_id,
+    ControlUnitData.timestamp,
+    ControlUnitData.humidity_value,
+    ControlUnitData.temperature_value,
+)
+
+
+def bucket_start(ts: datetime, width: timedelta) -> datetime:
+    """
+    Returns the start of the bucket of the given width containing a timestamp.
+
+    Buckets are aligned to midnight of the timestamp's day, so widths should divide a day.
+
+    Args:
+        ts (datetime): Timestamp to align (naive or timezone-aware).
+        width (timedelta): Bucket width.
+
+    Returns:
+        datetime: Start of the bucket, with the same tzinfo as `ts`.
+    """
+    since_midnight = ts - ts.replace(hour=0, minute=0, second=0, microsecond=0)
+    return ts - since_midnight % width
+
+
+def aggregate_readings(rows: Iterable[tuple], width: timedelta, buckets: dict | None = None) -> dict:
+    """
+    Pre-aggregates readings per (sensor_unit_id, bucket_start).
+
+    Args:
+        rows (Iterable[tuple]): Reading tuples ordered as control_unit_service.READING_COLUMNS.
+        width (timedelta): Bucket width.
+        buckets (dict | None): Optional result of a previous call to merge into.
+
+    Returns:
+        dict: Rollup column values keyed by (sensor_unit_id, bucket_start).
+    """
+    if buckets is None:
+        buckets = {}
+    for _, sensor_unit_id, control_unit_id, ts, humidity, temperature in rows:
+        key = (sensor_unit_id, bucket_start(ts, width))
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = {
+                "sensor_unit_id": sensor_unit_id,
+                "bucket_start": key[1],
+                "control_unit_id": control_unit_id,
+                "reading_count": 1,
+                "temperature_min": temperature,
+                "temperature_max": temperature,
+                "temperature_sum": temperature,
+                "temperature_last": temperature,
+                "humidity_min": humidity,
+                "humidity_max": humidity,
+                "humidity_sum": humidity,
+                "humidity_last": humidity,
+                "last_timestamp": ts,
+            }
+            continue
+        bucket["reading_count"] += 1
+        bucket["temperature_min"] = min(bucket["temperature_min"], temperature)
+        bucket["temperature_max"] = max(bucket["temperature_max"], temperature)
+        bucket["temperature_sum"] += temperature
+        bucket["humidity_min"] = min(bucket["humidity_min"], humidity)
+        bucket["humidity_max"] = max(bucket["humidity_max"], humidity)
+        bucket["humidity_sum"] += humidity
+        if ts >= bucket["last_timestamp"]:
+            bucket["control_unit_id"] = control_unit_id
+            bucket["temperature_last"] = temperature
+            bucket["humidity_last"] = humidity
+            bucket["last_timestamp"] = ts
+    return buckets
+
+
+def _upsert_buckets(db: Session, model, values: list[dict]) -> None:
+    """
+    Merges pre-aggregated buckets into a rollup table without committing.
+    """
+    if not values:
+        return
+    table = model.__table__
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        stmt, least, greatest = postgresql_insert(table), func.least, func.greatest
+    else:
+        # SQLite's multi-argument min()/max() are scalar functions
+        stmt, least, greatest = sqlite_insert(table), func.min, func.max
+    current, new = table.c, stmt.excluded
+    newer = new.last_timestamp >= current.last_timestamp
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[current.sensor_unit_id, current.bucket_start],
+        set_={
+            "reading_count": current.reading_count + new.reading_count,
+            "temperature_min": least(current.temperature_min, new.temperature_min),
+            "temperature_max": greatest(current.temperature_max, new.temperature_max),
+            "temperature_sum": current.temperature_sum + new.temperature_sum,
+            "temperature_last": case((newer, new.temperature_last), else_=current.temperature_last),
+            "humidity_min": least(current.humidity_min, new.humidity_min),
+            "humidity_max": greatest(current.humidity_max, new.humidity_max),
+            "humidity_sum": current.humidity_sum + new.humidity_sum,
+            "humidity_last": case((newer, new.humidity_last), else_=current.humidity_last),
+            "control_unit_id": case((newer, new.control_unit_id), else_=current.control_unit_id),
+            "last_timestamp": greatest(current.last_timestamp, new.last_timestamp),
+        },
+    )
+    db.execute(stmt, values)
+
+
+def update_rollups(db: Session, rows: list[tuple]) -> None:
+    """
+    Adds newly inserted readings to the 1-minute and 1-hour rollups without committing.
+
+    Call this only with readings that were actually inserted (not duplicates),
+    in the same transaction as the insert.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        rows (list[tuple]): Reading tuples ordered as control_unit_service.READING_COLUMNS.
+    """
+    if not rows:
+        return
+    for model, width in ROLLUPS:
+        _upsert_buckets(db, model, list(aggregate_readings(rows, width).values()))
+
+
+def recompute_rollup_buckets(db: Session, sensor_unit_id: UUID, timestamps: Iterable[datetime]) -> None:
+    """
+    Recomputes a sensor's 1-minute and 1-hour buckets containing the given timestamps from raw readings, without committing.
+
+    Call this in the same transaction, after flushing an update or deletion of single readings;
+    pass both the old and the new timestamp of a moved reading.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        sensor_unit_id (UUID): Sensor unit whose readings changed.
+        timestamps (Iterable[datetime]): Timestamps of the changed readings.
+    """
+    timestamps = list(timestamps)
+    for model, width in ROLLUPS:
+        for start in {bucket_start(ts, width) for ts in timestamps}:
+            bucket = db.query(model).filter(model.sensor_unit_id == sensor_unit_id, model.bucket_start == start)
+            bucket.delete(synchronize_session=False)
+            stmt = select(*_READING_COLUMNS).where(
+                ControlUnitData.sensor_unit_id == sensor_unit_id,
+                ControlUnitData.timestamp >= start,
+                ControlUnitData.timestamp < start + width,
+            )
+            _upsert_buckets(db, model, list(aggregate_readings(db.execute(stmt), width).values()))
+
+
+def rebuild_rollups(session_factory: sessionmaker, start: datetime, end: datetime) -> int:
+    """
+    Recomputes all rollup buckets in [start, end) from raw readings in one transaction.
+
+    `start` and `end` must be aligned to the widest bucket (one hour) so no bucket
+    is shared with a neighbouring range.
+
+    Args:
+        session_factory (sessionmaker): Factory for database sessions.
+        start (datetime): Inclusive range start.
+        end (datetime): Exclusive range end.
+
+    Returns:
+        int: Number of raw readings aggregated.
+    """
+    stmt = select(*_READING_COLUMNS).where(ControlUnitData.timestamp >= start, ControlUnitData.timestamp < end)
+    buckets = {width: {} for _, width in ROLLUPS}
+    count = 0
+    with session_factory() as db:
+        for partition in db.execute(stmt.execution_options(yield_per=BACKFILL_FETCH_SIZE)).partitions():
+            count += len(partition)
+            for width, width_buckets in buckets.items():
+                aggregate_readings(partition, width, width_buckets)
+        for model, width in ROLLUPS:
+            db.query(model).filter(model.bucket_start >= start, model.bucket_start < end).delete(synchronize_session=False)
+            _upsert_buckets(db, model, list(buckets[width].values()))
+        db.commit()
+    return count
+
+
+def backfill_rollups(
+    start: datetime | None = None,
+    end: datetime | None = None,
+    chunk: timedelta = timedelta(days=1),
+    workers: int = 4,
+    session_factory: sessionmaker = SessionLocal,
+) -> int:
+    """
+    Rebuilds the rollups for a time range from raw readings in parallel chunks.
+
+    The range is widened to whole hours and split into chunks of `chunk`,
+    each rebuilt in its own transaction on a worker thread. Readings ingested
+    into a chunk while it is being rebuilt may be missed; rerun the chunk if so.
+
+    Args:
+        start (datetime | None): Range start. Defaults to the oldest raw reading.
+        end (datetime | None): Range end. Defaults to just after the newest raw reading.
+        chunk (timedelta): Chunk size; rounded up to whole hours.
+        workers (int): Number of chunks rebuilt concurrently.
+        session_factory (sessionmaker): Factory for database sessions.
+
+    Returns:
+        int: Number of raw readings aggregated.
+    """
+    if start is None or end is None:
+        with session_factory() as db:
+            oldest, newest = db.query(func.min(ControlUnitData.timestamp), func.max(ControlUnitData.timestamp)).one()
+        if oldest is None:
+            return 0
+        start = start or oldest
+        end = end or newest + timedelta(microseconds=1)
+
+    hour = timedelta(hours=1)
+    start = bucket_start(start, hour)
+    chunk = max(hour, -(-chunk // hour) * hour)
+    ranges = []
+    while start < end:
+        ranges.append((start, start + chunk))
+        start += chunk
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        counts = executor.map(lambda bounds: rebuild_rollups(session_factory, *bounds), ranges)
+        total = 0
+        for (chunk_start, chunk_end), count in zip(ranges, counts):
+            logger.info("Rebuilt rollups %s - %s from %d readings", chunk_start, chunk_end, count)
+            total += count
+    return total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild sensor rollups from raw control unit readings.")
+    parser.add_argument("--start", type=datetime.fromisoformat, help="ISO start time (default: oldest reading)")
+    parser.add_argument("--end", type=datetime.fromisoformat, help="ISO end time (default: newest reading)")
+    parser.add_argument("--chunk-hours", type=int, default=24, help="Hours per chunk (default: 24)")
+    parser.add_argument("--workers", type=int, default=4, help="Chunks rebuilt concurrently (default: 4)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    total = backfill_rollups(args.start, args.end, timedelta(hours=args.chunk_hours), args.workers)
+    print(f"Rebuilt rollups from {total} readings")
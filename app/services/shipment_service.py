@@ -1,12 +1,18 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from app.models.control_unit_model import ControlUnitData
 from app.models.shipment_model import Shipment
+from app.models.threshold_model import ThresholdExcursion, ThresholdRule
 from app.api.v1.schemas.shipment_schema import ShipmentCreate
+from app.services.threshold_service import threshold_rules
+from app.utils.downsampling import lttb_indices
+from datetime import datetime, timezone
 from uuid import UUID
 
 """
 Module: shipment_service.py
 Description: Contains all database operations related to Shipment objects,
-including creation, retrieval, update, and deletion.
+including creation, retrieval, update, deletion, and the readings of a shipment's sensor.
 """
 
 
@@ -41,6 +47,7 @@ def create_shipment(db: Session, shipment: ShipmentCreate) -> Shipment:
         sender_id=ensure_uuid(shipment.sender_id),
         receiver_id=ensure_uuid(shipment.receiver_id),
         driver_id=ensure_uuid(shipment.driver_id),
+        sensor_unit_id=ensure_uuid(shipment.sensor_unit_id),
     )
     db.add(db_shipment)
     db.commit()
@@ -91,15 +98,20 @@ def update_shipment(
     shipment_id: str | UUID,
     driver_id: str | UUID | None = None,
     shipment_status: str | None = None,
+    sensor_unit_id: str | UUID | None = None,
 ) -> Shipment | None:
     """
-    Updates a shipment's driver or status in the database.
+    Updates a shipment's driver, status or sensor unit in the database.
+
+    Changing the sensor unit reloads the threshold rule index, so the shipment's rules
+    apply to the new sensor unit from the next ingested batch on.
 
     Args:
         db (Session): SQLAlchemy database session.
         shipment_id (str | UUID): ID of the shipment to update.
         driver_id (str | UUID | None, optional): New driver ID to assign. Defaults to None.
         shipment_status (str | None, optional): New status to assign. Defaults to None.
+        sensor_unit_id (str | UUID | None, optional): New sensor unit ID to assign. Defaults to None.
 
     Returns:
         Shipment | None: The updated Shipment object if found, otherwise None.
@@ -112,14 +124,19 @@ def update_shipment(
         db_shipment.driver_id = ensure_uuid(driver_id)
     if shipment_status:
         db_shipment.status = shipment_status
+    sensor_changed = sensor_unit_id is not None and ensure_uuid(sensor_unit_id) != db_shipment.sensor_unit_id
+    if sensor_changed:
+        db_shipment.sensor_unit_id = ensure_uuid(sensor_unit_id)
     db.commit()
     db.refresh(db_shipment)
+    if sensor_changed:
+        threshold_rules.invalidate()
     return db_shipment
 
 
 def delete_shipment(db: Session, shipment_id: str | UUID) -> Shipment | None:
     """
-    Deletes a shipment from the database.
+    Deletes a shipment together with its threshold rules and their excursions, and reloads the rule index.
 
     Args:
         db (Session): SQLAlchemy database session.
@@ -132,6 +149,71 @@ def delete_shipment(db: Session, shipment_id: str | UUID) -> Shipment | None:
     db_shipment = db.query(Shipment).filter(Shipment.id == shipment_id).first()
     if not db_shipment:
         return None
+    # Deleted explicitly rather than through ON DELETE CASCADE, which SQLite does not enforce by default
+    rule_ids = select(ThresholdRule.id).where(ThresholdRule.shipment_id == shipment_id)
+    db.query(ThresholdExcursion).filter(ThresholdExcursion.rule_id.in_(rule_ids)).delete(synchronize_session=False)
+    db.query(ThresholdRule).filter(ThresholdRule.shipment_id == shipment_id).delete(synchronize_session=False)
     db.delete(db_shipment)
     db.commit()
+    threshold_rules.invalidate()
     return db_shipment
+
+
+def get_shipment_readings(
+    db: Session,
+    shipment: Shipment,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    max_points: int = 0,
+) -> dict:
+    """
+    Fetches the readings of a shipment's sensor unit within the shipment's time window.
+
+    Runs a single range query served by the (sensor_unit_id, timestamp) index and
+    optionally downsamples the series with LTTB on temperature; humidity values are
+    taken from the same readings.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        shipment (Shipment): Shipment with a sensor_unit_id.
+        start (datetime | None): Window start. Defaults to the shipment's creation time.
+        end (datetime | None): Window end. Defaults to now.
+        max_points (int): Maximum number of readings to return; 0 returns every reading.
+
+    Returns:
+        dict: Columnar readings matching ShipmentReadings.
+    """
+    if start is None:
+        start = shipment.created_at
+        if start is not None and start.tzinfo is None:
+            # created_at is stored as naive UTC
+            start = start.replace(tzinfo=timezone.utc)
+    end = end or datetime.now(timezone.utc)
+
+    stmt = select(ControlUnitData.timestamp, ControlUnitData.temperature_value, ControlUnitData.humidity_value).where(
+        ControlUnitData.sensor_unit_id == shipment.sensor_unit_id, ControlUnitData.timestamp < end
+    )
+    if start is not None:
+        stmt = stmt.where(ControlUnitData.timestamp >= start)
+    rows = db.execute(stmt.order_by(ControlUnitData.timestamp)).all()
+
+    timestamps = [row[0] for row in rows]
+    temperature = [row[1] for row in rows]
+    humidity = [row[2] for row in rows]
+    total = len(rows)
+    if max_points and total > max_points:
+        keep = lttb_indices([ts.timestamp() for ts in timestamps], temperature, max_points)
+        timestamps = [timestamps[i] for i in keep]
+        temperature = [temperature[i] for i in keep]
+        humidity = [humidity[i] for i in keep]
+
+    return {
+        "shipment_id": shipment.id,
+        "sensor_unit_id": shipment.sensor_unit_id,
+        "start": start,
+        "end": end,
+        "total_points": total,
+        "timestamp": timestamps,
+        "temperature": temperature,
+        "humidity": humidity,
+    }
@@ -0,0 +1,292 @@
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from threading import Lock
+from typing import Iterator
+from uuid import UUID
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+from app.api.v1.schemas.threshold_schema import ThresholdRuleCreate
+from app.models.shipment_model import Shipment
+from app.models.threshold_model import ThresholdExcursion, ThresholdRule
+
+"""
+Module: threshold_service.py
+Description: Contains database operations for cold-chain threshold rules and their
+excursions, and the in-memory rule index that evaluates readings at ingest time.
+
+The index maps each sensor unit to the bands that apply to it (its own rules plus the
+rules of the shipment it is attached to) and keeps the open excursion per
+(rule, sensor, field). control_unit_service passes every batch of newly inserted readings
+through it, so an excursion row is inserted when a reading leaves a band and closed when a
+reading returns to it, in the same transaction as the readings; history is never rescanned.
+Batches for sensors without rules cost one dict lookup per reading and take no lock.
+
+As with the latest-reading cache, the index is process-local: it is loaded lazily from
+the database and reloaded after rules change in this process.
+"""
+
+# Reading fields checked by rules, mapped to their index in a READING_COLUMNS tuple
+_FIELDS = {"temperature": 5, "humidity": 4}
+
+
+def _distance(value: float, low: float | None, high: float | None) -> float:
+    """
+    Returns how far a value lies outside [low, high]; 0 when it is inside the band.
+    """
+    if low is not None and value < low:
+        return low - value
+    if high is not None and value > high:
+        return value - high
+    return 0.0
+
+
+class ThresholdRuleIndex:
+    """
+    Rule bands per sensor unit and the open excursions, evaluated incrementally per batch of readings.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._loaded = False
+        # sensor_unit_id -> [(rule_id, field, low, high)]
+        self._bands: dict[UUID, list[tuple]] = {}
+        # (rule_id, sensor_unit_id, field) -> excursion column values
+        self._open: dict[tuple, dict] = {}
+        # sensor_unit_id -> timestamp of the newest evaluated reading
+        self._last_seen: dict[UUID, datetime] = {}
+        # sensor_unit_id -> lock held from evaluation until the batch is committed
+        self._sensor_locks: dict[UUID, Lock] = {}
+
+    def _load(self, db: Session) -> None:
+        bands: dict[UUID, list[tuple]] = {}
+        stmt = select(ThresholdRule, Shipment.sensor_unit_id).outerjoin(Shipment, Shipment.id == ThresholdRule.shipment_id)
+        for rule, shipment_sensor_unit_id in db.execute(stmt):
+            sensor_unit_id = rule.sensor_unit_id or shipment_sensor_unit_id
+            if sensor_unit_id is None:
+                continue
+            for field in _FIELDS:
+                low, high = getattr(rule, f"{field}_min"), getattr(rule, f"{field}_max")
+                if low is not None or high is not None:
+                    bands.setdefault(sensor_unit_id, []).append((rule.id, field, low, high))
+
+        open_excursions = {}
+        for excursion in db.scalars(select(ThresholdExcursion).where(ThresholdExcursion.ended_at.is_(None))):
+            key = (excursion.rule_id, excursion.sensor_unit_id, excursion.field)
+            columns = ThresholdExcursion.__table__.columns
+            open_excursions[key] = {column.key: getattr(excursion, column.key) for column in columns}
+
+        self._bands = bands
+        self._open = open_excursions
+        self._last_seen = {}
+        self._loaded = True
+
+    def invalidate(self) -> None:
+        """
+        Marks the index stale so it is reloaded from the database before the next evaluation.
+
+        Called after rules or the shipments they target change.
+        """
+        self._loaded = False
+
+    @contextmanager
+    def evaluating(self, db: Session, rows: list[tuple]) -> Iterator[list[dict]]:
+        """
+        Opens, extends and closes excursions for a batch of newly inserted readings; the caller commits inside the block.
+
+        Readings are evaluated per sensor in timestamp order. Readings that are not newer than
+        the last evaluated reading of their sensor (late or replayed uploads) are skipped, so they
+        cannot reopen or close an excursion out of order.
+
+        The batch's sensors with rules stay locked until the block exits, so a concurrent batch for
+        the same sensor waits for this one's excursion rows to be committed, and the in-memory state
+        only takes the batch's changes once the block (and so the commit) succeeded.
+
+        Args:
+            db (Session): SQLAlchemy database session of the ingest transaction.
+            rows (list[tuple]): Inserted reading tuples ordered as READING_COLUMNS.
+
+        Yields:
+            list[dict]: Column values of every excursion opened, extended or closed by the batch.
+        """
+        if self._loaded and not self._bands:
+            yield []
+            return
+        with self._lock:
+            if not self._loaded:
+                self._load(db)
+            sensors = sorted({row[1] for row in rows if row[1] in self._bands}, key=str)
+            locks = [self._sensor_locks.setdefault(sensor_unit_id, Lock()) for sensor_unit_id in sensors]
+        if not sensors:
+            yield []
+            return
+        for lock in locks:
+            lock.acquire()
+        try:
+            with self._lock:
+                if not self._loaded:
+                    self._load(db)
+                opened, last_seen, created, updated = self._stage(rows)
+            if created:
+                db.execute(insert(ThresholdExcursion), created)
+            if updated:
+                keys = ("id", "ended_at", "peak_value", "reading_count")
+                db.execute(update(ThresholdExcursion), [{key: excursion[key] for key in keys} for excursion in updated])
+            yield [dict(excursion) for excursion in (*created, *updated)]
+            with self._lock:
+                for key, excursion in opened.items():
+                    if excursion is None:
+                        self._open.pop(key, None)
+                    else:
+                        self._open[key] = excursion
+                self._last_seen.update(last_seen)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def _stage(self, rows: list[tuple]) -> tuple[dict, dict, list[dict], list[dict]]:
+        """
+        Computes a batch's excursion changes without touching the index state; called with the lock held.
+
+        Returns the open excursion per key after the batch (None for closed ones), the newest
+        evaluated timestamp per sensor, and the created and updated excursion rows.
+        """
+        bands = self._bands
+        opened: dict[tuple, dict | None] = {}
+        last_seen: dict[UUID, datetime] = {}
+        created: dict[UUID, dict] = {}
+        changed: dict[UUID, dict] = {}
+        for row in sorted((row for row in rows if row[1] in bands), key=lambda row: row[3]):
+            sensor_unit_id, timestamp = row[1], row[3]
+            previous = last_seen.get(sensor_unit_id, self._last_seen.get(sensor_unit_id))
+            if previous is not None and timestamp <= previous:
+                continue
+            last_seen[sensor_unit_id] = timestamp
+            for rule_id, field, low, high in bands[sensor_unit_id]:
+                value = row[_FIELDS[field]]
+                key = (rule_id, sensor_unit_id, field)
+                excursion = opened[key] if key in opened else self._open.get(key)
+                distance = _distance(value, low, high)
+                if distance > 0 and excursion is None:
+                    excursion = {
+                        "id": uuid.uuid4(),
+                        "rule_id": rule_id,
+                        "sensor_unit_id": sensor_unit_id,
+                        "field": field,
+                        "started_at": timestamp,
+                        "ended_at": None,
+                        "peak_value": value,
+                        "reading_count": 1,
+                    }
+                    opened[key] = created[excursion["id"]] = excursion
+                    continue
+                if excursion is None:
+                    continue
+                # Copied before the first change so the shared state stays untouched until commit
+                excursion = changed.get(excursion["id"]) or created.get(excursion["id"]) or dict(excursion)
+                if distance > 0:
+                    excursion["reading_count"] += 1
+                    if distance > _distance(excursion["peak_value"], low, high):
+                        excursion["peak_value"] = value
+                    opened[key] = excursion
+                else:
+                    excursion["ended_at"] = timestamp
+                    opened[key] = None
+                changed[excursion["id"]] = excursion
+
+        updated = [excursion for excursion_id, excursion in changed.items() if excursion_id not in created]
+        return opened, last_seen, list(created.values()), updated
+
+
+def create_rule(db: Session, data: ThresholdRuleCreate) -> ThresholdRule:
+    """
+    Creates a threshold rule and reloads the rule index.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        data (ThresholdRuleCreate): Validated rule data.
+
+    Returns:
+        ThresholdRule: The created rule.
+    """
+    rule = ThresholdRule(**data.model_dump())
+    db.add(rule)
+    db.commit()
+    db.refresh(rule)
+    threshold_rules.invalidate()
+    return rule
+
+
+def get_rules(db: Session, sensor_unit_id: UUID | None = None, shipment_id: UUID | None = None) -> list[ThresholdRule]:
+    """
+    Fetches threshold rules, optionally filtered by target.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        sensor_unit_id (UUID | None): Only return rules for this sensor unit.
+        shipment_id (UUID | None): Only return rules for this shipment.
+
+    Returns:
+        list[ThresholdRule]: Matching rules, oldest first.
+    """
+    stmt = select(ThresholdRule)
+    if sensor_unit_id is not None:
+        stmt = stmt.where(ThresholdRule.sensor_unit_id == sensor_unit_id)
+    if shipment_id is not None:
+        stmt = stmt.where(ThresholdRule.shipment_id == shipment_id)
+    return list(db.scalars(stmt.order_by(ThresholdRule.created_at)))
+
+
+def delete_rule(db: Session, rule_id: UUID) -> ThresholdRule | None:
+    """
+    Deletes a threshold rule together with its excursions and reloads the rule index.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        rule_id (UUID): ID of the rule to delete.
+
+    Returns:
+        ThresholdRule | None: The deleted rule if found, otherwise None.
+    """
+    rule = db.get(ThresholdRule, rule_id)
+    if rule is None:
+        return None
+    db.query(ThresholdExcursion).filter(ThresholdExcursion.rule_id == rule_id).delete()
+    db.delete(rule)
+    db.commit()
+    threshold_rules.invalidate()
+    return rule
+
+
+def get_excursions(
+    db: Session,
+    sensor_unit_id: UUID | None = None,
+    rule_id: UUID | None = None,
+    open_only: bool = False,
+    limit: int = 100,
+) -> list[ThresholdExcursion]:
+    """
+    Fetches recorded excursions, newest first.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        sensor_unit_id (UUID | None): Only return excursions of this sensor unit.
+        rule_id (UUID | None): Only return excursions of this rule.
+        open_only (bool): Only return excursions that have not ended.
+        limit (int): Maximum number of excursions to return.
+
+    Returns:
+        list[ThresholdExcursion]: Matching excursions ordered by start time, newest first.
+    """
+    stmt = select(ThresholdExcursion)
+    if sensor_unit_id is not None:
+        stmt = stmt.where(ThresholdExcursion.sensor_unit_id == sensor_unit_id)
+    if rule_id is not None:
+        stmt = stmt.where(ThresholdExcursion.rule_id == rule_id)
+    if open_only:
+        stmt = stmt.where(ThresholdExcursion.ended_at.is_(None))
+    return list(db.scalars(stmt.order_by(ThresholdExcursion.started_at.desc()).limit(limit)))
+
+
+# Process-wide rule index, evaluated by control_unit_service.save_readings
+threshold_rules = ThresholdRuleIndex()
@@ -0,0 +1,98 @@
+from threading import Lock
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.models.user_model import User
+from app.services.user_cache import CLEAR_ALL, user_cache
+from app.utils.metrics import metrics
+
+"""
+Module: token_versions.py
+Description: Process-local registry of each user's current token version, used by
+claims-only authorization to reject revoked access tokens without loading the user.
+
+Access tokens carry the user's token_version as the "ver" claim. user_service increments
+it when the role or password changes, and a deleted user has no version at all, so a token
+is only honoured while its "ver" equals the user's current version. Versions are loaded
+from the database once per user and then kept until the user is invalidated; invalidations
+arrive through the user cache, locally and from other worker processes, so the next
+request after a change reloads the version with a single query.
+"""
+
+# Marks a user that does not exist (deleted, or never created)
+_MISSING = None
+
+
+class TokenVersionRegistry:
+    """
+    Current token version per user, loaded lazily and dropped on invalidation.
+
+    Attributes:
+        size (int): Number of users whose version is known.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._versions: dict[UUID, int | None] = {}
+        # Incremented on every invalidation; a load that raced an invalidation is not kept
+        self._generation = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._versions)
+
+    def current_version(self, db: Session, user_id: UUID) -> int | None:
+        """
+        Returns a user's current token version, loading it from the database if unknown.
+
+        Args:
+            db (Session): SQLAlchemy database session, only used on a miss.
+            user_id (UUID): ID of the user.
+
+        Returns:
+            int | None: The token version, or None if the user does not exist.
+        """
+        try:
+            return self._versions[user_id]
+        except KeyError:
+            pass
+        metrics.increment("token_versions.misses")
+        generation = self._generation
+        version = db.scalar(select(User.token_version).where(User.id == user_id))
+        with self._lock:
+            if generation == self._generation:
+                self._versions[user_id] = _MISSING if version is None else version
+        return version
+
+    def is_current(self, db: Session, user_id: UUID, version: int) -> bool:
+        """
+        Checks that a token's version claim is the user's current version.
+
+        Args:
+            db (Session): SQLAlchemy database session, only used on a miss.
+            user_id (UUID): ID of the user from the "sub" claim.
+            version (int): Version from the "ver" claim.
+
+        Returns:
+            bool: False if the user was deleted or the token was issued before a role or password change.
+        """
+        return self.current_version(db, user_id) == version
+
+    def invalidate(self, message: str) -> None:
+        """
+        Forgets a user's version (or every version for CLEAR_ALL) so it is reloaded on next use.
+
+        Args:
+            message (str): A user ID string, or CLEAR_ALL, as delivered by the user cache.
+        """
+        with self._lock:
+            self._generation += 1
+            if message == CLEAR_ALL:
+                self._versions.clear()
+            else:
+                self._versions.pop(UUID(message), None)
+
+
+# Process-wide registry used by claims-only authorization in dependencies.require_roles
+token_versions = TokenVersionRegistry()
+user_cache.add_listener(token_versions.invalidate)
@@ -0,0 +1,263 @@
+import logging
+import time
+from collections import OrderedDict
+from threading import Event, Lock, Thread
+from typing import Callable
+from uuid import UUID
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from app.api.v1.schemas.user_schema import UserRead
+from app.config.settings import settings
+from app.utils.metrics import metrics
+
+"""
+Module: user_cache.py
+Description: Process-local TTL + LRU cache of authenticated user principals (UserRead),
+keyed by user ID, so get_current_user does not query the users table on every request.
+
+Entries expire after USER_CACHE_TTL_SECONDS and the least recently used entry is evicted
+beyond USER_CACHE_MAX_SIZE. user_service invalidates a user after updating or deleting it;
+the invalidation is applied locally and published on an InvalidationChannel so other worker
+processes drop their copy too. LocalInvalidationChannel only covers the current process
+(the TTL bounds staleness elsewhere); PostgresInvalidationChannel broadcasts with
+NOTIFY and listens with LISTEN on a dedicated connection.
+"""
+
+logger = logging.getLogger(__name__)
+
+# Invalidation message that clears every entry
+CLEAR_ALL = "*"
+
+
+class InvalidationChannel:
+    """
+    Broadcasts cache invalidations between processes. The base class is process-local only.
+    """
+
+    def start(self, on_invalidate: Callable[[str], None]) -> None:
+        """
+        Starts delivering invalidations published by other processes.
+
+        Args:
+            on_invalidate (Callable[[str], None]): Called with a user ID string, or CLEAR_ALL.
+        """
+
+    def publish(self, message: str) -> None:
+        """
+        Sends an invalidation to the other processes.
+
+        Args:
+            message (str): A user ID string, or CLEAR_ALL.
+        """
+
+    def stop(self) -> None:
+        """
+        Stops delivering invalidations.
+        """
+
+
+class LocalInvalidationChannel(InvalidationChannel):
+    """
+    Channel for a single process: invalidations are only applied locally.
+    """
+
+
+class PostgresInvalidationChannel(InvalidationChannel):
+    """
+    Broadcasts invalidations with PostgreSQL NOTIFY and receives them on a LISTEN connection.
+
+    Attributes:
+        channel (str): Notification channel name.
+    """
+
+    def __init__(self, engine: Engine, channel: str = "user_cache_invalidation", poll_seconds: float = 1.0):
+        self.channel = channel
+        self._engine = engine
+        self._poll_seconds = poll_seconds
+        self._stopping = Event()
+        self._thread: Thread | None = None
+
+    def start(self, on_invalidate: Callable[[str], None]) -> None:
+        self._stopping.clear()
+        self._thread = Thread(target=self._listen, args=(on_invalidate,), name="user-cache-invalidation", daemon=True)
+        self._thread.start()
+
+    def _listen(self, on_invalidate: Callable[[str], None]) -> None:
+        import psycopg
+
+        url = self._engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        while not self._stopping.is_set():
+            try:
+                with psycopg.connect(url, autocommit=True) as connection:
+                    connection.execute(f"LISTEN {self.channel}")
+                    # Entries cached while the listener was down may have missed invalidations
+                    on_invalidate(CLEAR_ALL)
+                    while not self._stopping.is_set():
+                        for notification in connection.notifies(timeout=self._poll_seconds):
+                            on_invalidate(notification.payload)
+            except Exception:
+                logger.exception("User cache invalidation listener failed; reconnecting")
+                self._stopping.wait(self._poll_seconds)
+
+    def publish(self, message: str) -> None:
+        try:
+            with self._engine.connect() as connection:
+                params = {"channel": self.channel, "message": message}
+                connection.execute(text("SELECT pg_notify(:channel, :message)"), params)
+                connection.commit()
+        except Exception:
+            logger.exception("Could not publish user cache invalidation")
+
+    def stop(self) -> None:
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._poll_seconds * 2)
+            self._thread = None
+
+
+def create_invalidation_channel(engine: Engine, kind: str) -> InvalidationChannel:
+    """
+    Returns the invalidation channel configured by USER_CACHE_INVALIDATION.
+
+    Args:
+        engine (Engine): Application database engine.
+        kind (str): "postgres", "local", or "auto" (postgres when the database is PostgreSQL with psycopg).
+
+    Returns:
+        InvalidationChannel: The channel to attach to the cache.
+    """
+    if kind == "auto":
+        kind = "postgres" if engine.dialect.name == "postgresql" and engine.dialect.driver == "psycopg" else "local"
+    if kind == "postgres":
+        return PostgresInvalidationChannel(engine)
+    return LocalInvalidationChannel()
+
+
+class UserCache:
+    """
+    TTL + LRU cache of user principals with explicit, broadcast invalidation.
+
+    Attributes:
+        ttl_seconds (float): Lifetime of an entry.
+        max_size (int): Maximum number of entries.
+        size (int): Current number of entries.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._lock = Lock()
+        self._entries: OrderedDict[UUID, tuple[float, UserRead]] = OrderedDict()
+        # Incremented on every invalidation; a load that raced an invalidation is not cached
+        self._generation = 0
+        self._channel: InvalidationChannel = LocalInvalidationChannel()
+        self._listeners: list[Callable[[str], None]] = []
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, user_id: UUID) -> UserRead | None:
+        """
+        Returns the cached principal of a user, counting a hit or a miss.
+
+        Args:
+            user_id (UUID): ID of the user.
+
+        Returns:
+            UserRead | None: The principal, or None if it is not cached or has expired.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(user_id)
+                metrics.increment("user_cache.hits")
+                return entry[1]
+            if entry is not None:
+                del self._entries[user_id]
+        metrics.increment("user_cache.misses")
+        return None
+
+    def put(self, user: UserRead, generation: int | None = None) -> None:
+        """
+        Caches a principal loaded from the database.
+
+        Args:
+            user (UserRead): The principal.
+            generation (int | None): Value of `generation` read before loading the user; if any
+                invalidation happened since, the possibly stale principal is not cached.
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[user.id] = (time.monotonic() + self.ttl_seconds, user)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                metrics.increment("user_cache.evictions")
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Registers a callback that receives every local and remote invalidation after the cache applied it.
+
+        Args:
+            listener (Callable[[str], None]): Called with a user ID string, or CLEAR_ALL.
+        """
+        self._listeners.append(listener)
+
+    def _apply(self, message: str) -> None:
+        with self._lock:
+            self._generation += 1
+            if message == CLEAR_ALL:
+                self._entries.clear()
+            else:
+                try:
+                    self._entries.pop(UUID(message), None)
+                except ValueError:
+                    logger.warning("Ignoring malformed user cache invalidation %r", message)
+                    return
+        for listener in self._listeners:
+            listener(message)
+
+    def invalidate(self, user_id: UUID) -> None:
+        """
+        Drops a user from this process's cache and from the other processes' caches.
+
+        Args:
+            user_id (UUID): ID of the updated or deleted user.
+        """
+        self._apply(str(user_id))
+        self._channel.publish(str(user_id))
+
+    def clear(self) -> None:
+        """
+        Drops every entry in this process.
+        """
+        self._apply(CLEAR_ALL)
+
+    def attach(self, channel: InvalidationChannel) -> None:
+        """
+        Starts receiving invalidations from, and publishing them to, a channel.
+
+        Args:
+            channel (InvalidationChannel): Channel created by create_invalidation_channel.
+        """
+        self._channel.stop()
+        self._channel = channel
+        channel.start(self._apply)
+
+    def detach(self) -> None:
+        """
+        Stops the channel and falls back to process-local invalidation.
+        """
+        self._channel.stop()
+        self._channel = LocalInvalidationChannel()
+
+
+# Process-wide cache used by dependencies.get_current_user
+user_cache = UserCache(ttl_seconds=settings.USER_CACHE_TTL_SECONDS, max_size=settings.USER_CACHE_MAX_SIZE)
@@ -1,8 +1,9 @@
 from fastapi import HTTPException, status
 from app.api.v1.schemas.user_schema import UserCreate, UserRead
 from app.models.user_model import User
+from app.services.user_cache import user_cache
 from sqlalchemy.orm import Session
-from app.utils.hash import get_password_hash
+from app.utils.hash import get_password_hash, get_password_hash_async
 import uuid
 
 """
@@ -40,13 +41,14 @@ def get_user_by_id(db: Session, user_id: uuid.UUID) -> User | None:
     return db.query(User).filter(User.id == user_id).first()
 
 
-def create_user(db: Session, user: UserCreate) -> UserRead:
+def create_user(db: Session, user: UserCreate, hashed_password: str | None = None) -> UserRead:
     """
     Creates a new user in the database after validating uniqueness and hashing the password.
 
     Args:
         db (Session): SQLAlchemy database session for performing operations.
         user (UserCreate): Pydantic model containing username, password, and role.
+        hashed_password (str | None): Hash of user.password if already computed; hashed here otherwise.
 
     Returns:
         UserRead: Pydantic model representing the newly created user.
@@ -60,7 +62,8 @@ def create_user(db: Session, user: UserCreate) -> UserRead:
     if get_user_by_username(db, user.username):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Username already taken")
 
-    hashed_password = get_password_hash(user.password)
+    if hashed_password is None:
+        hashed_password = get_password_hash(user.password)
     db_user = User(username=user.username, hashed_password=hashed_password, role=user.role)
     db.add(db_user)
     db.commit()
@@ -68,6 +71,27 @@ def create_user(db: Session, user: UserCreate) -> UserRead:
     return UserRead.model_validate(db_user)
 
 
+async def create_user_async(db: Session, user: UserCreate) -> UserRead:
+    """
+    Creates a new user like create_user, hashing the password on the password hashing pool.
+
+    The username is checked first, so no hash is computed for a taken username.
+
+    Args:
+        db (Session): SQLAlchemy database session for performing operations.
+        user (UserCreate): Pydantic model containing username, password, and role.
+
+    Returns:
+        UserRead: Pydantic model representing the newly created user.
+
+    Raises:
+        HTTPException: If the username is already taken (HTTP 400).
+    """
+    if get_user_by_username(db, user.username):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Username already taken")
+    return create_user(db, user, hashed_password=await get_password_hash_async(user.password))
+
+
 def get_all_users(db: Session, skip: int = 0, limit: int = 100) -> list[User]:
     """
     Fetches a list of users from the database with pagination.
@@ -85,32 +109,67 @@ def get_all_users(db: Session, skip: int = 0, limit: int = 100) -> list[User]:
 
 def update_user(db: Session, user_id: uuid.UUID, user_update_data: dict) -> User | None:
     """
-    Updates a user's information in the database.
+    Updates a user's information in the database and drops the user from the principal cache.
+
+    Changing the role or the password increments the user's token version, which revokes the
+    user's existing access tokens for claims-only authorization.
 
     Args:
         db (Session): SQLAlchemy database session for performing updates.
         user_id (uuid.UUID): UUID of the user to update.
-        user_update_data (dict): Dictionary containing fields to update (username, password, role).
+        user_update_data (dict): Dictionary containing fields to update (username, password, role),
+            or an already computed hashed_password instead of password.
 
     Returns:
         User | None: Updated User object if user exists, otherwise None.
     """
     db_user = db.query(User).filter(User.id == user_id).first()
     if db_user:
+        revoke_tokens = False
         for key, value in user_update_data.items():
             if key == "password":
                 db_user.hashed_password = get_password_hash(value)
-            elif key in {"username", "role"}:
-                setattr(db_user, key, value)
+                revoke_tokens = True
+            elif key == "hashed_password":
+                db_user.hashed_password = value
+                revoke_tokens = True
+            elif key == "role":
+                revoke_tokens = revoke_tokens or value != db_user.role
+                db_user.role = value
+            elif key == "username":
+                db_user.username = value
+        if revoke_tokens:
+            # Tokens carrying the old role or issued before the password change stop validating
+            db_user.token_version += 1
         db.commit()
         db.refresh(db_user)
+        # Authenticated requests must see the new role/username right away
+        user_cache.invalidate(user_id)
         return db_user
     return None
 
 
+async def update_user_async(db: Session, user_id: uuid.UUID, user_update_data: dict) -> User | None:
+    """
+    Updates a user like update_user, hashing a new password on the password hashing pool.
+
+    Args:
+        db (Session): SQLAlchemy database session for performing updates.
+        user_id (uuid.UUID): UUID of the user to update.
+        user_update_data (dict): Dictionary containing fields to update (username, password, role).
+
+    Returns:
+        User | None: Updated User object if user exists, otherwise None.
+    """
+    if "password" in user_update_data:
+        user_update_data = dict(user_update_data)
+        user_update_data["hashed_password"] = await get_password_hash_async(user_update_data.pop("password"))
+    return update_user(db, user_id, user_update_data)
+
+
 def delete_user(db: Session, user_id: uuid.UUID) -> bool:
     """
-    Deletes a user from the database.
+    Deletes a user from the database and drops the user from the principal cache.
 
     Args:
         db (Session): SQLAlchemy database session for performing deletion.
@@ -123,5 +182,6 @@ def delete_user(db: Session, user_id: uuid.UUID) -> bool:
     if db_user:
         db.delete(db_user)
         db.commit()
+        user_cache.invalidate(user_id)
         return True
     return False
@@ -1,15 +1,94 @@
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
+from threading import Lock
 import jwt
 from jwt import PyJWTError
 from app.config.settings import settings
+from app.utils.metrics import metrics
 
 """
 Module: JWT.py
 Description: Provides utility functions for creating and decoding JSON Web Tokens (JWT)
 for user authentication and authorization.
+
+A client presents the same token on every request until it expires, so decoded payloads are
+kept in a bounded LRU cache keyed by the SHA-256 digest of the token. A hit skips the HMAC
+verification and claim parsing; an entry is only served until the token's "exp", after which
+the token is decoded (and rejected) again. Only successfully verified tokens are cached.
 """
 
 
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of verified token payloads.
+
+    Attributes:
+        max_size (int): Maximum number of cached tokens; 0 disables the cache.
+        size (int): Current number of cached tokens.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lock = Lock()
+        # digest -> (exp as UNIX seconds or None, payload)
+        self._entries: OrderedDict[bytes, tuple[float | None, dict]] = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    def get(self, digest: bytes) -> dict | None:
+        """
+        Returns the payload of a cached, unexpired token.
+
+        Args:
+            digest (bytes): SHA-256 digest of the token.
+
+        Returns:
+            dict | None: A copy of the payload, or None if the token is not cached or has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and (entry[0] is None or entry[0] > time.time()):
+                self._entries.move_to_end(digest)
+                metrics.increment("jwt_cache.hits")
+                return dict(entry[1])
+            if entry is not None:
+                del self._entries[digest]
+        metrics.increment("jwt_cache.misses")
+        return None
+
+    def put(self, digest: bytes, payload: dict) -> None:
+        """
+        Caches the payload of a verified token until its "exp" claim.
+
+        Args:
+            digest (bytes): SHA-256 digest of the token.
+            payload (dict): The verified payload.
+        """
+        if self.max_size <= 0:
+            return
+        exp = payload.get("exp")
+        with self._lock:
+            self._entries[digest] = (None if exp is None else float(exp), dict(payload))
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drops every cached token.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+# Process-wide cache used by decode_access_token
+verified_tokens = VerifiedTokenCache(settings.JWT_DECODE_CACHE_SIZE)
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """
     Creates a JWT access token with a given payload and expiration.
@@ -37,14 +116,21 @@ def decode_access_token(token: str) -> dict | None:
     """
     Decodes a JWT access token and returns its payload.
 
+    Tokens verified before are served from the verified token cache until they expire.
+
     Args:
         token (str): The JWT token string to decode.
 
     Returns:
         dict | None: The decoded payload if valid; None if the token is invalid or expired.
     """
+    digest = hashlib.sha256(token.encode()).digest()
+    payload = verified_tokens.get(digest)
+    if payload is not None:
+        return payload
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except PyJWTError:
         return None
+    verified_tokens.put(digest, payload)
+    return payload
@@ -0,0 +1,126 @@
+import struct
+import uuid
+from datetime import datetime
+from uuid import UUID
+from app.api.v1.schemas.control_unit_schema import DeviceData
+
+"""
+Module: device_payload.py
+Description: Encodes and decodes the compact binary control unit upload format.
+Sensor unit IDs are sent once in a dictionary header and readings refer to them
+by index, so each reading costs 10 bytes instead of a JSON object with a 36-char UUID.
+
+Layout (little-endian):
+    magic            4s   b"CUD1"
+    control_unit_id  16s  UUID bytes
+    sensor_count     H    number of sensor IDs in the dictionary
+    sensor_ids       16s  x sensor_count
+    group_count      I    number of timestamp groups
+    per group:
+        timestamp    q    UNIX timestamp in seconds
+        reading_count H
+        readings     (H sensor index, f temperature, f humidity) x reading_count
+
+Temperature and humidity are float32, which keeps about 7 significant digits.
+"""
+
+MEDIA_TYPE = "application/x-device-data"
+MAGIC = b"CUD1"
+
+_HEADER = struct.Struct("<4s16sH")
+_GROUP_COUNT = struct.Struct("<I")
+_GROUP = struct.Struct("<qH")
+_READING = struct.Struct("<Hff")
+_UUID_SIZE = 16
+
+
+class DevicePayloadError(ValueError):
+    """
+    Raised when a binary payload is truncated or malformed.
+    """
+
+
+def encode_device_data(data: DeviceData) -> bytes:
+    """
+    Encodes grouped readings into the binary upload format.
+
+    Args:
+        data (DeviceData): Grouped readings to encode.
+
+    Returns:
+        bytes: The encoded payload.
+    """
+    sensor_index: dict[UUID, int] = {}
+    for group in data.timestamp_groups:
+        for unit in group.sensor_units:
+            sensor_index.setdefault(unit.sensor_unit_id, len(sensor_index))
+
+    parts = [_HEADER.pack(MAGIC, data.control_unit_id.bytes, len(sensor_index))]
+    parts.extend(sensor_id.bytes for sensor_id in sensor_index)
+    parts.append(_GROUP_COUNT.pack(len(data.timestamp_groups)))
+    for group in data.timestamp_groups:
+        parts.append(_GROUP.pack(group.timestamp, len(group.sensor_units)))
+        for unit in group.sensor_units:
+            parts.append(_READING.pack(sensor_index[unit.sensor_unit_id], unit.temperature, unit.humidity))
+    return b"".join(parts)
+
+
+def decode_device_payload(payload: bytes) -> tuple[UUID, list[tuple]]:
+    """
+    Decodes a binary upload straight into reading row tuples.
+
+    Rows are ordered like control_unit_service.READING_COLUMNS
+    (id, sensor_unit_id, control_unit_id, timestamp, humidity, temperature);
+    no per-reading Pydantic models are built.
+
+    Args:
+        payload (bytes): The raw request body.
+
+    Returns:
+        tuple[UUID, list[tuple]]: The control unit ID and the flattened rows.
+
+    Raises:
+        DevicePayloadError: If the payload is truncated, has a bad magic value,
+            or references an unknown sensor index.
+    """
+    view = memoryview(payload)
+    try:
+        magic, control_unit_bytes, sensor_count = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise DevicePayloadError("Unknown payload format")
+        offset = _HEADER.size
+        if offset + sensor_count * _UUID_SIZE > len(view):
+            raise DevicePayloadError("Payload is truncated")
+        sensor_ids = []
+        for _ in range(sensor_count):
+            end = offset + _UUID_SIZE
+            sensor_ids.append(UUID(bytes=bytes(view[offset:end])))
+            offset = end
+        (group_count,) = _GROUP_COUNT.unpack_from(view, offset)
+        offset += _GROUP_COUNT.size
+
+        control_unit_id = UUID(bytes=control_unit_bytes)
+        rows = []
+        append = rows.append
+        uuid4 = uuid.uuid4
+        for _ in range(group_count):
+            timestamp, reading_count = _GROUP.unpack_from(view, offset)
+            offset += _GROUP.size
+            end = offset + reading_count * _READING.size
+            if end > len(view):
+                raise DevicePayloadError("Payload is truncated")
+            ts = datetime.fromtimestamp(timestamp)
+            for index, temperature, humidity in _READING.iter_unpack(view[offset:end]):
+                append((uuid4(), sensor_ids[index], control_unit_id, ts, humidity, temperature))
+            offset = end
+    except struct.error:
+        raise DevicePayloadError("Payload is truncated")
+    except IndexError:
+        raise DevicePayloadError("Reading references an unknown sensor index")
+    except DevicePayloadError:
+        raise
+    except (OverflowError, OSError, ValueError):
+        raise DevicePayloadError("Timestamp is out of range")
+    if offset != len(view):
+        raise DevicePayloadError("Unexpected trailing bytes")
+    return control_unit_id, rows
@@ -0,0 +1,55 @@
+from typing import Sequence
+
+"""
+Module: downsampling.py
+Description: Largest-Triangle-Three-Buckets (LTTB) downsampling for time series charts.
+LTTB keeps the first and last points and, from each of the remaining buckets, the point
+forming the largest triangle with the previously kept point and the average of the next
+bucket, which preserves peaks and troughs far better than taking every n-th point.
+"""
+
+
+def lttb_indices(x: Sequence[float], y: Sequence[float], threshold: int) -> list[int]:
+    """
+    Selects the indices of at most `threshold` points that best preserve the shape of a series.
+
+    Args:
+        x (Sequence[float]): Ascending x values (e.g. UNIX timestamps).
+        y (Sequence[float]): y values, same length as x.
+        threshold (int): Maximum number of points to keep. 1 keeps the first point, 2 the first and last;
+            values below 1 keep the series unchanged.
+
+    Returns:
+        list[int]: Ascending indices into x/y of the points to keep.
+    """
+    length = len(x)
+    if threshold < 1 or length <= threshold:
+        return list(range(length))
+    if threshold < 3:
+        return [0, length - 1][:threshold]
+
+    indices = [0]
+    bucket_size = (length - 2) / (threshold - 2)
+    selected = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        # Average of the next bucket (the last point for the final bucket)
+        next_start, next_end = end, min(int((bucket + 2) * bucket_size) + 1, length)
+        if next_start >= next_end:
+            next_start, next_end = length - 1, length
+        count = next_end - next_start
+        avg_x = sum(x[next_start:next_end]) / count
+        avg_y = sum(y[next_start:next_end]) / count
+
+        ax, ay = x[selected], y[selected]
+        best_area, best_index = -1.0, start
+        for i in range(start, end):
+            area = abs((ax - avg_x) * (y[i] - ay) - (ax - x[i]) * (avg_y - ay))
+            if area > best_area:
+                best_area, best_index = area, i
+        indices.append(best_index)
+        selected = best_index
+    indices.append(length - 1)
+    return indices
@@ -1,14 +1,43 @@
+import asyncio
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from passlib.context import CryptContext
+from app.config.settings import settings
+from app.utils.metrics import metrics
 
 """
 Module: hash.py
 Description: Provides utility functions for hashing and verifying passwords
 using the bcrypt algorithm through Passlib.
+
+Each bcrypt call takes a few hundred milliseconds of CPU. The async variants run it on a
+dedicated thread pool of PASSWORD_HASH_WORKERS threads (bcrypt releases the GIL), so the
+event loop keeps serving other requests during a burst of logins, and at most that many
+hashes run at once; further calls wait in the pool's queue. Queue wait and hashing time
+are recorded as metrics. Password verifications can additionally be capped: once
+LOGIN_MAX_PENDING_VERIFICATIONS are running or queued, further ones fail fast with
+PasswordHashPoolBusy instead of growing the queue.
+
+verify_dummy_password_async performs a full verification against a hash computed at import
+time, so checking a password for an unknown user costs the same time as for a real one.
 """
 
 # Password hashing context with bcrypt
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Dedicated pool so password hashing neither blocks the event loop nor exhausts the shared threadpool
+_hash_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+_pending_lock = Lock()
+_pending = 0
+
+
+class PasswordHashPoolBusy(Exception):
+    """
+    Raised when a password verification would exceed LOGIN_MAX_PENDING_VERIFICATIONS.
+    """
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -35,3 +64,111 @@ def get_password_hash(password: str) -> str:
         str: The resulting hashed password.
     """
     return pwd_context.hash(password)
+
+
+# Hash of a random password, computed at import so the first unknown-username login is not slower than the rest
+_DUMMY_PASSWORD_HASH = get_password_hash(secrets.token_urlsafe(32))
+
+
+def verify_dummy_password(plain_password: str) -> bool:
+    """
+    Verifies a password against a random hash, taking as long as verify_password.
+
+    Args:
+        plain_password (str): The plain-text password that was submitted.
+
+    Returns:
+        bool: Always False.
+    """
+    verify_password(plain_password, _DUMMY_PASSWORD_HASH)
+    return False
+
+
+def _track_pending(delta: int, limit: int | None = None) -> None:
+    global _pending
+    with _pending_lock:
+        if limit is not None and _pending + delta > limit:
+            metrics.increment("password_hash.rejected")
+            raise PasswordHashPoolBusy()
+        _pending += delta
+        metrics.set_gauge("password_hash.pending", _pending)
+
+
+async def _run_on_hash_pool(func, *args, max_pending: int | None = None):
+    """
+    Runs a password function on the hashing pool and records queue wait and run time.
+
+    A call counts as pending from submission until its pool job finishes or is cancelled,
+    so cancelled callers always give their slot under max_pending back.
+
+    Raises:
+        PasswordHashPoolBusy: If max_pending calls are already running or queued.
+    """
+    _track_pending(1, max_pending)
+    submitted = time.perf_counter()
+
+    def run():
+        started = time.perf_counter()
+        metrics.observe("password_hash.queue_wait_seconds", started - submitted)
+        try:
+            return func(*args)
+        finally:
+            metrics.observe("password_hash.run_seconds", time.perf_counter() - started)
+
+    try:
+        future = _hash_executor.submit(run)
+    except RuntimeError:
+        # The pool has been shut down
+        _track_pending(-1)
+        raise
+    # Also runs when a queued call is cancelled before run() starts
+    future.add_done_callback(lambda _: _track_pending(-1))
+    return await asyncio.wrap_future(future)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verifies a password like verify_password, on the password hashing pool.
+
+    Args:
+        plain_password (str): The plain-text password to verify.
+        hashed_password (str): The hashed password to compare against.
+
+    Returns:
+        bool: True if the password matches the hash; False otherwise.
+
+    Raises:
+        PasswordHashPoolBusy: If LOGIN_MAX_PENDING_VERIFICATIONS verifications are already running or queued.
+    """
+    limit = settings.LOGIN_MAX_PENDING_VERIFICATIONS
+    return await _run_on_hash_pool(verify_password, plain_password, hashed_password, max_pending=limit)
+
+
+async def verify_dummy_password_async(plain_password: str) -> bool:
+    """
+    Verifies a password like verify_dummy_password, on the password hashing pool.
+
+    Args:
+        plain_password (str): The plain-text password that was submitted.
+
+    Returns:
+        bool: Always False.
+
+    Raises:
+        PasswordHashPoolBusy: If LOGIN_MAX_PENDING_VERIFICATIONS verifications are already running or queued.
+    """
+    limit = settings.LOGIN_MAX_PENDING_VERIFICATIONS
+    return await _run_on_hash_pool(verify_dummy_password, plain_password, max_pending=limit)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hashes a password like get_password_hash, on the password hashing pool.
+
+    Args:
+        password (str): The plain-text password to hash.
+
+    Returns:
+        str: The resulting hashed password.
+    """
+    return await _run_on_hash_pool(get_password_hash, password)
@@ -0,0 +1,92 @@
+from threading import Lock
+
+"""
+Module: metrics.py
+Description: Provides a minimal thread-safe, in-process metrics registry with
+counters, gauges and summaries (count/sum/max/last), exposed by the /metrics endpoint.
+"""
+
+
+class MetricsRegistry:
+    """
+    Thread-safe store for process-local metrics.
+
+    Attributes:
+        _counters (dict[str, float]): Monotonically increasing counters.
+        _gauges (dict[str, float]): Point-in-time values.
+        _summaries (dict[str, dict]): Aggregated observations (count, sum, max, last).
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, float] = {}
+        self._summaries: dict[str, dict] = {}
+
+    def increment(self, name: str, amount: float = 1) -> None:
+        """
+        Increments a counter.
+
+        Args:
+            name (str): Metric name.
+            amount (float): Amount to add. Defaults to 1.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """
+        Sets a gauge to the given value.
+
+        Args:
+            name (str): Metric name.
+            value (float): Current value.
+        """
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, value: float) -> None:
+        """
+        Records an observation in a summary.
+
+        Args:
+            name (str): Metric name.
+            value (float): Observed value.
+        """
+        with self._lock:
+            summary = self._summaries.get(name)
+            if summary is None:
+                self._summaries[name] = {"count": 1, "sum": value, "max": value, "last": value}
+                return
+            summary["count"] += 1
+            summary["sum"] += value
+            summary["last"] = value
+            if value > summary["max"]:
+                summary["max"] = value
+
+    def snapshot(self) -> dict:
+        """
+        Returns a copy of all metrics.
+
+        Returns:
+            dict: Counters, gauges and summaries keyed by metric name.
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "summaries": {name: dict(summary) for name, summary in self._summaries.items()},
+            }
+
+    def reset(self) -> None:
+        """
+        Clears all metrics.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._summaries.clear()
+
+
+# Process-wide registry
+metrics = MetricsRegistry()
@@ -0,0 +1,55 @@
+from typing import AsyncIterable, AsyncIterator
+
+"""
+Module: ndjson.py
+Description: Provides incremental parsing of newline-delimited JSON (NDJSON) request
+bodies, yielding one line at a time so large uploads are never buffered whole.
+"""
+
+
+class NDJSONLineTooLong(Exception):
+    """
+    Raised when a single NDJSON line exceeds the configured maximum size.
+
+    Attributes:
+        line_number (int): 1-based number of the offending line.
+    """
+
+    def __init__(self, line_number: int):
+        super().__init__(f"Line {line_number} exceeds the maximum line size")
+        self.line_number = line_number
+
+
+async def iter_ndjson_lines(chunks: AsyncIterable[bytes], max_line_bytes: int) -> AsyncIterator[tuple[int, bytes]]:
+    """
+    Splits a stream of byte chunks into non-empty NDJSON lines.
+
+    Args:
+        chunks (AsyncIterable[bytes]): Raw body chunks, e.g. from Request.stream().
+        max_line_bytes (int): Maximum size of a single line in bytes.
+
+    Yields:
+        tuple[int, bytes]: The 1-based line number and the stripped line content.
+
+    Raises:
+        NDJSONLineTooLong: If a line grows beyond max_line_bytes.
+    """
+    buffer = bytearray()
+    line_number = 0
+    async for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line_number += 1
+            if end - start > max_line_bytes:
+                raise NDJSONLineTooLong(line_number)
+            line = bytes(buffer[start:end]).strip()
+            if line:
+                yield line_number, line
+            start = end + 1
+        del buffer[:start]
+        if len(buffer) > max_line_bytes:
+            raise NDJSONLineTooLong(line_number + 1)
+    line = bytes(buffer).strip()
+    if line:
+        yield line_number + 1, line
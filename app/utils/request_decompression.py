@@ -0,0 +1,163 @@
+import json
+import zlib
+from typing import Iterator
+import zstandard
+from fastapi import HTTPException, status
+
+"""
+Module: request_decompression.py
+Description: ASGI middleware that transparently decompresses request bodies sent with
+`Content-Encoding: gzip` or `zstd`. Decompression is streamed chunk by chunk as the
+application reads the body, and aborts with 413 once the decompressed size exceeds
+the configured limit, which protects the ingest routes against zip bombs.
+"""
+
+# Maximum decompressed bytes handed to the application per receive() call
+OUTPUT_CHUNK_SIZE = 64 * 1024
+
+# zstd has no output cap per call, so compressed input is fed in small slices;
+# at the format's worst-case ratio (~32k:1) one slice inflates to about 2 MiB
+ZSTD_INPUT_SLICE = 64
+
+SUPPORTED_ENCODINGS = ("gzip", "x-gzip", "zstd")
+
+
+def _gzip_chunks(decompressor, data: bytes) -> Iterator[bytes]:
+    """
+    Yields the decompressed output of one gzip input chunk in bounded pieces.
+    """
+    while data and not decompressor.eof:
+        output = decompressor.decompress(data, OUTPUT_CHUNK_SIZE)
+        data = decompressor.unconsumed_tail
+        if output:
+            yield output
+
+
+def _zstd_chunks(decompressor, data: bytes) -> Iterator[bytes]:
+    """
+    Yields the decompressed output of one zstd input chunk, feeding it in small slices.
+    """
+    for start in range(0, len(data), ZSTD_INPUT_SLICE):
+        end = start + ZSTD_INPUT_SLICE
+        output = decompressor.decompress(data[start:end])
+        if output:
+            yield output
+
+
+class _DecompressingReceive:
+    """
+    Wraps an ASGI receive callable and returns decompressed http.request messages.
+
+    Attributes:
+        max_size (int): Maximum number of decompressed bytes allowed for the body.
+        received (int): Number of decompressed bytes handed out so far.
+    """
+
+    def __init__(self, receive, encoding: str, max_size: int):
+        self._receive = receive
+        self.max_size = max_size
+        self.received = 0
+        self._chunks: Iterator[bytes] | None = None
+        self._body_complete = False
+        if encoding == "zstd":
+            self._decompressor = zstandard.ZstdDecompressor().decompressobj()
+            self._split = _zstd_chunks
+        else:
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            self._split = _gzip_chunks
+
+    def _next_output(self) -> bytes | None:
+        try:
+            return next(self._chunks, None)
+        except (zlib.error, zstandard.ZstdError):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid compressed request body")
+
+    async def __call__(self) -> dict:
+        while True:
+            if self._chunks is not None:
+                output = self._next_output()
+                if output is not None:
+                    self.received += len(output)
+                    if self.received > self.max_size:
+                        raise HTTPException(
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail=f"Decompressed request body exceeds {self.max_size} bytes",
+                        )
+                    return {"type": "http.request", "body": output, "more_body": True}
+                self._chunks = None
+                if self._body_complete:
+                    if not self._decompressor.eof:
+                        raise HTTPException(
+                            status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="Truncated compressed request body",
+                        )
+                    return {"type": "http.request", "body": b"", "more_body": False}
+
+            message = await self._receive()
+            if message["type"] != "http.request":
+                return message
+            self._body_complete = not message.get("more_body", False)
+            self._chunks = self._split(self._decompressor, message.get("body", b""))
+
+
+class RequestDecompressionMiddleware:
+    """
+    Decompresses gzip/zstd request bodies on selected path prefixes.
+
+    Attributes:
+        app: The wrapped ASGI application.
+        max_size (int): Maximum decompressed body size in bytes.
+        path_prefixes (tuple[str, ...]): Request paths the middleware applies to.
+    """
+
+    def __init__(self, app, max_size: int, path_prefixes: list[str] | tuple[str, ...]):
+        self.app = app
+        self.max_size = max_size
+        self.path_prefixes = tuple(path_prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        headers = scope["headers"]
+        encoding = next(
+            (value.decode("latin-1").strip().lower() for key, value in headers if key == b"content-encoding"),
+            "",
+        )
+        if encoding in ("", "identity"):
+            await self.app(scope, receive, send)
+            return
+        if encoding not in SUPPORTED_ENCODINGS:
+            await self._send_error(send, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, f"Unsupported Content-Encoding: {encoding}")
+            return
+
+        # The application sees a plain body, so the encoding and compressed length no longer apply
+        stripped = (b"content-encoding", b"content-length")
+        scope = dict(scope, headers=[(key, value) for key, value in headers if key not in stripped])
+        response_started = False
+
+        async def tracking_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, _DecompressingReceive(receive, encoding, self.max_size), tracking_send)
+        except HTTPException as e:
+            if response_started:
+                raise
+            await self._send_error(send, e.status_code, e.detail)
+
+    @staticmethod
+    async def _send_error(send, status_code: int, detail: str) -> None:
+        body = json.dumps({"detail": detail}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
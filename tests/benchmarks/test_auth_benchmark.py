@@ -0,0 +1,73 @@
+import asyncio
+import time
+import httpx
+import pytest
+from uuid import uuid4
+from app.main import app
+from app.services import auth_service
+from app.services.login_limiter import login_limiter
+from app.utils.hash import verify_password
+
+pytestmark = pytest.mark.benchmark
+
+LOGINS = 12
+PROBE_INTERVAL_SECONDS = 0.01
+
+
+async def _blocking_verify(plain_password: str, hashed_password: str) -> bool:
+    """
+    Baseline: bcrypt verification called directly on the event loop, as before the hashing pool.
+    """
+    return verify_password(plain_password, hashed_password)
+
+
+async def _login_storm(username: str) -> tuple[list[int], list[float]]:
+    """
+    Fires LOGINS concurrent logins while probing /health, and returns the login status codes
+    and the gaps between consecutive probe completions (the probe's sleep plus any time the
+    event loop could not serve it).
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        completed = [time.perf_counter()]
+        storm_done = asyncio.Event()
+
+        async def probe():
+            while not storm_done.is_set():
+                await client.get("/health")
+                completed.append(time.perf_counter())
+                await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+
+        probing = asyncio.create_task(probe())
+        await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+        responses = await asyncio.gather(
+            *(client.post("/api/v1/auth/login", json={"username": username, "password": "1234"}) for _ in range(LOGINS))
+        )
+        storm_done.set()
+        await probing
+        return [response.status_code for response in responses], [b - a for a, b in zip(completed, completed[1:])]
+
+
+def test_health_latency_during_login_storm(client, monkeypatch):
+    """
+    Purpose: Compare the responsiveness to other requests during a burst of logins with bcrypt on and off the event loop.
+    Scenario: Run LOGINS concurrent logins while /health is probed, first with verification on the event loop
+              (baseline), then on the password hashing pool.
+    Expected: All logins succeed; the longest gap between /health responses in each mode is printed.
+    """
+    username = f"storm_{uuid4()}"
+    client.post("/api/v1/auth/register", json={"username": username, "password": "1234", "role": "customer"})
+    # The storm measures hashing, not the login limiter
+    monkeypatch.setattr(login_limiter, "max_per_username", 2 * LOGINS)
+    monkeypatch.setattr(login_limiter, "max_per_ip", 1_000_000)
+
+    with monkeypatch.context() as patched:
+        patched.setattr(auth_service, "verify_password_async", _blocking_verify)
+        blocking_status, blocking_gaps = asyncio.run(_login_storm(username))
+    pooled_status, pooled_gaps = asyncio.run(_login_storm(username))
+
+    print(
+        f"\nlongest gap between /health responses during {LOGINS} logins: on event loop {max(blocking_gaps) * 1000:.0f} ms "
+        f"({len(blocking_gaps)} probes), hashing pool {max(pooled_gaps) * 1000:.0f} ms ({len(pooled_gaps)} probes)"
+    )
+    assert blocking_status == pooled_status == [200] * LOGINS
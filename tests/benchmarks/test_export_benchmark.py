@@ -0,0 +1,83 @@
+import json
+import time
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from uuid import uuid4
+from datetime import datetime, timedelta
+from app.db.connection import Base
+from app.models.control_unit_model import ControlUnitData
+from app.services.control_unit_service import save_readings
+from app.services.export_service import iter_reading_batches, stream_readings
+from app.api.v1.schemas.control_unit_schema import ControlUnitDataRead
+
+pytestmark = pytest.mark.benchmark
+
+SENSORS = 20
+READINGS_PER_SENSOR = 1_000
+BATCH_SIZE = 65_536
+
+
+# -----------------------------
+# Fixtures
+# -----------------------------
+@pytest.fixture(scope="module")
+def session_factory(tmp_path_factory):
+    """
+    Provides a session factory for a file-based SQLite database holding SENSORS x READINGS_PER_SENSOR readings.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('export') / 'export.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    start = datetime(2026, 10, 1)
+    control_unit_id = uuid4()
+    with factory() as db:
+        for _ in range(SENSORS):
+            sensor_id = uuid4()
+            save_readings(
+                db,
+                [
+                    (uuid4(), sensor_id, control_unit_id, start + timedelta(minutes=i), 60.0 + i % 7, 4.0 + (i % 50) / 10)
+                    for i in range(READINGS_PER_SENSOR)
+                ],
+            )
+    yield factory
+    engine.dispose()
+
+
+def _json_listing(session_factory) -> bytes:
+    """
+    Baseline: the JSON listing path (ORM objects validated into ControlUnitDataRead, then serialised).
+    """
+    with session_factory() as db:
+        items = db.query(ControlUnitData).order_by(ControlUnitData.timestamp, ControlUnitData.id).all()
+        rows = [ControlUnitDataRead.model_validate(item, from_attributes=True).model_dump(mode="json") for item in items]
+        return json.dumps(rows).encode()
+
+
+def _parquet_export(session_factory) -> bytes:
+    return b"".join(stream_readings(iter_reading_batches(session_factory, BATCH_SIZE), "parquet", "zstd"))
+
+
+# -----------------------------
+# Benchmarks
+# -----------------------------
+def test_parquet_export_smaller_and_faster_than_json(session_factory):
+    """
+    Purpose: Compare the Parquet export against the JSON listing.
+    Scenario: Produce both representations of the same 20000 readings.
+    Expected: The Parquet file is at least 3x smaller; generation timings are printed.
+    """
+    started = time.perf_counter()
+    json_body = _json_listing(session_factory)
+    json_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    parquet_body = _parquet_export(session_factory)
+    parquet_seconds = time.perf_counter() - started
+
+    print(
+        f"\njson: {len(json_body)} bytes in {json_seconds * 1000:.1f} ms, "
+        f"parquet: {len(parquet_body)} bytes in {parquet_seconds * 1000:.1f} ms"
+    )
+    assert len(parquet_body) * 3 < len(json_body)
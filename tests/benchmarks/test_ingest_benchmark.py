@@ -0,0 +1,142 @@
+import time
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from uuid import uuid4
+from datetime import datetime
+from app.db.connection import Base
+from app.models.control_unit_model import ControlUnitData
+from app.services.control_unit_service import flatten_device_data, save_device_data, get_all_control_unit_data
+from app.api.v1.schemas.control_unit_schema import (
+    ControlUnitDataBase,
+    DeviceData,
+    TimestampGroup,
+    SensorUnitReading,
+)
+
+pytestmark = pytest.mark.benchmark
+
+GROUPS = 50
+SENSORS_PER_GROUP = 40
+
+# Readings per request for the per-reading construction micro-benchmark
+MICRO_GROUPS = 250
+
+
+# -----------------------------
+# Fixtures
+# -----------------------------
+@pytest.fixture(scope="function")
+def db_session():
+    """
+    Provides an in-memory SQLite session for ingest benchmarks.
+    """
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+def make_device_data(groups: int = GROUPS) -> DeviceData:
+    """
+    Returns a DeviceData payload with `groups` timestamp groups of SENSORS_PER_GROUP readings each.
+    """
+    sensor_ids = [uuid4() for _ in range(SENSORS_PER_GROUP)]
+    start = int(datetime.now().timestamp())
+    return DeviceData(
+        control_unit_id=uuid4(),
+        timestamp_groups=[
+            TimestampGroup(
+                timestamp=start + i * 60,
+                sensor_units=[
+                    SensorUnitReading(sensor_unit_id=sensor_id, temperature=4.0 + i * 0.01, humidity=60.0)
+                    for sensor_id in sensor_ids
+                ],
+            )
+            for i in range(groups)
+        ],
+    )
+
+
+def _revalidate_per_reading(data) -> list[ControlUnitData]:
+    """
+    Baseline: the original per-reading construction, re-validating every reading as a
+    ControlUnitDataBase and dumping it into an ORM object.
+    """
+    items = []
+    for group in data.timestamp_groups:
+        ts = datetime.fromtimestamp(group.timestamp)
+        for unit in group.sensor_units:
+            validated = ControlUnitDataBase(
+                sensor_unit_id=unit.sensor_unit_id,
+                control_unit_id=data.control_unit_id,
+                timestamp=ts,
+                humidity={"value": unit.humidity},
+                temperature={"value": unit.temperature},
+            )
+            items.append(ControlUnitData(**validated.model_dump()))
+    return items
+
+
+def _save_device_data_per_object(data, db):
+    """
+    Baseline: the original per-reading path (Pydantic model + ORM object + db.add per reading).
+    """
+    db.add_all(_revalidate_per_reading(data))
+    db.commit()
+
+
+# -----------------------------
+# Benchmarks
+# -----------------------------
+def test_bulk_ingest_faster_than_per_object(db_session):
+    """
+    Purpose: Compare the bulk save_device_data path against the original per-object path.
+    Scenario: Ingest an equally sized 2000-reading payload with each implementation.
+    Expected: Both store every reading; timings are printed (the bulk path is typically much faster).
+    """
+    total = GROUPS * SENSORS_PER_GROUP
+    baseline_data, bulk_data = make_device_data(), make_device_data()
+
+    started = time.perf_counter()
+    _save_device_data_per_object(baseline_data, db_session)
+    per_object_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    saved = save_device_data(bulk_data, db_session)
+    bulk_seconds = time.perf_counter() - started
+
+    print(f"\nper-object: {per_object_seconds * 1000:.1f} ms, bulk: {bulk_seconds * 1000:.1f} ms for {total} readings")
+    assert saved == total
+    assert len(get_all_control_unit_data(db_session)) == 2 * total
+
+
+def test_trusted_flattening_per_reading_cost():
+    """
+    Purpose: Measure the per-reading cost of turning an already validated DeviceData into insertable rows.
+    Scenario: Build rows for a 10000-reading request by re-validating each reading (ControlUnitDataBase
+              + model_dump + ORM object) and through the trusted flatten_device_data path; best of 3 runs each.
+    Expected: Both produce one row per reading; the per-reading cost of both paths is printed.
+    """
+    data = make_device_data(MICRO_GROUPS)
+    total = MICRO_GROUPS * SENSORS_PER_GROUP
+
+    def best_of(func, runs: int = 3) -> float:
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            result = func(data)
+            timings.append(time.perf_counter() - started)
+            assert len(result) == total
+        return min(timings)
+
+    revalidated_seconds = best_of(_revalidate_per_reading)
+    trusted_seconds = best_of(flatten_device_data)
+
+    print(
+        f"\nper reading at {total} readings: re-validated {revalidated_seconds / total * 1e6:.2f} us, "
+        f"trusted {trusted_seconds / total * 1e6:.2f} us"
+    )
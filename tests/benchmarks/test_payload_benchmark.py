@@ -0,0 +1,64 @@
+import time
+import pytest
+from uuid import uuid4
+from datetime import datetime
+from app.services.control_unit_service import flatten_device_data
+from app.api.v1.schemas.control_unit_schema import DeviceData, TimestampGroup, SensorUnitReading
+from app.utils.device_payload import encode_device_data, decode_device_payload
+
+pytestmark = pytest.mark.benchmark
+
+GROUPS = 60
+SENSORS_PER_GROUP = 30
+ROUNDS = 5
+
+
+@pytest.fixture
+def device_data():
+    """
+    Returns a DeviceData payload with GROUPS timestamp groups of SENSORS_PER_GROUP readings each.
+    """
+    sensor_ids = [uuid4() for _ in range(SENSORS_PER_GROUP)]
+    start = int(datetime.now().timestamp())
+    return DeviceData(
+        control_unit_id=uuid4(),
+        timestamp_groups=[
+            TimestampGroup(
+                timestamp=start + i * 60,
+                sensor_units=[SensorUnitReading(sensor_unit_id=s, temperature=4.25, humidity=61.5) for s in sensor_ids],
+            )
+            for i in range(GROUPS)
+        ],
+    )
+
+
+def best_of(func, payload) -> float:
+    """
+    Returns the fastest of ROUNDS runs of func(payload), in seconds.
+    """
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        func(payload)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def test_binary_payload_smaller_and_faster_than_json(device_data):
+    """
+    Purpose: Compare the binary upload format with JSON for size and parse-to-rows time.
+    Scenario: Encode the same readings both ways; parse JSON via DeviceData + flatten and binary via the decoder.
+    Expected: Binary is at least 4x smaller; parse timings are printed.
+    """
+    json_payload = device_data.model_dump_json().encode()
+    binary_payload = encode_device_data(device_data)
+
+    json_seconds = best_of(lambda p: flatten_device_data(DeviceData.model_validate_json(p)), json_payload)
+    binary_seconds = best_of(decode_device_payload, binary_payload)
+
+    print(
+        f"\njson: {len(json_payload)} bytes, {json_seconds * 1000:.2f} ms; "
+        f"binary: {len(binary_payload)} bytes, {binary_seconds * 1000:.2f} ms "
+        f"for {GROUPS * SENSORS_PER_GROUP} readings"
+    )
+    assert len(binary_payload) * 4 < len(json_payload)
@@ -1,6 +1,14 @@
 import pytest
+from typing import Annotated
+from uuid import uuid4
+from fastapi import Depends, FastAPI
 from fastapi.testclient import TestClient
+from app.api.v1.schemas.auth_schema import TokenData
+from app.config.settings import settings
+from app.dependencies import require_roles
 from app.main import app
+from app.services.login_limiter import login_limiter
+from app.utils.metrics import metrics
 
 client = TestClient(app)
 
@@ -69,3 +77,91 @@ def test_login_user_wrong_password(new_user_data):
         json={"username": new_user_data["username"], "password": "wrongpass"}
     )
     assert response.status_code == 401
+
+
+def test_claims_only_authorization_honours_token_version(client):
+    """
+    Purpose: Validate claims-only role checks and token revocation through the version claim.
+    Scenario:
+        - A route is protected with require_roles(["admin"], claims_only=True).
+        - An admin's token is used before and after another admin resets its password, then after deletion.
+        - A customer's token is used on the same route.
+    Expected: 200 with a current token, 401 once the token version is stale or the user is deleted,
+        and 403 for the customer.
+    """
+    claims_app = FastAPI()
+
+    @claims_app.get("/admin-only")
+    def admin_only(claims: Annotated[TokenData, Depends(require_roles(["admin"], claims_only=True))]):
+        return {"role": claims.role, "version": claims.version}
+
+    claims_app.dependency_overrides = app.dependency_overrides
+    claims_client = TestClient(claims_app)
+
+    def login(role: str, password: str = "pw") -> tuple[str, dict]:
+        username = f"{role}_{uuid4()}"
+        credentials = {"username": username, "password": password}
+        user_id = client.post("/api/v1/auth/register", json={**credentials, "role": role}).json()["id"]
+        token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+        return user_id, {"Authorization": f"Bearer {token}"}
+
+    _, manager_headers = login("admin")
+    admin_id, admin_headers = login("admin")
+    _, customer_headers = login("customer")
+
+    response = claims_client.get("/admin-only", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json() == {"role": "admin", "version": 0}
+    assert claims_client.get("/admin-only", headers=customer_headers).status_code == 403
+
+    client.patch(f"/api/v1/users/{admin_id}", json={"password": "new"}, headers=manager_headers)
+    assert claims_client.get("/admin-only", headers=admin_headers).status_code == 401
+
+    client.delete(f"/api/v1/users/{admin_id}", headers=manager_headers)
+    assert claims_client.get("/admin-only", headers=admin_headers).status_code == 401
+
+
+def test_login_flood_is_rejected_before_hashing(client):
+    """
+    Purpose: Ensure a burst of failed logins for one username costs a bounded number of password verifications.
+    Scenario: Send more wrong-password logins for one user than LOGIN_MAX_ATTEMPTS_PER_USERNAME allows.
+    Expected: The allowed attempts return 401, the rest 429 with Retry-After, and only the allowed attempts
+        ran a verification.
+    """
+    username = f"flood_{uuid4()}"
+    client.post("/api/v1/auth/register", json={"username": username, "password": "right", "role": "customer"})
+    allowed = login_limiter.max_per_username
+
+    def verifications() -> int:
+        return metrics.snapshot()["summaries"]["password_hash.run_seconds"]["count"]
+
+    before = verifications()
+    wrong = {"username": username, "password": "wrong"}
+    responses = [client.post("/api/v1/auth/login", json=wrong) for _ in range(allowed + 3)]
+
+    assert [response.status_code for response in responses] == [401] * allowed + [429] * 3
+    assert int(responses[-1].headers["Retry-After"]) >= 1
+    assert verifications() - before == allowed
+
+
+def test_login_ip_limit_uses_forwarded_address_and_counts_only_failures(monkeypatch):
+    """
+    Purpose: Ensure the per-IP login limit counts failed logins of the client named by the trusted proxy header.
+    Scenario: With LOGIN_CLIENT_IP_HEADER set and two attempts per IP, log in successfully three times, then fail
+        with different usernames behind spoofed X-Forwarded-For prefixes.
+    Expected: Successful logins are not counted; the third failure from the proxy-appended address is rejected
+        with 429 while another address is still admitted.
+    """
+    monkeypatch.setattr(settings, "LOGIN_CLIENT_IP_HEADER", "X-Forwarded-For")
+    monkeypatch.setattr(login_limiter, "max_per_ip", 2)
+    address = f"client-{uuid4()}"
+    credentials = {"username": f"forwarded_{uuid4()}", "password": "right"}
+    client.post("/api/v1/auth/register", json={**credentials, "role": "customer"})
+
+    def login(payload: dict, forwarded_for: str) -> int:
+        return client.post("/api/v1/auth/login", json=payload, headers={"X-Forwarded-For": forwarded_for}).status_code
+
+    assert [login(credentials, address) for _ in range(3)] == [200] * 3
+    unknown = {"username": f"nobody_{uuid4()}", "password": "x"}
+    assert [login(unknown, f"spoofed-{index}, {address}") for index in range(3)] == [401, 401, 429]
+    assert login(unknown, f"{address}, client-{uuid4()}") == 401
@@ -1,8 +1,16 @@
+import gzip
+import io
+import json
+import pyarrow.parquet as pq
 import pytest
 from fastapi.testclient import TestClient
 from uuid import uuid4
 from datetime import datetime, timezone
 from app.main import app
+from app.config.settings import settings
+from app.services.ingest_queue import ingest_queue
+from app.api.v1.schemas.control_unit_schema import DeviceData
+from app.utils.device_payload import MEDIA_TYPE, encode_device_data
 
 client = TestClient(app)
 
@@ -85,7 +93,7 @@ def test_get_all_control_unit_data(full_control_unit_payload):
     Scenario: Fetch all readings after at least one has been created.
     Expected: Response 200 and the created reading ID is in the list.
     """
-    resp = client.get("/api/v1/control-unit/")
+    resp = client.get("/api/v1/control-unit/", params={"sensor_unit_id": full_control_unit_payload["sensor_unit_id"]})
     assert resp.status_code == 200
     data = resp.json()
     assert any(d["id"] == full_control_unit_payload["id"] for d in data)
@@ -114,3 +122,389 @@ def test_delete_control_unit_data(full_control_unit_payload):
 
     resp_check = client.get(f"/api/v1/control-unit/{data_id}")
     assert resp_check.status_code == 404
+
+def test_update_control_unit_data_rejects_null_readings(full_control_unit_payload):
+    """
+    Purpose: Test that PUT /control-unit/{id} rejects explicit nulls instead of failing in the model.
+    Scenario: Send null humidity, null temperature and null timestamp, then a valid partial update.
+    Expected: Each null returns 422 and leaves the reading unchanged; the valid update returns 200.
+    """
+    data_id = full_control_unit_payload["id"]
+    for field in ("humidity", "temperature", "timestamp"):
+        resp = client.put(f"/api/v1/control-unit/{data_id}", json={field: None})
+        assert resp.status_code == 422
+
+    assert client.get(f"/api/v1/control-unit/{data_id}").json()["humidity"] == {"value": 55.0}
+    resp = client.put(f"/api/v1/control-unit/{data_id}", json={"temperature": {"value": 3.5}})
+    assert resp.status_code == 200
+    assert resp.json()["temperature"] == {"value": 3.5}
+    assert resp.json()["humidity"] == {"value": 55.0}
+
+def test_post_grouped_device_data_queued(device_data_payload):
+    """
+    Purpose: Test that grouped readings are accepted asynchronously when the ingest queue runs.
+    Scenario: Start the write-behind queue, POST grouped readings, then stop (flush) the queue.
+    Expected: Response 202 with queued count; readings are stored after the flush.
+    """
+    ingest_queue.start()
+    try:
+        resp = client.post("/api/v1/control-unit/", json=device_data_payload)
+    finally:
+        ingest_queue.stop()
+    assert resp.status_code == 202
+    assert resp.json()["queued"] == 2
+
+    stored = client.get("/api/v1/control-unit/").json()
+    assert sum(d["control_unit_id"] == device_data_payload["control_unit_id"] for d in stored) == 2
+
+def test_post_ndjson_stream_in_batches(monkeypatch):
+    """
+    Purpose: Test streaming NDJSON ingestion via POST /control-unit/stream.
+    Scenario: Send three timestamp group lines (plus a blank line) with a batch size of two readings.
+    Expected: Response 201 and every reading is stored for the control unit.
+    """
+    monkeypatch.setattr(settings, "INGEST_BATCH_SIZE", 2)
+    control_unit_id = str(uuid4())
+    start = int(datetime.now(timezone.utc).timestamp())
+    lines = [
+        json.dumps({"timestamp": start + i, "sensor_units": [{"sensor_unit_id": str(uuid4()), "temperature": 4.0, "humidity": 70.0}]})
+        for i in range(3)
+    ]
+    body = "\n".join(lines[:2]) + "\n\n" + lines[2]
+    resp = client.post(
+        f"/api/v1/control-unit/stream?control_unit_id={control_unit_id}",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert resp.status_code == 201
+    assert resp.json()["saved"] == 3
+
+    stored = client.get("/api/v1/control-unit/").json()
+    assert sum(d["control_unit_id"] == control_unit_id for d in stored) == 3
+
+def test_post_ndjson_stream_invalid_line():
+    """
+    Purpose: Test that an invalid NDJSON line is reported with its line number.
+    Scenario: Send one valid line followed by a line missing sensor_units.
+    Expected: Response 422 naming line 2.
+    """
+    body = json.dumps({"timestamp": 1, "sensor_units": []}) + "\n" + json.dumps({"timestamp": 2}) + "\n"
+    resp = client.post(
+        f"/api/v1/control-unit/stream?control_unit_id={uuid4()}",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert resp.status_code == 422
+    assert resp.json()["detail"]["line"] == 2
+
+def test_post_binary_device_data(device_data_payload):
+    """
+    Purpose: Test posting grouped readings in the compact binary format via POST /control-unit/binary.
+    Scenario: Encode the grouped payload and send it with the binary media type, then with JSON content type.
+    Expected: Binary upload returns 201 with all readings saved; wrong content type returns 415.
+    """
+    payload = encode_device_data(DeviceData.model_validate(device_data_payload))
+    resp = client.post("/api/v1/control-unit/binary", content=payload, headers={"Content-Type": MEDIA_TYPE})
+    assert resp.status_code == 201
+    assert resp.json()["saved"] == 2
+
+    resp = client.post("/api/v1/control-unit/binary", content=payload, headers={"Content-Type": "application/json"})
+    assert resp.status_code == 415
+
+def test_post_gzip_device_data(device_data_payload):
+    """
+    Purpose: Test that device uploads may be gzip-compressed.
+    Scenario: POST the grouped JSON payload gzip-compressed with Content-Encoding: gzip.
+    Expected: Response 201 with all readings saved.
+    """
+    body = gzip.compress(json.dumps(device_data_payload).encode())
+    resp = client.post(
+        "/api/v1/control-unit/",
+        content=body,
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+    assert resp.status_code == 201
+    assert resp.json()["saved"] == 2
+
+def test_post_grouped_device_data_retry_reports_duplicates(device_data_payload):
+    """
+    Purpose: Test that retried uploads are deduplicated via POST /control-unit.
+    Scenario: Send the same grouped payload twice.
+    Expected: Second response reports 0 saved and 2 duplicates.
+    """
+    first = client.post("/api/v1/control-unit/", json=device_data_payload)
+    second = client.post("/api/v1/control-unit/", json=device_data_payload)
+    assert first.json()["saved"] == 2
+    assert second.status_code == 201
+    assert second.json() == {"status": "ok", "saved": 0, "duplicates": 2}
+
+def test_aggregate_readings_per_bucket():
+    """
+    Purpose: Test time-bucketed aggregation via GET /control-unit/aggregate.
+    Scenario: Upload one reading per minute for 10 minutes and aggregate them in 5-minute buckets.
+    Expected: Two buckets with count/avg/min/max computed from their five readings each.
+    """
+    sensor_id = str(uuid4())
+    base = int(datetime.now(timezone.utc).timestamp()) // 300 * 300 - 3600
+    payload = {
+        "control_unit_id": str(uuid4()),
+        "timestamp_groups": [
+            {"timestamp": base + 60 * i, "sensor_units": [{"sensor_unit_id": sensor_id, "temperature": float(i), "humidity": 50.0}]}
+            for i in range(10)
+        ],
+    }
+    assert client.post("/api/v1/control-unit/", json=payload).json()["saved"] == 10
+
+    resp = client.get(
+        "/api/v1/control-unit/aggregate",
+        params={
+            "sensor_unit_id": sensor_id,
+            "start": datetime.fromtimestamp(base).isoformat(),
+            "end": datetime.fromtimestamp(base + 600).isoformat(),
+            "bucket_seconds": 300,
+            "aggregates": ["count", "avg", "min", "max"],
+            "fields": ["temperature"],
+        },
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["sensor_unit_id"] == [sensor_id, sensor_id]
+    assert len(data["bucket_start"]) == 2
+    assert data["values"] == {
+        "temperature_avg": [2.0, 7.0],
+        "temperature_min": [0.0, 5.0],
+        "temperature_max": [4.0, 9.0],
+        "count": [5, 5],
+    }
+
+def test_aggregate_requires_sensor_or_control_unit():
+    """
+    Purpose: Test that aggregation over all sensors is rejected.
+    Scenario: Call GET /control-unit/aggregate without sensor_unit_id or control_unit_id.
+    Expected: 400 Bad Request.
+    """
+    resp = client.get(
+        "/api/v1/control-unit/aggregate",
+        params={"start": "2026-10-17T00:00:00", "end": "2026-10-17T01:00:00"},
+    )
+    assert resp.status_code == 400
+
+def test_get_control_unit_data_paginated():
+    """
+    Purpose: Test keyset pagination of GET /control-unit.
+    Scenario: Upload 5 readings for one sensor and page through them with limit=2.
+    Expected: Three pages of 2, 2 and 1 readings in timestamp order; only the last page has no X-Next-Cursor header.
+    """
+    sensor_id = str(uuid4())
+    base = int(datetime.now(timezone.utc).timestamp()) - 600
+    payload = {
+        "control_unit_id": str(uuid4()),
+        "timestamp_groups": [
+            {"timestamp": base + 60 * i, "sensor_units": [{"sensor_unit_id": sensor_id, "temperature": float(i), "humidity": 50.0}]}
+            for i in range(5)
+        ],
+    }
+    assert client.post("/api/v1/control-unit/", json=payload).json()["saved"] == 5
+
+    pages, cursor = [], None
+    while True:
+        params = {"sensor_unit_id": sensor_id, "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get("/api/v1/control-unit/", params=params)
+        assert resp.status_code == 200
+        pages.append([d["temperature"]["value"] for d in resp.json()])
+        cursor = resp.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert pages == [[0.0, 1.0], [2.0, 3.0], [4.0]]
+
+def test_get_control_unit_data_invalid_cursor():
+    """
+    Purpose: Test that a malformed cursor is rejected.
+    Scenario: Call GET /control-unit with a garbage cursor.
+    Expected: 400 Bad Request.
+    """
+    resp = client.get("/api/v1/control-unit/", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+
+def test_get_control_unit_data_limit_capped():
+    """
+    Purpose: Test the hard maximum page size.
+    Scenario: Request a page larger than PAGE_MAX_SIZE.
+    Expected: 422 Unprocessable Entity.
+    """
+    resp = client.get("/api/v1/control-unit/", params={"limit": settings.PAGE_MAX_SIZE + 1})
+    assert resp.status_code == 422
+
+def test_export_control_unit_data_ndjson(device_data_payload):
+    """
+    Purpose: Test streaming export via GET /control-unit/export.
+    Scenario: Upload grouped readings and export them for their control unit as NDJSON and CSV.
+    Expected: NDJSON has one line per reading; CSV has a header plus one row per reading.
+    """
+    client.post("/api/v1/control-unit/", json=device_data_payload)
+    params = {"control_unit_id": device_data_payload["control_unit_id"]}
+
+    resp = client.get("/api/v1/control-unit/export", params=params)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert sorted(line["temperature_value"] for line in lines) == [22.5, 23.5]
+
+    resp = client.get("/api/v1/control-unit/export", params={**params, "format": "csv"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert len(resp.text.splitlines()) == 3
+
+def test_export_control_unit_data_parquet(device_data_payload):
+    """
+    Purpose: Test Parquet export via GET /control-unit/export.
+    Scenario: Upload grouped readings and export them for their control unit as snappy Parquet;
+        then request an Arrow export with a codec Arrow does not support.
+    Expected: A Parquet file with the uploaded readings; 400 for the unsupported codec.
+    """
+    client.post("/api/v1/control-unit/", json=device_data_payload)
+    params = {"control_unit_id": device_data_payload["control_unit_id"]}
+
+    resp = client.get("/api/v1/control-unit/export", params={**params, "format": "parquet", "compression": "snappy"})
+    assert resp.status_code == 200
+    table = pq.read_table(io.BytesIO(resp.content))
+    assert sorted(table.column("temperature_value").to_pylist()) == [22.5, 23.5]
+
+    resp = client.get("/api/v1/control-unit/export", params={**params, "format": "arrow", "compression": "snappy"})
+    assert resp.status_code == 400
+
+def test_get_latest_readings(device_data_payload):
+    """
+    Purpose: Test latest-reading lookups via GET /control-unit/latest.
+    Scenario: Upload two groups for the same sensors, then look up one sensor and the control unit.
+    Expected: Only the newest reading per sensor is returned; no filter returns 400.
+    """
+    group = device_data_payload["timestamp_groups"][0]
+    newer = {
+        "timestamp": group["timestamp"] + 60,
+        "sensor_units": [{**unit, "temperature": unit["temperature"] + 10} for unit in group["sensor_units"]],
+    }
+    device_data_payload["timestamp_groups"].append(newer)
+    client.post("/api/v1/control-unit/", json=device_data_payload)
+    sensor_id = group["sensor_units"][0]["sensor_unit_id"]
+
+    resp = client.get("/api/v1/control-unit/latest", params={"sensor_unit_id": sensor_id})
+    assert resp.status_code == 200
+    assert [d["temperature"]["value"] for d in resp.json()] == [32.5]
+
+    resp = client.get("/api/v1/control-unit/latest", params={"control_unit_id": device_data_payload["control_unit_id"]})
+    assert sorted(d["temperature"]["value"] for d in resp.json()) == [32.5, 33.5]
+
+    assert client.get("/api/v1/control-unit/latest").status_code == 400
+
+
+def test_threshold_rule_records_excursion(client):
+    """
+    Purpose: Test threshold rules end to end: rule creation, ingest-time evaluation and excursion listing.
+    Scenario: An admin creates a 2-8 °C rule for a sensor, then readings go above the band and back.
+    Expected: 201 for the rule; one closed temperature excursion with the peak value is listed for the sensor.
+    """
+    username = f"admin_{uuid4()}"
+    client.post("/api/v1/auth/register", json={"username": username, "password": "a", "role": "admin"})
+    token = client.post("/api/v1/auth/login", json={"username": username, "password": "a"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    sensor_id = str(uuid4())
+
+    rule = client.post(
+        "/api/v1/thresholds/rules", json={"sensor_unit_id": sensor_id, "temperature_min": 2, "temperature_max": 8}, headers=headers
+    )
+    assert rule.status_code == 201
+    base = 1_760_000_000
+    client.post("/api/v1/control-unit/", json={
+        "control_unit_id": str(uuid4()),
+        "timestamp_groups": [
+            {"timestamp": base + 60 * i, "sensor_units": [{"sensor_unit_id": sensor_id, "temperature": temperature, "humidity": 50.0}]}
+            for i, temperature in enumerate([5.0, 9.5, 12.0, 6.0])
+        ],
+    })
+
+    response = client.get("/api/v1/thresholds/excursions", params={"sensor_unit_id": sensor_id})
+    assert response.status_code == 200
+    [excursion] = response.json()
+    assert excursion["rule_id"] == rule.json()["id"]
+    assert excursion["field"] == "temperature"
+    assert excursion["peak_value"] == 12.0
+    assert excursion["reading_count"] == 2
+    assert excursion["ended_at"] is not None
+
+    assert client.delete(f"/api/v1/thresholds/rules/{rule.json()['id']}", headers=headers).status_code == 200
+    assert client.get("/api/v1/thresholds/excursions", params={"sensor_unit_id": sensor_id}).json() == []
+
+
+def test_threshold_rule_requires_target_and_bounds(client):
+    """
+    Purpose: Test validation of threshold rules.
+    Scenario: Create rules without a target, and with a minimum above the maximum.
+    Expected: Response 422 for both.
+    """
+    username = f"admin_{uuid4()}"
+    client.post("/api/v1/auth/register", json={"username": username, "password": "a", "role": "admin"})
+    token = client.post("/api/v1/auth/login", json={"username": username, "password": "a"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.post("/api/v1/thresholds/rules", json={"temperature_max": 8}, headers=headers).status_code == 422
+    response = client.post(
+        "/api/v1/thresholds/rules", json={"sensor_unit_id": str(uuid4()), "temperature_min": 9, "temperature_max": 8}, headers=headers
+    )
+    assert response.status_code == 422
+
+
+def test_live_feed_requires_single_target():
+    """
+    Purpose: Test validation of the live readings stream before it is opened.
+    Scenario: Subscribe without a target, with both targets, and to an unknown shipment.
+    Expected: 400 for missing or conflicting targets, 404 for the unknown shipment.
+    """
+    assert client.get("/api/v1/control-unit/live").status_code == 400
+    params = {"sensor_unit_id": str(uuid4()), "shipment_id": str(uuid4())}
+    assert client.get("/api/v1/control-unit/live", params=params).status_code == 400
+    assert client.get("/api/v1/control-unit/live", params={"shipment_id": str(uuid4())}).status_code == 404
+
+
+def test_reading_statistics():
+    """
+    Purpose: Test GET /control-unit/statistics.
+    Scenario: Upload readings for a sensor one minute apart, then request statistics with a threshold.
+    Expected: Counts, mean, percentiles, time above the threshold and MKT describe the uploaded readings;
+              invalid percentiles and missing targets are rejected with 400.
+    """
+    sensor_id = str(uuid4())
+    base = 1_760_000_000
+    temperatures = [4.0, 6.0, 9.0, 10.0, 5.0]
+    client.post("/api/v1/control-unit/", json={
+        "control_unit_id": str(uuid4()),
+        "timestamp_groups": [
+            {"timestamp": base + 60 * i, "sensor_units": [{"sensor_unit_id": sensor_id, "temperature": temperature, "humidity": 50.0}]}
+            for i, temperature in enumerate(temperatures)
+        ],
+    })
+    params = {
+        "sensor_unit_id": sensor_id,
+        "start": datetime.fromtimestamp(base).isoformat(),
+        "end": datetime.fromtimestamp(base + 3_600).isoformat(),
+        "percentiles": [50, 100],
+        "temperature_above": 8,
+    }
+
+    response = client.get("/api/v1/control-unit/statistics", params=params)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 5
+    assert data["duration_seconds"] == 240
+    assert data["temperature"]["mean"] == 6.8
+    assert data["temperature"]["percentiles"] == {"p50": 6.0, "p100": 10.0}
+    assert data["humidity"]["std"] == 0.0
+    assert data["seconds_above"] == 120
+    assert data["seconds_below"] is None
+    assert 6.8 < data["mean_kinetic_temperature"] < 10.0
+
+    assert client.get("/api/v1/control-unit/statistics", params={**params, "percentiles": [101]}).status_code == 400
+    params.pop("sensor_unit_id")
+    assert client.get("/api/v1/control-unit/statistics", params=params).status_code == 400
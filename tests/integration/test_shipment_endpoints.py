@@ -2,6 +2,7 @@ import pytest
 from fastapi.testclient import TestClient
 from app.main import app
 from uuid import uuid4
+from datetime import datetime, timezone
 
 client = TestClient(app)
 
@@ -119,9 +120,9 @@ def test_get_shipment_by_id_endpoint(shipment_payload, auth_headers):
 
 def test_update_shipment_endpoint(shipment_payload, admin_headers):
     """
-    Purpose: Test updating a shipment's driver via PATCH /shipments/{id}.
-    Scenario: Admin creates shipment and updates its driver_id.
-    Expected: Response 200 and driver_id updated.
+    Purpose: Test updating a shipment's driver and sensor unit via PATCH /shipments/{id}.
+    Scenario: Admin creates shipment, updates its driver_id, then its sensor_unit_id.
+    Expected: Response 200 each time; driver_id and sensor_unit_id updated.
     """
     create_resp = client.post(
         "/api/v1/shipments",
@@ -137,6 +138,12 @@ def test_update_shipment_endpoint(shipment_payload, admin_headers):
     assert response.status_code == 200
     assert response.json()["driver_id"] == new_driver_id
 
+    new_sensor_unit_id = str(uuid4())
+    response = client.patch(f"/api/v1/shipments/{shipment_id}?sensor_unit_id={new_sensor_unit_id}", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["sensor_unit_id"] == new_sensor_unit_id
+    assert response.json()["driver_id"] == new_driver_id
+
 
 def test_delete_shipment_endpoint(shipment_payload, admin_headers):
     """
@@ -195,3 +202,57 @@ def test_fetch_current_users_shipments_customer_with_shipments_endpoint(shipment
     assert response.status_code == 200
     data = response.json()
     assert any(shipment["sender_id"] == str(user_id) or shipment["receiver_id"] == str(user_id) for shipment in data)
+
+
+def test_get_shipment_readings_endpoint(shipment_payload, auth_headers):
+    """
+    Purpose: Test fetching a shipment's sensor history via GET /shipments/{id}/readings.
+    Scenario: Create a shipment with a sensor unit, upload 50 readings for it, then fetch them raw and downsampled.
+    Expected: All 50 readings in order without downsampling; 10 points (including first and last) with max_points=10,
+              and only the first and last with max_points=2.
+    """
+    sensor_id = str(uuid4())
+    create_resp = client.post(
+        "/api/v1/shipments",
+        json={**shipment_payload,
+              "sender_id": str(shipment_payload["sender_id"]),
+              "receiver_id": str(shipment_payload["receiver_id"]),
+              "sensor_unit_id": sensor_id},
+        headers=auth_headers,
+    )
+    shipment_id = create_resp.json()["id"]
+    base = int(datetime.now(timezone.utc).timestamp()) - 3_000
+    client.post("/api/v1/control-unit/", json={
+        "control_unit_id": str(uuid4()),
+        "timestamp_groups": [
+            {"timestamp": base + 60 * i, "sensor_units": [{"sensor_unit_id": sensor_id, "temperature": float(i), "humidity": 50.0}]}
+            for i in range(50)
+        ],
+    })
+    window = {"start": datetime.fromtimestamp(base - 1).isoformat(), "end": datetime.fromtimestamp(base + 3_600).isoformat()}
+
+    response = client.get(f"/api/v1/shipments/{shipment_id}/readings", params={**window, "max_points": 0})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["sensor_unit_id"] == sensor_id
+    assert data["total_points"] == 50
+    assert data["temperature"] == [float(i) for i in range(50)]
+
+    response = client.get(f"/api/v1/shipments/{shipment_id}/readings", params={**window, "max_points": 10})
+    data = response.json()
+    assert data["total_points"] == 50
+    assert len(data["temperature"]) == len(data["timestamp"]) == 10
+    assert data["temperature"][0] == 0.0 and data["temperature"][-1] == 49.0
+
+    response = client.get(f"/api/v1/shipments/{shipment_id}/readings", params={**window, "max_points": 2})
+    assert response.json()["temperature"] == [0.0, 49.0]
+
+
+def test_get_shipment_readings_not_found():
+    """
+    Purpose: Test the readings endpoint for an unknown shipment.
+    Scenario: Fetch readings for a random shipment ID.
+    Expected: Response 404.
+    """
+    response = client.get(f"/api/v1/shipments/{uuid4()}/readings")
+    assert response.status_code == 404
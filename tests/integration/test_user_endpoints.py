@@ -87,3 +87,30 @@ def test_admin_crud_users_flow(client):
     # DELETE
     del_resp = client.delete(f"/api/v1/users/{user_id}", headers=admin_headers)
     assert del_resp.status_code == 204
+
+
+def test_role_change_and_delete_take_effect_immediately(client):
+    """
+    Purpose: Ensure cached principals do not outlive user changes.
+    Scenario:
+        - A customer authenticates (caching its principal) and is denied the admin user list.
+        - An admin promotes the customer, then deletes it.
+    Expected: The promoted user is allowed right away, and its token is rejected after deletion.
+    """
+    admin_username = f"admin_{uuid4()}"
+    client.post("/api/v1/auth/register", json={"username": admin_username, "password": "a", "role": "admin"})
+    admin_token = client.post("/api/v1/auth/login", json={"username": admin_username, "password": "a"}).json()["access_token"]
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    username = f"user_{uuid4()}"
+    user_id = client.post("/api/v1/auth/register", json={"username": username, "password": "b", "role": "customer"}).json()["id"]
+    token = client.post("/api/v1/auth/login", json={"username": username, "password": "b"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/api/v1/users", headers=headers).status_code == 403
+
+    client.patch(f"/api/v1/users/{user_id}", json={"role": "admin"}, headers=admin_headers)
+    assert client.get("/api/v1/users", headers=headers).status_code == 200
+
+    client.delete(f"/api/v1/users/{user_id}", headers=admin_headers)
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 401
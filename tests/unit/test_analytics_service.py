@@ -0,0 +1,115 @@
+import math
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from uuid import uuid4
+from datetime import datetime, timedelta
+from app.db.connection import Base
+from app.services.analytics_service import (
+    compute_reading_statistics,
+    load_reading_arrays,
+    mean_kinetic_temperature,
+    seconds_beyond,
+    summarize,
+)
+from app.services.control_unit_service import save_readings
+
+NOW = datetime(2026, 10, 17, 12, 0)
+
+
+# -----------------------------
+# Fixtures
+# -----------------------------
+@pytest.fixture(scope="function")
+def db_session():
+    """
+    Provides an in-memory SQLite session for analytics tests.
+    """
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+# -----------------------------
+# Tests
+# -----------------------------
+def test_summarize_matches_reference_values():
+    """
+    Purpose: Validate the vectorised summary statistics.
+    Scenario: Summarize 1..10 with the 0th, 50th and 90th percentile; summarize an empty series.
+    Expected: Known mean, population std, min, max and linear-interpolated percentiles; None values when empty.
+    """
+    stats = summarize(np.arange(1.0, 11.0), [0, 50, 90])
+    assert stats["count"] == 10
+    assert stats["mean"] == 5.5
+    assert stats["std"] == pytest.approx(math.sqrt(8.25))
+    assert (stats["min"], stats["max"]) == (1.0, 10.0)
+    assert stats["percentiles"] == {"p0": 1.0, "p50": 5.5, "p90": pytest.approx(9.1)}
+    empty = {"count": 0, "mean": None, "std": None, "min": None, "max": None, "percentiles": {"p95": None}}
+    assert summarize(np.array([]), [95]) == empty
+
+
+def test_seconds_beyond_holds_each_reading_until_the_next():
+    """
+    Purpose: Validate time above/below a threshold with irregular sampling.
+    Scenario: Readings at 0, 60, 180 and 190 s with temperatures 5, 9, 10 and 1; threshold 8 above and 2 below.
+    Expected: 130 s above (60-190 s) and 0 s below (the last reading adds no time).
+    """
+    epoch = np.array([0.0, 60.0, 180.0, 190.0])
+    values = np.array([5.0, 9.0, 10.0, 1.0])
+    assert seconds_beyond(epoch, values, above=8.0) == 130.0
+    assert seconds_beyond(epoch, values, below=2.0) == 0.0
+    assert seconds_beyond(epoch, values, above=9.5, below=6.0) == 70.0
+    assert seconds_beyond(epoch[:1], values[:1], above=0.0) == 0.0
+
+
+def test_mean_kinetic_temperature_matches_per_reading_formula():
+    """
+    Purpose: Validate the vectorised MKT against the textbook per-reading formula.
+    Scenario: Compute MKT for a constant series and for a series with a warm excursion.
+    Expected: A constant series has MKT equal to its temperature; the excursion series matches
+              the scalar formula and exceeds its arithmetic mean.
+    """
+    assert mean_kinetic_temperature(np.full(5, 25.0)) == pytest.approx(25.0)
+
+    temperatures = [4.0] * 20 + [20.0, 25.0, 22.0] + [5.0] * 20
+    h_over_r = 83.144 * 1_000 / 8.314462618
+    mean_rate = sum(math.exp(-h_over_r / (t + 273.15)) for t in temperatures) / len(temperatures)
+    expected = h_over_r / -math.log(mean_rate) - 273.15
+    mkt = mean_kinetic_temperature(np.array(temperatures))
+    assert mkt == pytest.approx(expected)
+    assert mkt > np.mean(temperatures)
+    assert mean_kinetic_temperature(np.array([])) is None
+
+
+def test_compute_reading_statistics_from_database(db_session):
+    """
+    Purpose: Validate loading readings column-wise and computing statistics over a range.
+    Scenario: Save readings every 90.5 s for two sensors, then analyse one sensor over part of the range.
+    Expected: Only the sensor's readings in [start, end) are loaded, in order, with fractional-second epochs.
+    """
+    sensor_id, other_id, control_unit_id = uuid4(), uuid4(), uuid4()
+    rows = [
+        (uuid4(), sensor, control_unit_id, NOW + timedelta(seconds=90.5 * i), 40.0 + i, float(i))
+        for i in range(10)
+        for sensor in (sensor_id, other_id)
+    ]
+    save_readings(db_session, rows)
+    start, end = NOW + timedelta(seconds=90.5 * 2), NOW + timedelta(seconds=90.5 * 8)
+
+    arrays = load_reading_arrays(db_session, sensor_id, start, end)
+    assert arrays["temperature"].tolist() == [2.0, 3.0, 4.0, 5.0, 6.0, 7.0]
+    assert np.diff(arrays["epoch"]) == pytest.approx([90.5] * 5)
+
+    stats = compute_reading_statistics(db_session, sensor_id, start, end, [50], temperature_above=5.5)
+    assert stats["count"] == 6
+    assert stats["duration_seconds"] == pytest.approx(452.5)
+    assert stats["temperature"]["mean"] == 4.5
+    assert stats["humidity"]["percentiles"] == {"p50": 44.5}
+    assert stats["seconds_above"] == pytest.approx(90.5)
+    assert stats["seconds_below"] is None
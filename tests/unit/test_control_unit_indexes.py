@@ -0,0 +1,227 @@
+import importlib
+import os
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from uuid import UUID, uuid4
+from datetime import datetime, timedelta, timezone
+from app.db.connection import Base
+from app.services.control_unit_service import aggregate_control_unit_data, get_control_unit_data_page
+from app.services.export_service import iter_reading_batches
+from app.services.partition_service import next_period, partition_name
+
+START = datetime(2026, 10, 17)
+
+# PostgreSQL server for the postgres-marked tests, e.g. postgresql+psycopg://postgres@localhost/test
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+# Monthly partitions created by the pg_engine fixture, besides the default partition
+PARTITION_MONTHS = [datetime(2026, 10, 1, tzinfo=timezone.utc), datetime(2026, 11, 1, tzinfo=timezone.utc)]
+
+index_migration = importlib.import_module("app.db.migrations.versions.8f3b6a1d4c27_control_unit_data_indexes")
+
+
+# -----------------------------
+# Fixtures
+# -----------------------------
+@pytest.fixture(scope="function")
+def engine():
+    """
+    Provides an in-memory SQLite engine with the full schema, including the reading indexes.
+    """
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def pg_engine():
+    """
+    Provides an engine whose search_path is a scratch schema holding a partitioned control_unit_data
+    table with two monthly partitions and a default one, filled with readings of 50 sensors on
+    5 control units every 10 minutes through October 2026, analyzed and indexed by the indexes migration.
+    """
+    if not POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    schema = f"index_test_{uuid4().hex[:8]}"
+    admin = create_engine(POSTGRES_URL)
+    with admin.begin() as connection:
+        connection.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = create_engine(POSTGRES_URL, connect_args={"options": f"-csearch_path={schema}"})
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE control_unit_data (id uuid NOT NULL, sensor_unit_id uuid NOT NULL, "
+                "control_unit_id uuid NOT NULL, timestamp timestamptz NOT NULL, humidity_value float NOT NULL, "
+                "temperature_value float NOT NULL, PRIMARY KEY (id, timestamp)) PARTITION BY RANGE (timestamp)"
+            )
+        )
+        for start in PARTITION_MONTHS:
+            connection.execute(
+                text(
+                    f"CREATE TABLE {partition_name(start, 'monthly')} PARTITION OF control_unit_data "
+                    f"FOR VALUES FROM ('{start.isoformat()}') TO ('{next_period(start, 'monthly').isoformat()}')"
+                )
+            )
+        connection.execute(text("CREATE TABLE control_unit_data_default PARTITION OF control_unit_data DEFAULT"))
+        # Readings arrive in time order, which is what makes the BRIN index selective
+        connection.execute(
+            text(
+                "INSERT INTO control_unit_data "
+                "SELECT gen_random_uuid(), ('00000000-0000-0000-0000-' || lpad(sensor::text, 12, '0'))::uuid, "
+                "('00000000-0000-0000-0001-' || lpad((sensor % 5)::text, 12, '0'))::uuid, ts, 50, 5 "
+                "FROM generate_series('2026-10-01'::timestamptz, '2026-10-31 23:50', '10 minutes') AS ts, "
+                "generate_series(1, 50) AS sensor ORDER BY ts"
+            )
+        )
+    with engine.connect() as connection:
+        context = MigrationContext.configure(connection)
+        with Operations.context(context), context.begin_transaction():
+            index_migration.upgrade()
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE control_unit_data"))
+    yield engine
+    engine.dispose()
+    with admin.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+    admin.dispose()
+
+
+def query_plans(engine, run, explain: str = "EXPLAIN QUERY PLAN") -> list[str]:
+    """
+    Runs `run(session)` and returns the `explain` output of every SELECT it issued.
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with sessionmaker(bind=engine)() as db:
+            result = run(db)
+            if hasattr(result, "__next__"):
+                list(result)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    with engine.connect() as connection:
+        return [
+            " | ".join(row[-1] for row in connection.exec_driver_sql(f"{explain} {statement}", parameters))
+            for statement, parameters in statements
+        ]
+
+
+# -----------------------------
+# Tests
+# -----------------------------
+def test_sensor_page_uses_sensor_timestamp_index(engine):
+    """
+    Purpose: Verify per-sensor listings are served by the (sensor_unit_id, timestamp) index.
+    Scenario: Fetch a page of one sensor's readings in a time range.
+    Expected: The plan searches ix_control_unit_data_sensor_unit_id_timestamp and only sorts ties on id.
+    """
+    plans = query_plans(
+        engine,
+        lambda db: get_control_unit_data_page(db, 50, sensor_unit_id=uuid4(), start=START, end=START + timedelta(days=1)),
+    )
+    assert "SEARCH" in plans[0] and "ix_control_unit_data_sensor_unit_id_timestamp" in plans[0]
+    assert "USE TEMP B-TREE FOR ORDER BY" not in plans[0]
+
+
+def test_control_unit_aggregate_uses_control_unit_timestamp_index(engine):
+    """
+    Purpose: Verify control unit aggregates are served by the (control_unit_id, timestamp) index.
+    Scenario: Aggregate one control unit's readings over a day.
+    Expected: The plan searches ix_control_unit_data_control_unit_id_timestamp.
+    """
+    plans = query_plans(
+        engine,
+        lambda db: aggregate_control_unit_data(
+            db, START, START + timedelta(days=1), 300, ["avg"], ["temperature"], control_unit_id=uuid4()
+        ),
+    )
+    assert "SEARCH" in plans[0] and "ix_control_unit_data_control_unit_id_timestamp" in plans[0]
+
+
+def test_time_range_export_uses_timestamp_index(engine):
+    """
+    Purpose: Verify time range scans across all sensors use the timestamp index.
+    Scenario: Export all readings within one hour.
+    Expected: The plan searches ix_control_unit_data_timestamp_brin (a plain index on SQLite) instead of scanning the table.
+    """
+    plans = query_plans(
+        engine,
+        lambda db: iter_reading_batches(sessionmaker(bind=engine), 100, start=START, end=START + timedelta(hours=1)),
+    )
+    assert "SEARCH" in plans[0] and "ix_control_unit_data_timestamp_brin" in plans[0]
+
+
+# -----------------------------
+# PostgreSQL
+# -----------------------------
+@pytest.mark.postgres
+def test_indexes_exist_on_every_partition(pg_engine):
+    """
+    Purpose: Verify the indexes migration builds every index on the partitioned table and each partition.
+    Scenario: List the indexes of control_unit_data and its partitions with their access methods.
+    Expected: The parent and every partition have both composite btree indexes and the timestamp BRIN index.
+    """
+    with pg_engine.connect() as connection:
+        rows = connection.execute(
+            text(
+                "SELECT t.relname, i.relname, am.amname FROM pg_index x "
+                "JOIN pg_class t ON t.oid = x.indrelid JOIN pg_class i ON i.oid = x.indexrelid "
+                "JOIN pg_am am ON am.oid = i.relam "
+                "WHERE t.relnamespace = current_schema()::regnamespace AND NOT x.indisprimary"
+            )
+        ).all()
+    methods: dict[str, list[str]] = {}
+    for table, _, method in rows:
+        methods.setdefault(table, []).append(method)
+    partitions = [partition_name(start, "monthly") for start in PARTITION_MONTHS] + ["control_unit_data_default"]
+    expected = {table: ["brin", "btree", "btree"] for table in ["control_unit_data", *partitions]}
+    assert {table: sorted(found) for table, found in methods.items()} == expected
+    assert ("control_unit_data", "ix_control_unit_data_timestamp_brin", "brin") in rows
+
+
+@pytest.mark.postgres
+def test_sensor_page_uses_composite_index_on_partition(pg_engine):
+    """
+    Purpose: Verify per-sensor listings on PostgreSQL scan only the matching partition through its sensor index.
+    Scenario: EXPLAIN a page of one sensor's readings over one day of a populated partition.
+    Expected: The plan scans the October partition's (sensor_unit_id, timestamp) index and no other partition.
+    """
+    sensor = UUID("00000000-0000-0000-0000-000000000007")
+    plans = query_plans(
+        pg_engine,
+        lambda db: get_control_unit_data_page(db, 50, sensor_unit_id=sensor, start=START, end=START + timedelta(days=1)),
+        explain="EXPLAIN",
+    )
+    october = partition_name(PARTITION_MONTHS[0], "monthly")
+    assert f"{october}_sensor_unit_id_timestamp" in plans[0]
+    assert "Seq Scan" not in plans[0]
+    assert partition_name(PARTITION_MONTHS[1], "monthly") not in plans[0] and "control_unit_data_default" not in plans[0]
+
+
+@pytest.mark.postgres
+def test_control_unit_aggregate_uses_composite_index_on_partition(pg_engine):
+    """
+    Purpose: Verify control unit aggregates on PostgreSQL use the (control_unit_id, timestamp) index of the partition.
+    Scenario: EXPLAIN an aggregate of one control unit's readings over one day.
+    Expected: The plan reads the October partition through its control unit index instead of scanning it.
+    """
+    control_unit = UUID("00000000-0000-0000-0001-000000000003")
+    plans = query_plans(
+        pg_engine,
+        lambda db: aggregate_control_unit_data(
+            db, START, START + timedelta(days=1), 300, ["avg"], ["temperature"], control_unit_id=control_unit
+        ),
+        explain="EXPLAIN",
+    )
+    october = partition_name(PARTITION_MONTHS[0], "monthly")
+    assert f"{october}_control_unit_id_timestamp" in plans[0]
+    assert "Seq Scan" not in plans[0]
@@ -10,10 +10,12 @@ from app.services.control_unit_service import (
     update_control_unit_data,
     delete_control_unit_data,
     save_device_data,
+    get_control_unit_data_page,
 )
 from app.api.v1.schemas.control_unit_schema import (
     ControlUnitDataCreate,
     ControlUnitDataUpdate,
+    ControlUnitDataRead,
     DeviceData,
     TimestampGroup,
     SensorUnitReading,
@@ -141,3 +143,47 @@ def test_save_device_data(db_session, grouped_data):
     save_device_data(grouped_data, db_session)
     all_data = get_all_control_unit_data(db_session)
     assert len(all_data) == len(grouped_data.timestamp_groups[0].sensor_units)
+
+
+def test_readings_stored_in_float_columns(db_session, grouped_data):
+    """
+    Purpose: Validate that readings are stored as native floats while keeping the API shape.
+    Scenario: Save grouped DeviceData and inspect the stored record.
+    Expected: humidity_value/temperature_value are floats; humidity/temperature return {"value": x}.
+    """
+    save_device_data(grouped_data, db_session)
+    reading = grouped_data.timestamp_groups[0].sensor_units[0]
+    stored = next(item for item in get_all_control_unit_data(db_session) if item.sensor_unit_id == reading.sensor_unit_id)
+    assert stored.temperature_value == reading.temperature
+    assert stored.humidity_value == reading.humidity
+    assert stored.temperature == {"value": reading.temperature}
+    assert ControlUnitDataRead.model_validate(stored, from_attributes=True).humidity == {"value": reading.humidity}
+
+
+def test_save_device_data_skips_duplicates(db_session, grouped_data):
+    """
+    Purpose: Validate idempotent ingestion of retried uploads.
+    Scenario: Save the same DeviceData twice.
+    Expected: The second save inserts nothing and the table holds each reading once.
+    """
+    first = save_device_data(grouped_data, db_session)
+    second = save_device_data(grouped_data, db_session)
+    assert first == len(grouped_data.timestamp_groups[0].sensor_units)
+    assert second == 0
+    assert len(get_all_control_unit_data(db_session)) == first
+
+
+def test_page_through_readings_with_shared_timestamp(db_session, grouped_data):
+    """
+    Purpose: Validate keyset pagination when many readings share one timestamp.
+    Scenario: Save grouped DeviceData (one timestamp, several sensors) and page through it one reading at a time.
+    Expected: Every reading is returned exactly once, ordered by id within the timestamp; the last page has no cursor.
+    """
+    save_device_data(grouped_data, db_session)
+    seen, cursor = [], None
+    while True:
+        items, cursor = get_control_unit_data_page(db_session, limit=1, cursor=cursor)
+        seen.extend(item.id for item in items)
+        if cursor is None:
+            break
+    assert seen == sorted(item.id for item in get_all_control_unit_data(db_session))
@@ -0,0 +1,67 @@
+import pytest
+from uuid import uuid4
+from datetime import datetime
+from app.api.v1.schemas.control_unit_schema import DeviceData, TimestampGroup, SensorUnitReading
+from app.utils.device_payload import encode_device_data, decode_device_payload, DevicePayloadError
+
+
+@pytest.fixture
+def device_data():
+    """
+    Returns DeviceData with two timestamp groups sharing the same two sensors.
+    """
+    sensors = [uuid4(), uuid4()]
+    start = int(datetime.now().timestamp())
+    return DeviceData(
+        control_unit_id=uuid4(),
+        timestamp_groups=[
+            TimestampGroup(
+                timestamp=start + i,
+                sensor_units=[SensorUnitReading(sensor_unit_id=s, temperature=22.5 + i, humidity=50.0) for s in sensors],
+            )
+            for i in range(2)
+        ],
+    )
+
+
+def test_binary_payload_round_trip(device_data):
+    """
+    Purpose: Validate that an encoded payload decodes back into the same readings.
+    Scenario: Encode DeviceData and decode the bytes.
+    Expected: Control unit ID, sensor IDs, timestamps and values match; each sensor ID is stored once.
+    """
+    payload = encode_device_data(device_data)
+    control_unit_id, rows = decode_device_payload(payload)
+
+    assert control_unit_id == device_data.control_unit_id
+    assert payload.count(device_data.timestamp_groups[0].sensor_units[0].sensor_unit_id.bytes) == 1
+    expected = [
+        (unit.sensor_unit_id, datetime.fromtimestamp(group.timestamp), unit.humidity, unit.temperature)
+        for group in device_data.timestamp_groups
+        for unit in group.sensor_units
+    ]
+    assert [(row[1], row[3], row[4], row[5]) for row in rows] == expected
+    assert all(row[2] == device_data.control_unit_id for row in rows)
+
+
+@pytest.mark.parametrize("cut", [3, 30, -1])
+def test_truncated_payload_rejected(device_data, cut):
+    """
+    Purpose: Ensure truncated payloads are rejected.
+    Scenario: Decode the payload cut inside the header, the sensor dictionary and the last reading.
+    Expected: DevicePayloadError is raised.
+    """
+    payload = encode_device_data(device_data)
+    with pytest.raises(DevicePayloadError):
+        decode_device_payload(payload[:cut])
+
+
+def test_unknown_magic_rejected(device_data):
+    """
+    Purpose: Ensure payloads in another format are rejected.
+    Scenario: Replace the magic bytes.
+    Expected: DevicePayloadError is raised.
+    """
+    payload = b"XXXX" + encode_device_data(device_data)[4:]
+    with pytest.raises(DevicePayloadError):
+        decode_device_payload(payload)
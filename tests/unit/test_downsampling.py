@@ -0,0 +1,51 @@
+import math
+from app.utils.downsampling import lttb_indices
+
+
+def test_lttb_keeps_short_series_unchanged():
+    """
+    Purpose: Verify series at or below the threshold are not downsampled.
+    Scenario: Downsample 5 points to 10, and 5 points with a threshold of 0.
+    Expected: All indices are returned.
+    """
+    x, y = list(range(5)), [1.0, 2.0, 3.0, 2.0, 1.0]
+    assert lttb_indices(x, y, 10) == [0, 1, 2, 3, 4]
+    assert lttb_indices(x, y, 0) == [0, 1, 2, 3, 4]
+
+
+def test_lttb_thresholds_below_three_stay_bounded():
+    """
+    Purpose: Verify thresholds of 1 and 2 still bound the output.
+    Scenario: Downsample 1000 points to 1 and to 2 points.
+    Expected: The first point, and the first and last points.
+    """
+    x = list(range(1_000))
+    y = [float(value % 7) for value in x]
+    assert lttb_indices(x, y, 1) == [0]
+    assert lttb_indices(x, y, 2) == [0, 999]
+
+
+def test_lttb_reduces_to_threshold_keeping_endpoints():
+    """
+    Purpose: Verify the output size and endpoints of LTTB.
+    Scenario: Downsample a 10000-point sine wave to 100 points.
+    Expected: 100 strictly ascending indices, starting at the first and ending at the last point.
+    """
+    x = list(range(10_000))
+    y = [math.sin(i / 200) for i in x]
+    indices = lttb_indices(x, y, 100)
+    assert len(indices) == 100
+    assert indices[0] == 0 and indices[-1] == 9_999
+    assert all(a < b for a, b in zip(indices, indices[1:]))
+
+
+def test_lttb_preserves_spike():
+    """
+    Purpose: Verify that short excursions survive downsampling.
+    Scenario: A flat 5000-point series with a single-point spike, downsampled to 50 points.
+    Expected: The spike's index is kept.
+    """
+    x = list(range(5_000))
+    y = [4.0] * 5_000
+    y[3_217] = 12.0
+    assert 3_217 in lttb_indices(x, y, 50)
@@ -0,0 +1,109 @@
+import csv
+import io
+import json
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from uuid import uuid4
+from datetime import datetime, timedelta
+from app.db.connection import Base
+from app.services.control_unit_service import save_readings
+from app.services.export_service import iter_reading_batches, stream_readings
+
+SENSOR_ID = uuid4()
+
+
+# -----------------------------
+# Fixtures
+# -----------------------------
+@pytest.fixture(scope="function")
+def session_factory(tmp_path):
+    """
+    Provides a session factory for a file-based SQLite database holding 7 readings of one sensor.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'export.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    control_unit_id = uuid4()
+    start = datetime(2026, 10, 17, 8, 0)
+    with factory() as db:
+        save_readings(
+            db,
+            [(uuid4(), SENSOR_ID, control_unit_id, start + timedelta(minutes=i), 50.0, float(i)) for i in range(7)]
+            + [(uuid4(), uuid4(), control_unit_id, start, 40.0, 1.0)],
+        )
+    yield factory
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+# -----------------------------
+# Tests
+# -----------------------------
+def test_export_ndjson_in_batches(session_factory):
+    """
+    Purpose: Validate batched NDJSON export.
+    Scenario: Export one sensor's 7 readings with a batch size of 3.
+    Expected: Three chunks with 3, 3 and 1 lines, ordered by timestamp.
+    """
+    batches = iter_reading_batches(session_factory, 3, sensor_unit_id=SENSOR_ID)
+    chunks = list(stream_readings(batches, "ndjson"))
+    assert [chunk.count(b"\n") for chunk in chunks] == [3, 3, 1]
+    lines = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+    assert [line["temperature_value"] for line in lines] == [float(i) for i in range(7)]
+    assert all(line["sensor_unit_id"] == str(SENSOR_ID) for line in lines)
+
+
+def test_export_csv_with_time_range(session_factory):
+    """
+    Purpose: Validate CSV export with a time range filter.
+    Scenario: Export the readings between minutes 2 and 5.
+    Expected: A header row followed by the three readings in range.
+    """
+    start = datetime(2026, 10, 17, 8, 2)
+    batches = iter_reading_batches(
+        session_factory, 100, sensor_unit_id=SENSOR_ID, start=start, end=start + timedelta(minutes=3)
+    )
+    rows = list(csv.reader(io.StringIO(b"".join(stream_readings(batches, "csv")).decode())))
+    assert rows[0] == ["id", "sensor_unit_id", "control_unit_id", "timestamp", "humidity_value", "temperature_value"]
+    assert [row[5] for row in rows[1:]] == ["2.0", "3.0", "4.0"]
+
+
+def test_export_csv_without_readings_has_header(session_factory):
+    """
+    Purpose: Ensure an empty CSV export is still a valid CSV document.
+    Scenario: Export a sensor without readings.
+    Expected: Only the header row is returned.
+    """
+    batches = iter_reading_batches(session_factory, 100, sensor_unit_id=uuid4())
+    assert b"".join(stream_readings(batches, "csv")).decode().splitlines() == [
+        "id,sensor_unit_id,control_unit_id,timestamp,humidity_value,temperature_value"
+    ]
+
+
+def test_export_parquet_row_group_per_batch(session_factory):
+    """
+    Purpose: Validate column-batched Parquet export.
+    Scenario: Export one sensor's 7 readings as zstd Parquet with a batch size of 3.
+    Expected: A readable Parquet file with 3 row groups, the readings in order and typed columns.
+    """
+    batches = iter_reading_batches(session_factory, 3, sensor_unit_id=SENSOR_ID)
+    parquet_file = pq.ParquetFile(io.BytesIO(b"".join(stream_readings(batches, "parquet", "zstd"))))
+    table = parquet_file.read()
+    assert parquet_file.num_row_groups == 3
+    assert parquet_file.metadata.row_group(0).column(0).compression == "ZSTD"
+    assert table.column("temperature_value").to_pylist() == [float(i) for i in range(7)]
+    assert table.schema.field("timestamp").type == pa.timestamp("us", tz="UTC")
+
+
+def test_export_arrow_ipc_file(session_factory):
+    """
+    Purpose: Validate Arrow IPC export.
+    Scenario: Export all readings as an uncompressed Arrow IPC file.
+    Expected: The file opens with pyarrow and holds every reading.
+    """
+    batches = iter_reading_batches(session_factory, 100)
+    table = pa.ipc.open_file(pa.BufferReader(b"".join(stream_readings(batches, "arrow", "none")))).read_all()
+    assert table.num_rows == 8
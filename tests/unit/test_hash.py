@@ -0,0 +1,173 @@
+import asyncio
+import threading
+import time
+from app.config.settings import settings
+from app.utils import hash as password_hash
+from app.utils.hash import (
+    PasswordHashPoolBusy,
+    get_password_hash,
+    get_password_hash_async,
+    verify_dummy_password_async,
+    verify_password_async,
+)
+from app.utils.metrics import metrics
+
+
+def test_async_hashing_round_trip():
+    """
+    Purpose: Validate hashing and verification on the password hashing pool.
+    Scenario: Hash a password asynchronously, then verify the right and a wrong password.
+    Expected: The hash verifies the original password only.
+    """
+    async def run():
+        hashed = await get_password_hash_async("s3cret")
+        return await verify_password_async("s3cret", hashed), await verify_password_async("wrong", hashed)
+
+    assert asyncio.run(run()) == (True, False)
+
+
+def test_hash_pool_caps_concurrency_and_records_queue_wait(monkeypatch):
+    """
+    Purpose: Validate the concurrency cap and queue-wait metrics of the password hashing pool.
+    Scenario: Run twice as many slow verifications as there are pool workers concurrently.
+    Expected: At most PASSWORD_HASH_WORKERS run at once, the event loop stays responsive,
+              and every call records its queue wait.
+    """
+    workers = settings.PASSWORD_HASH_WORKERS
+    lock, running, peak = threading.Lock(), [0], [0]
+
+    def slow_verify(plain_password, hashed_password):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return True
+
+    monkeypatch.setattr(password_hash, "verify_password", slow_verify)
+    before = metrics.snapshot()["summaries"].get("password_hash.queue_wait_seconds", {}).get("count", 0)
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        results = await asyncio.gather(*(verify_password_async("p", "h") for _ in range(2 * workers)))
+        ticking.cancel()
+        return results, ticks
+
+    results, ticks = asyncio.run(run())
+    summary = metrics.snapshot()["summaries"]["password_hash.queue_wait_seconds"]
+    assert all(results)
+    assert peak[0] == workers
+    assert ticks >= 10
+    assert summary["count"] - before == 2 * workers
+    assert summary["max"] >= 0.04
+    assert metrics.snapshot()["gauges"]["password_hash.pending"] == 0
+
+
+def test_sync_hash_still_available():
+    """
+    Purpose: Ensure the synchronous helpers keep working for scripts and sync code paths.
+    Scenario: Hash a password synchronously.
+    Expected: A bcrypt hash is returned.
+    """
+    assert get_password_hash("abc").startswith("$2")
+
+
+def test_pending_verifications_are_capped(monkeypatch):
+    """
+    Purpose: Validate the global cap on pending password verifications.
+    Scenario: Start four slow verifications concurrently with LOGIN_MAX_PENDING_VERIFICATIONS set to 2.
+    Expected: Two verifications run, the other two fail fast with PasswordHashPoolBusy, and nothing stays pending.
+    """
+    monkeypatch.setattr(settings, "LOGIN_MAX_PENDING_VERIFICATIONS", 2)
+    monkeypatch.setattr(password_hash, "verify_password", lambda plain_password, hashed_password: time.sleep(0.05) or True)
+
+    async def run():
+        return await asyncio.gather(*(verify_password_async("p", "h") for _ in range(4)), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert results.count(True) == 2
+    assert sum(isinstance(result, PasswordHashPoolBusy) for result in results) == 2
+    assert metrics.snapshot()["gauges"]["password_hash.pending"] == 0
+
+
+def test_dummy_verification_costs_a_real_check():
+    """
+    Purpose: Ensure unknown usernames are checked against a real bcrypt hash.
+    Scenario: Verify a password against the dummy hash.
+    Expected: The check fails and takes as long as a bcrypt verification, not a fast path.
+    """
+    asyncio.run(verify_dummy_password_async("warm-up"))
+    started = time.perf_counter()
+    assert asyncio.run(verify_dummy_password_async("guess")) is False
+    assert time.perf_counter() - started >= 0.5 * _time_verification()
+
+
+def _time_verification() -> float:
+    hashed = get_password_hash("reference")
+    started = time.perf_counter()
+    password_hash.verify_password("guess", hashed)
+    return time.perf_counter() - started
+
+
+def test_cancelled_queued_call_releases_pending(monkeypatch):
+    """
+    Purpose: Ensure a call cancelled while still queued does not stay counted as pending.
+    Scenario: Block every pool worker, queue one more verification and cancel it, then let the workers finish.
+    Expected: The pending gauge returns to zero.
+    """
+    workers = settings.PASSWORD_HASH_WORKERS
+    release = threading.Event()
+    monkeypatch.setattr(password_hash, "verify_password", lambda plain_password, hashed_password: release.wait(5))
+
+    async def run():
+        running = [asyncio.ensure_future(verify_password_async("p", "h")) for _ in range(workers)]
+        queued = asyncio.ensure_future(verify_password_async("p", "h"))
+        await asyncio.sleep(0.05)
+        queued.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*running)
+        return queued.cancelled()
+
+    assert asyncio.run(run())
+    assert metrics.snapshot()["gauges"]["password_hash.pending"] == 0
+
+
+def test_cancelled_verifications_do_not_lower_the_cap(monkeypatch):
+    """
+    Purpose: Ensure cancelled logins give their slot under LOGIN_MAX_PENDING_VERIFICATIONS back.
+    Scenario: With the pool busy and the cap two above the worker count, queue two verifications and cancel
+              them, three times over, then queue two more.
+    Expected: The last two are admitted instead of failing with PasswordHashPoolBusy.
+    """
+    workers = settings.PASSWORD_HASH_WORKERS
+    release = threading.Event()
+    monkeypatch.setattr(settings, "LOGIN_MAX_PENDING_VERIFICATIONS", workers + 2)
+    monkeypatch.setattr(password_hash, "verify_password", lambda plain_password, hashed_password: release.wait(5))
+
+    async def run():
+        running = [asyncio.ensure_future(verify_password_async("p", "h")) for _ in range(workers)]
+        await asyncio.sleep(0.05)
+        for _ in range(3):
+            queued = [asyncio.ensure_future(verify_password_async("p", "h")) for _ in range(2)]
+            await asyncio.sleep(0)
+            for call in queued:
+                call.cancel()
+            await asyncio.gather(*queued, return_exceptions=True)
+        admitted = [asyncio.ensure_future(verify_password_async("p", "h")) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*running, *admitted, return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert results == [True] * (workers + 2)
+    assert metrics.snapshot()["gauges"]["password_hash.pending"] == 0
@@ -0,0 +1,173 @@
+import threading
+import time
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from uuid import uuid4
+from datetime import datetime
+from app.db.connection import Base
+from app.models.control_unit_model import ControlUnitData
+from app.services import ingest_queue as ingest_queue_module
+from app.services.control_unit_service import flatten_device_data, save_readings
+from app.services.ingest_queue import IngestQueue, IngestQueueFull
+from app.api.v1.schemas.control_unit_schema import DeviceData, TimestampGroup, SensorUnitReading
+from app.utils.metrics import metrics
+
+
+# -----------------------------
+# Fixtures
+# -----------------------------
+@pytest.fixture(scope="function")
+def session_factory(tmp_path):
+    """
+    Provides a session factory for a file-based SQLite database usable from the worker thread.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'ingest.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+def make_rows(readings: int) -> list[tuple]:
+    """
+    Builds flattened rows for a single timestamp group with the given number of readings.
+    """
+    data = DeviceData(
+        control_unit_id=uuid4(),
+        timestamp_groups=[
+            TimestampGroup(
+                timestamp=int(datetime.now().timestamp()),
+                sensor_units=[
+                    SensorUnitReading(sensor_unit_id=uuid4(), temperature=5.0, humidity=40.0) for _ in range(readings)
+                ],
+            )
+        ],
+    )
+    return flatten_device_data(data)
+
+
+def count_rows(session_factory) -> int:
+    db = session_factory()
+    try:
+        return db.query(ControlUnitData).count()
+    finally:
+        db.close()
+
+
+# -----------------------------
+# Tests
+# -----------------------------
+def test_stop_flushes_pending_readings(session_factory):
+    """
+    Purpose: Validate flush-on-shutdown.
+    Scenario: Submit fewer readings than the batch size with a long flush interval, then stop.
+    Expected: All readings are written by the time stop() returns.
+    """
+    queue = IngestQueue(session_factory, capacity=100, batch_size=50, flush_interval=60)
+    queue.start()
+    queue.submit(make_rows(3))
+    queue.stop()
+    assert count_rows(session_factory) == 3
+    assert queue.depth == 0
+
+
+def test_batch_size_triggers_flush(session_factory):
+    """
+    Purpose: Validate size-triggered flushing.
+    Scenario: Submit a full batch while the flush interval is long.
+    Expected: The batch is written without waiting for the interval.
+    """
+    metrics.reset()
+    queue = IngestQueue(session_factory, capacity=100, batch_size=4, flush_interval=60)
+    queue.start()
+    try:
+        queue.submit(make_rows(4))
+        deadline = time.monotonic() + 5
+        while count_rows(session_factory) < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert count_rows(session_factory) == 4
+    finally:
+        queue.stop()
+    snapshot = metrics.snapshot()
+    assert snapshot["summaries"]["ingest_queue.batch_size"]["max"] == 4
+    assert snapshot["summaries"]["ingest_queue.flush_seconds"]["count"] >= 1
+
+
+def test_full_queue_rejects_submission(session_factory):
+    """
+    Purpose: Validate backpressure when the queue is at capacity.
+    Scenario: Submit more readings than the capacity allows before the worker runs.
+    Expected: IngestQueueFull is raised and the rejected readings are counted.
+    """
+    metrics.reset()
+    queue = IngestQueue(session_factory, capacity=5, batch_size=100, flush_interval=60)
+    queue.submit(make_rows(4))
+    with pytest.raises(IngestQueueFull):
+        queue.submit(make_rows(2))
+    assert queue.depth == 4
+    assert metrics.snapshot()["counters"]["ingest_queue.rejected_readings"] == 2
+
+
+def test_failed_flush_is_retried(session_factory, monkeypatch):
+    """
+    Purpose: Validate that acknowledged readings are not lost when a flush fails.
+    Scenario: The first two writes fail; submit readings, then stop.
+    Expected: The batch is put back and retried until it is written; failed attempts are counted and the
+              readings in flight keep counting toward the capacity while they are retried.
+    """
+    metrics.reset()
+    monkeypatch.setattr(ingest_queue_module, "_RETRY_INITIAL_SECONDS", 0.01)
+    attempts, rejected = [], []
+
+    def flaky_save_readings(db, rows):
+        attempts.append(len(rows))
+        if len(attempts) <= 2:
+            try:
+                queue.submit(make_rows(3))
+            except IngestQueueFull:
+                rejected.append(3)
+            raise RuntimeError("database unavailable")
+        return save_readings(db, rows)
+
+    monkeypatch.setattr(ingest_queue_module, "save_readings", flaky_save_readings)
+    queue = IngestQueue(session_factory, capacity=5, batch_size=3, flush_interval=60)
+    queue.start()
+    queue.submit(make_rows(3))
+    queue.stop(timeout=5)
+
+    assert attempts == [3, 3, 3]
+    assert rejected == [3, 3]
+    assert count_rows(session_factory) == 3
+    assert metrics.snapshot()["counters"]["ingest_queue.failed_readings"] == 6
+
+
+def test_restart_after_timed_out_stop_reuses_worker(session_factory, monkeypatch):
+    """
+    Purpose: Validate that a stop() that times out does not lead to two workers draining the queue.
+    Scenario: Writes fail while stop() waits with a short timeout, then the queue is started again
+              and the database recovers.
+    Expected: The original worker keeps running and is reused by start(); the readings are written once.
+    """
+    monkeypatch.setattr(ingest_queue_module, "_RETRY_INITIAL_SECONDS", 0.01)
+    monkeypatch.setattr(ingest_queue_module, "_RETRY_MAX_SECONDS", 0.01)
+    healthy = threading.Event()
+
+    def failing_save_readings(db, rows):
+        if not healthy.is_set():
+            raise RuntimeError("database unavailable")
+        return save_readings(db, rows)
+
+    monkeypatch.setattr(ingest_queue_module, "save_readings", failing_save_readings)
+    queue = IngestQueue(session_factory, capacity=10, batch_size=2, flush_interval=60)
+    queue.start()
+    queue.submit(make_rows(2))
+    queue.stop(timeout=0.1)
+    queue.start()
+    workers = [thread for thread in threading.enumerate() if thread.name == "ingest-queue"]
+    assert len(workers) == 1
+
+    healthy.set()
+    queue.stop(timeout=5)
+    assert not workers[0].is_alive()
+    assert count_rows(session_factory) == 2
@@ -0,0 +1,60 @@
+import hashlib
+import time
+from datetime import timedelta
+from app.utils.JWT import VerifiedTokenCache, create_access_token, decode_access_token, verified_tokens
+from app.utils.metrics import metrics
+
+
+def hits() -> int:
+    return metrics.snapshot()["counters"].get("jwt_cache.hits", 0)
+
+
+def test_repeated_decode_is_served_from_cache():
+    """
+    Purpose: Validate that a verified token is decoded once and then served from the cache.
+    Scenario: Decode the same token twice and mutate the first returned payload.
+    Expected: The second decode is a cache hit and returns the original claims.
+    """
+    token = create_access_token({"sub": "user", "role": "admin"})
+    before = hits()
+
+    first = decode_access_token(token)
+    first["role"] = "customer"
+    second = decode_access_token(token)
+
+    assert hits() - before == 1
+    assert second["role"] == "admin"
+
+
+def test_invalid_tokens_are_not_cached():
+    """
+    Purpose: Ensure only verified tokens enter the cache.
+    Scenario: Decode a token with a tampered signature and an already expired token.
+    Expected: Both return None and the cache does not grow.
+    """
+    token = create_access_token({"sub": "user", "role": "admin"})
+    expired = create_access_token({"sub": "user", "role": "admin"}, expires_delta=timedelta(seconds=-1))
+    size = verified_tokens.size
+
+    assert decode_access_token(token[:-2] + ("A" if token[-2] != "A" else "B") + token[-1]) is None
+    assert decode_access_token(expired) is None
+    assert verified_tokens.size == size
+
+
+def test_entries_expire_with_token_and_are_bounded():
+    """
+    Purpose: Validate exp handling and the LRU bound of the cache.
+    Scenario: Cache a payload whose exp has passed, then overfill a cache of two.
+    Expected: The expired payload is not served and the oldest entry is evicted.
+    """
+    cache = VerifiedTokenCache(max_size=2)
+    digest = hashlib.sha256(b"expired").digest()
+    cache.put(digest, {"sub": "user", "exp": time.time() - 1})
+    assert cache.get(digest) is None
+
+    digests = [hashlib.sha256(str(index).encode()).digest() for index in range(3)]
+    for digest in digests:
+        cache.put(digest, {"sub": "user", "exp": time.time() + 60})
+    assert cache.size == 2
+    assert cache.get(digests[0]) is None
+    assert cache.get(digests[2])["sub"] == "user"
@@ -0,0 +1,93 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from uuid import uuid4
+from datetime import datetime, timedelta
+from app.db.connection import Base
+from app.services.control_unit_service import save_readings, delete_control_unit_data
+from app.services.latest_reading_cache import LatestReadingCache, latest_readings
+
+NOW = datetime(2026, 10, 17, 12, 0)
+
+
+# -----------------------------
+# Fixtures
+# -----------------------------
+@pytest.fixture(scope="function")
+def db_session():
+    """
+    Provides an in-memory SQLite session for latest-reading cache tests.
+    """
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+def reading(sensor_id, control_unit_id, minutes: int, temperature: float) -> tuple:
+    return (uuid4(), sensor_id, control_unit_id, NOW + timedelta(minutes=minutes), 50.0, temperature)
+
+
+# -----------------------------
+# Tests
+# -----------------------------
+def test_update_keeps_newest_reading_per_sensor():
+    """
+    Purpose: Validate that only newer readings replace the cached one.
+    Scenario: Update the cache with readings out of timestamp order.
+    Expected: The sensor and its control unit resolve to the newest reading.
+    """
+    cache = LatestReadingCache()
+    sensor_id, control_unit_id = uuid4(), uuid4()
+    newest = reading(sensor_id, control_unit_id, 5, 3.0)
+    cache.update([reading(sensor_id, control_unit_id, 1, 1.0), newest])
+    cache.update([reading(sensor_id, control_unit_id, 2, 2.0)])
+    assert cache.get_sensor(sensor_id) == newest
+    assert cache.get_control_unit(control_unit_id) == [newest]
+
+
+def test_sensor_moves_between_control_units():
+    """
+    Purpose: Validate the control unit index when a sensor reports through a new control unit.
+    Scenario: Cache a reading via one control unit, then a newer one via another.
+    Expected: The sensor is only listed under the new control unit.
+    """
+    cache = LatestReadingCache()
+    sensor_id, old_unit, new_unit = uuid4(), uuid4(), uuid4()
+    cache.update([reading(sensor_id, old_unit, 0, 1.0)])
+    cache.update([reading(sensor_id, new_unit, 1, 2.0)])
+    assert cache.get_control_unit(old_unit) == []
+    assert [row[2] for row in cache.get_control_unit(new_unit)] == [new_unit]
+
+
+def test_warm_loads_latest_reading_per_sensor(db_session):
+    """
+    Purpose: Validate warming the cache from the database.
+    Scenario: Store several readings for two sensors, then warm an empty cache.
+    Expected: Each sensor resolves to its newest stored reading.
+    """
+    control_unit_id, sensors = uuid4(), [uuid4(), uuid4()]
+    rows = [reading(sensor_id, control_unit_id, minutes, float(minutes)) for sensor_id in sensors for minutes in (3, 9, 1)]
+    save_readings(db_session, rows)
+
+    cache = LatestReadingCache()
+    assert cache.warm(db_session) == 2
+    assert [cache.get_sensor(sensor_id)[5] for sensor_id in sensors] == [9.0, 9.0]
+
+
+def test_ingest_and_delete_keep_cache_current(db_session):
+    """
+    Purpose: Validate that the write paths maintain the process-wide cache.
+    Scenario: Save two readings for a sensor, then delete the newest one.
+    Expected: The cache first holds the newest reading, then falls back to the remaining one.
+    """
+    sensor_id, control_unit_id = uuid4(), uuid4()
+    older, newer = reading(sensor_id, control_unit_id, 0, 1.0), reading(sensor_id, control_unit_id, 1, 2.0)
+    save_readings(db_session, [older, newer])
+    assert latest_readings.get_sensor(sensor_id)[0] == newer[0]
+
+    delete_control_unit_data(db_session, newer[0])
+    assert latest_readings.get_sensor(sensor_id)[0] == older[0]
@@ -0,0 +1,137 @@
+import asyncio
+import json
+import threading
+from uuid import uuid4
+from datetime import datetime, timedelta
+from app.api.v1.endpoints.control_unit import live
+from app.services.live_feed import LiveFeed, live_feed, stream_events
+
+NOW = datetime(2026, 10, 17, 12, 0)
+
+
+def reading(sensor_id, minutes: int, temperature: float) -> tuple:
+    return (uuid4(), sensor_id, uuid4(), NOW + timedelta(minutes=minutes), 50.0, temperature)
+
+
+def test_publish_from_worker_thread_reaches_sensor_subscribers():
+    """
+    Purpose: Validate fan-out from an ingest thread to event-loop subscribers.
+    Scenario: Subscribe to two sensors, publish a mixed, unordered batch from another thread.
+    Expected: Each subscriber receives only its sensor's readings, in timestamp order.
+    """
+    feed = LiveFeed()
+    sensor_a, sensor_b = uuid4(), uuid4()
+    batch = [reading(sensor_a, 2, 2.0), reading(sensor_b, 0, 9.0), reading(sensor_a, 1, 1.0)]
+
+    async def run():
+        subscription_a = feed.subscribe(sensor_a, 10)
+        subscription_b = feed.subscribe(sensor_b, 10)
+        publisher = threading.Thread(target=feed.publish, args=(batch,))
+        publisher.start()
+        publisher.join()
+        return await subscription_a.get(10), await subscription_b.get(10)
+
+    rows_a, rows_b = asyncio.run(run())
+    assert [row[5] for row in rows_a] == [1.0, 2.0]
+    assert [row[5] for row in rows_b] == [9.0]
+    assert feed.subscriber_count == 2
+
+
+def test_slow_consumer_is_dropped():
+    """
+    Purpose: Validate that a subscriber whose buffer overflows is dropped instead of blocking the publisher.
+    Scenario: Subscribe with a 3-reading buffer and publish 2 batches of 2 readings without consuming.
+    Expected: The first batch is buffered; the second fills the buffer and drops the subscriber, whose
+              stream ends with a "dropped" event.
+    """
+    sensor_id = uuid4()
+
+    async def run():
+        subscription = live_feed.subscribe(sensor_id, 3)
+        live_feed.publish([reading(sensor_id, 0, 1.0), reading(sensor_id, 1, 2.0)])
+        live_feed.publish([reading(sensor_id, 2, 3.0), reading(sensor_id, 3, 4.0)])
+        await asyncio.sleep(0)
+        events = [event async for event in stream_events(subscription, heartbeat_seconds=1)]
+        return subscription, events
+
+    subscription, events = asyncio.run(run())
+    assert subscription.dropped
+    assert events[0] == ": subscribed\n\n"
+    assert events[-1].startswith("event: dropped")
+    assert live_feed.subscriber_count == 0
+
+
+def test_batch_larger_than_buffer_keeps_subscriber():
+    """
+    Purpose: Validate that one large batch (e.g. a backlog upload) does not disconnect a subscriber that keeps up.
+    Scenario: Subscribe with a 3-reading buffer, publish one batch of 5 readings, consume, then publish 2 more.
+    Expected: The subscriber stays connected, receives the newest 3 readings of the batch and then the next 2.
+    """
+    sensor_id = uuid4()
+
+    async def run():
+        subscription = live_feed.subscribe(sensor_id, 3)
+        live_feed.publish([reading(sensor_id, minute, float(minute)) for minute in range(5)])
+        first = await subscription.get(10)
+        live_feed.publish([reading(sensor_id, 5, 5.0), reading(sensor_id, 6, 6.0)])
+        second = await subscription.get(10)
+        live_feed.unsubscribe(subscription)
+        return subscription, first, second
+
+    subscription, first, second = asyncio.run(run())
+    assert not subscription.dropped
+    assert [row[5] for row in first] == [2.0, 3.0, 4.0]
+    assert [row[5] for row in second] == [5.0, 6.0]
+
+
+def test_live_endpoint_unsubscribes_when_client_leaves_before_streaming():
+    """
+    Purpose: Validate that the /live subscription is removed even if the stream generator never starts.
+    Scenario: Call the endpoint, then run its response with a client that disconnects while the
+              response headers are still being sent.
+    Expected: No subscription is left behind.
+    """
+    sensor_id = uuid4()
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        # Never completes, so the body generator is not iterated before the disconnect is seen
+        await asyncio.Event().wait()
+
+    async def run():
+        response = await live(sensor_unit_id=sensor_id, shipment_id=None, db=None)
+        assert live_feed.subscriber_count == 1
+        await response({"type": "http", "method": "GET"}, receive, send)
+
+    asyncio.run(run())
+    assert live_feed.subscriber_count == 0
+
+
+def test_stream_events_formats_readings_and_heartbeats():
+    """
+    Purpose: Validate the Server-Sent Events encoding.
+    Scenario: Stream a subscription that is idle for one heartbeat, then receives a reading.
+    Expected: A keep-alive comment, then a "reading" event whose id and JSON data describe the reading.
+    """
+    sensor_id = uuid4()
+    row = reading(sensor_id, 0, 4.5)
+
+    async def run():
+        subscription = live_feed.subscribe(sensor_id, 10)
+        events = stream_events(subscription, heartbeat_seconds=0.05)
+        received = [await anext(events), await anext(events)]
+        live_feed.publish([row])
+        received.append(await anext(events))
+        await events.aclose()
+        return received
+
+    subscribed, heartbeat, event = asyncio.run(run())
+    assert (subscribed, heartbeat) == (": subscribed\n\n", ": keep-alive\n\n")
+    lines = event.strip().split("\n")
+    assert lines[:2] == ["event: reading", f"id: {row[0]}"]
+    data = json.loads(lines[2].removeprefix("data: "))
+    assert data["sensor_unit_id"] == str(sensor_id)
+    assert data["temperature_value"] == 4.5
+    assert live_feed.subscriber_count == 0
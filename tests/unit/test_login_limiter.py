@@ -0,0 +1,75 @@
+from uuid import uuid4
+import pytest
+from app.db.connection import SessionLocal
+from app.services.login_limiter import DatabaseAttemptStore, LoginLimiter, MemoryAttemptStore
+
+
+@pytest.fixture(params=["memory", "database"])
+def store(request):
+    return MemoryAttemptStore() if request.param == "memory" else DatabaseAttemptStore(SessionLocal)
+
+
+def test_username_limit_slides_with_the_window(store):
+    """
+    Purpose: Validate the per-key sliding window and the reported retry time.
+    Scenario: Make three attempts for a key limited to two per 10 seconds, then retry as the window slides.
+    Expected: The third attempt is rejected until the first one leaves the window.
+    """
+    key = f"username:{uuid4()}"
+    assert store.admit({key: 2}, 10, now=1_000.0) == 0
+    assert store.admit({key: 2}, 10, now=1_004.0) == 0
+    assert store.admit({key: 2}, 10, now=1_006.0) == pytest.approx(4.0)
+    assert store.admit({key: 2}, 10, now=1_010.5) == 0
+    assert store.admit({key: 2}, 10, now=1_011.0) == pytest.approx(3.0)
+
+
+def test_rejected_attempts_are_not_recorded_and_reset_clears(store):
+    """
+    Purpose: Ensure rejections do not extend a lockout and that reset forgets a key.
+    Scenario: Exhaust one key of a two-key attempt, retry, reset the key, then retry.
+    Expected: The other key is not charged for the rejected attempt; after reset the attempt is admitted.
+    """
+    username, ip = f"username:{uuid4()}", f"ip:{uuid4()}"
+    assert store.admit({username: 1, ip: 2}, 10, now=1_000.0) == 0
+    assert store.admit({username: 1, ip: 2}, 10, now=1_001.0) > 0
+    store.reset(username)
+    assert store.admit({username: 1, ip: 2}, 10, now=1_002.0) == 0
+    assert store.admit({f"username:{uuid4()}": 1, ip: 2}, 10, now=1_003.0) > 0
+
+
+def test_release_forgets_the_latest_attempt(store):
+    """
+    Purpose: Ensure release uncounts exactly one attempt of a key.
+    Scenario: Fill a key limited to two attempts, release it, then attempt twice more.
+    Expected: One attempt is admitted after the release, the next is rejected.
+    """
+    key = f"ip:{uuid4()}"
+    assert store.admit({key: 2}, 10, now=1_000.0) == 0
+    assert store.admit({key: 2}, 10, now=1_001.0) == 0
+    store.release(key)
+    store.release(f"ip:{uuid4()}")
+    assert store.admit({key: 2}, 10, now=1_002.0) == 0
+    assert store.admit({key: 2}, 10, now=1_003.0) > 0
+
+
+def test_limiter_counts_per_username_and_per_ip():
+    """
+    Purpose: Validate the combined username and client IP limits of LoginLimiter.
+    Scenario: One client tries several usernames; another client tries one username repeatedly.
+    Expected: The first is stopped by the IP limit, the second by the username limit; success clears the username
+        and is not counted against the client IP.
+    """
+    limiter = LoginLimiter(MemoryAttemptStore(), window_seconds=60, max_per_username=2, max_per_ip=3)
+
+    assert [limiter.admit(f"user{index}", "10.0.0.1") == 0 for index in range(4)] == [True, True, True, False]
+
+    assert limiter.admit("alice", "10.0.0.2") == 0
+    assert limiter.admit("alice", "10.0.0.3") == 0
+    assert limiter.admit("alice", "10.0.0.4") > 0
+    limiter.succeeded("alice", "10.0.0.4")
+    assert limiter.admit("alice", "10.0.0.4") == 0
+
+    for _ in range(5):
+        assert limiter.admit("bob", "10.0.0.5") == 0
+        limiter.succeeded("bob", "10.0.0.5")
+    assert [limiter.admit(f"user{index}", "10.0.0.5") == 0 for index in range(4)] == [True, True, True, False]
@@ -0,0 +1,36 @@
+import asyncio
+import pytest
+from app.utils.ndjson import iter_ndjson_lines, NDJSONLineTooLong
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+def collect(chunks, max_line_bytes: int = 1024) -> list[tuple[int, bytes]]:
+    async def run():
+        return [item async for item in iter_ndjson_lines(chunks, max_line_bytes)]
+
+    return asyncio.run(run())
+
+
+def test_lines_split_across_chunks():
+    """
+    Purpose: Validate that lines spanning chunk boundaries are reassembled.
+    Scenario: Stream two lines split at arbitrary byte offsets, with a blank line and no trailing newline.
+    Expected: Two lines are yielded with their original line numbers.
+    """
+    lines = collect(_chunks(b'{"a"', b': 1}\n\n{"b', b'": 2}'))
+    assert lines == [(1, b'{"a": 1}'), (3, b'{"b": 2}')]
+
+
+def test_line_too_long():
+    """
+    Purpose: Validate the per-line size guard.
+    Scenario: Stream a line longer than max_line_bytes without a newline.
+    Expected: NDJSONLineTooLong is raised for line 1.
+    """
+    with pytest.raises(NDJSONLineTooLong) as exc:
+        collect(_chunks(b"x" * 10, b"x" * 10), max_line_bytes=15)
+    assert exc.value.line_number == 1
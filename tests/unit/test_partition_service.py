@@ -0,0 +1,172 @@
+import os
+import pytest
+from datetime import datetime, timezone
+from uuid import uuid4
+from sqlalchemy import create_engine, text
+from app.services.partition_service import (
+    maintain_partitions,
+    next_period,
+    parse_partition_name,
+    partition_name,
+    period_start,
+)
+
+UTC = timezone.utc
+
+# PostgreSQL server for the postgres-marked tests, e.g. postgresql+psycopg://postgres@localhost/test
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+@pytest.fixture
+def pg_engine():
+    """
+    Provides an engine whose search_path is a scratch schema holding a partitioned control_unit_data
+    table with only a default partition, as left by the partitioning migration.
+    """
+    if not POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    schema = f"partition_test_{uuid4().hex[:8]}"
+    admin = create_engine(POSTGRES_URL)
+    with admin.begin() as connection:
+        connection.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = create_engine(POSTGRES_URL, connect_args={"options": f"-csearch_path={schema}"})
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE control_unit_data (id uuid NOT NULL, sensor_unit_id uuid NOT NULL, "
+                "control_unit_id uuid NOT NULL, timestamp timestamptz NOT NULL, humidity_value float NOT NULL, "
+                "temperature_value float NOT NULL, PRIMARY KEY (id, timestamp)) PARTITION BY RANGE (timestamp)"
+            )
+        )
+        connection.execute(text("CREATE TABLE control_unit_data_default PARTITION OF control_unit_data DEFAULT"))
+    yield engine
+    engine.dispose()
+    with admin.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+    admin.dispose()
+
+
+def insert_readings(engine, *timestamps: datetime) -> None:
+    rows = [
+        {"id": uuid4(), "sensor": uuid4(), "control": uuid4(), "ts": ts, "humidity": 50.0, "temperature": 5.0}
+        for ts in timestamps
+    ]
+    with engine.begin() as connection:
+        connection.execute(
+            text("INSERT INTO control_unit_data VALUES (:id, :sensor, :control, :ts, :humidity, :temperature)"),
+            rows,
+        )
+
+
+def rows_per_table(engine) -> dict[str, int]:
+    with engine.connect() as connection:
+        query = "SELECT tableoid::regclass::text, count(*) FROM control_unit_data GROUP BY 1"
+        return dict(connection.execute(text(query)).all())
+
+
+# -----------------------------
+# Period calculations
+# -----------------------------
+def test_period_start_aligns_to_day_and_month():
+    """
+    Purpose: Verify timestamps are aligned to the start of their partition period.
+    Scenario: Align a mid-day timestamp with daily and monthly intervals.
+    Expected: Daily aligns to midnight UTC, monthly to the first of the month.
+    """
+    ts = datetime(2026, 10, 17, 13, 45, 12, tzinfo=UTC)
+    assert period_start(ts, "daily") == datetime(2026, 10, 17, tzinfo=UTC)
+    assert period_start(ts, "monthly") == datetime(2026, 10, 1, tzinfo=UTC)
+
+
+def test_next_period_rolls_over_year_end():
+    """
+    Purpose: Verify the next period is computed across month and year boundaries.
+    Scenario: Advance from the last day and month of a year.
+    Expected: The next period starts on January 1st of the following year.
+    """
+    assert next_period(datetime(2026, 12, 1, tzinfo=UTC), "monthly") == datetime(2027, 1, 1, tzinfo=UTC)
+    assert next_period(datetime(2026, 12, 31, tzinfo=UTC), "daily") == datetime(2027, 1, 1, tzinfo=UTC)
+
+
+def test_partition_name_round_trip():
+    """
+    Purpose: Verify partition names encode their range.
+    Scenario: Build daily and monthly names and parse them back.
+    Expected: Parsing returns the [start, end) range; unrelated names return None.
+    """
+    monthly = partition_name(datetime(2026, 10, 1, tzinfo=UTC), "monthly")
+    daily = partition_name(datetime(2026, 10, 17, tzinfo=UTC), "daily")
+    assert monthly == "control_unit_data_p202610"
+    assert daily == "control_unit_data_p20261017"
+    assert parse_partition_name(monthly) == (datetime(2026, 10, 1, tzinfo=UTC), datetime(2026, 11, 1, tzinfo=UTC))
+    assert parse_partition_name(daily) == (datetime(2026, 10, 17, tzinfo=UTC), datetime(2026, 10, 18, tzinfo=UTC))
+    assert parse_partition_name("control_unit_data_default") is None
+
+
+# -----------------------------
+# Maintenance
+# -----------------------------
+def test_maintain_partitions_is_noop_on_sqlite():
+    """
+    Purpose: Ensure partition maintenance is safe on databases without partitioning.
+    Scenario: Run maintenance against an in-memory SQLite engine.
+    Expected: Nothing is created, detached or dropped.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    assert maintain_partitions(engine, retention_days=30) == {"created": [], "detached": [], "dropped": []}
+
+
+@pytest.mark.postgres
+def test_maintain_partitions_on_postgres(pg_engine):
+    """
+    Purpose: Exercise partition maintenance against a real partitioned table.
+    Scenario: Rows from the current month, an earlier retained month and an expired month sit in the
+              default partition; maintenance runs with one premade month and 90 days of retention,
+              then runs again.
+    Expected: The current, next and retained months get partitions holding their rows; the expired
+              month's rows are moved to their own partition which is detached and dropped, leaving the
+              default partition empty; the second run changes nothing.
+    """
+    now = datetime(2026, 10, 17, 12, tzinfo=UTC)
+    insert_readings(pg_engine, now, datetime(2026, 8, 3, tzinfo=UTC), datetime(2026, 1, 20, tzinfo=UTC))
+
+    report = maintain_partitions(pg_engine, now=now, interval="monthly", premake=1, retention_days=90, drop_expired=True)
+
+    assert report == {
+        "created": [f"control_unit_data_p2026{month}" for month in ("01", "08", "10", "11")],
+        "detached": ["control_unit_data_p202601"],
+        "dropped": ["control_unit_data_p202601"],
+    }
+    assert rows_per_table(pg_engine) == {"control_unit_data_p202608": 1, "control_unit_data_p202610": 1}
+    with pg_engine.connect() as connection:
+        assert connection.execute(text("SELECT to_regclass('control_unit_data_p202601')")).scalar() is None
+
+    again = maintain_partitions(pg_engine, now=now, interval="monthly", premake=1, retention_days=90, drop_expired=True)
+    assert again == {"created": [], "detached": [], "dropped": []}
+
+
+@pytest.mark.postgres
+def test_late_rows_for_detached_partition_do_not_break_maintenance(pg_engine):
+    """
+    Purpose: Ensure a partition detached without dropping does not make later runs fail.
+    Scenario: Expire a month with drop_expired off, insert a late reading for that month, run
+              maintenance again and then once more.
+    Expected: The late row is appended to the detached table instead of re-creating the partition
+              (which would fail with "relation already exists"); the default partition is empty and
+              the new month's partition still gets created.
+    """
+    now = datetime(2026, 10, 17, 12, tzinfo=UTC)
+    insert_readings(pg_engine, datetime(2026, 1, 20, tzinfo=UTC))
+    first = maintain_partitions(pg_engine, now=now, interval="monthly", premake=0, retention_days=90, drop_expired=False)
+    assert first["detached"] == ["control_unit_data_p202601"]
+    assert first["dropped"] == []
+
+    insert_readings(pg_engine, datetime(2026, 1, 25, tzinfo=UTC), datetime(2026, 11, 2, tzinfo=UTC))
+    later = datetime(2026, 11, 3, tzinfo=UTC)
+    second = maintain_partitions(pg_engine, now=later, interval="monthly", premake=0, retention_days=90, drop_expired=False)
+
+    assert second == {"created": ["control_unit_data_p202611"], "detached": [], "dropped": []}
+    assert rows_per_table(pg_engine) == {"control_unit_data_p202611": 1}
+    with pg_engine.connect() as connection:
+        assert connection.execute(text("SELECT count(*) FROM control_unit_data_p202601")).scalar() == 2
+        assert connection.execute(text("SELECT count(*) FROM control_unit_data_default")).scalar() == 0
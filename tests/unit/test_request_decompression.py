@@ -0,0 +1,80 @@
+import gzip
+import pytest
+import zstandard
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from app.utils.request_decompression import RequestDecompressionMiddleware
+
+
+# -----------------------------
+# Fixtures
+# -----------------------------
+@pytest.fixture
+def echo_client():
+    """
+    Provides a TestClient for a small app that reports the size of the body it received.
+    """
+    echo_app = FastAPI()
+    echo_app.add_middleware(RequestDecompressionMiddleware, max_size=1_000_000, path_prefixes=["/ingest"])
+
+    @echo_app.post("/ingest")
+    async def ingest(request: Request):
+        body = await request.body()
+        return {"size": len(body), "head": body[:5].decode(errors="replace")}
+
+    @echo_app.post("/other")
+    async def other(request: Request):
+        return {"size": len(await request.body())}
+
+    return TestClient(echo_app)
+
+
+# -----------------------------
+# Tests
+# -----------------------------
+@pytest.mark.parametrize(
+    "encoding, compress",
+    [("gzip", gzip.compress), ("zstd", lambda data: zstandard.ZstdCompressor().compress(data))],
+)
+def test_compressed_body_is_decompressed(echo_client, encoding, compress):
+    """
+    Purpose: Validate transparent decompression of gzip and zstd request bodies.
+    Scenario: POST a compressed 200 kB body with the matching Content-Encoding.
+    Expected: The endpoint sees the full decompressed body.
+    """
+    body = b"hello" + b"x" * 200_000
+    resp = echo_client.post("/ingest", content=compress(body), headers={"Content-Encoding": encoding})
+    assert resp.status_code == 200
+    assert resp.json() == {"size": len(body), "head": "hello"}
+
+
+def test_decompression_bomb_rejected(echo_client):
+    """
+    Purpose: Ensure bodies that inflate beyond the limit are rejected.
+    Scenario: POST 5 MB of zeros compressed with zstd (a few hundred bytes on the wire).
+    Expected: 413 Request Entity Too Large.
+    """
+    bomb = zstandard.ZstdCompressor().compress(b"\0" * 5_000_000)
+    resp = echo_client.post("/ingest", content=bomb, headers={"Content-Encoding": "zstd"})
+    assert resp.status_code == 413
+
+
+def test_invalid_and_unsupported_encodings(echo_client):
+    """
+    Purpose: Validate error handling for corrupt and unknown encodings.
+    Scenario: POST garbage labelled gzip, and a body labelled br.
+    Expected: 400 for the corrupt body and 415 for the unsupported encoding.
+    """
+    assert echo_client.post("/ingest", content=b"not gzip", headers={"Content-Encoding": "gzip"}).status_code == 400
+    assert echo_client.post("/ingest", content=b"abc", headers={"Content-Encoding": "br"}).status_code == 415
+
+
+def test_other_paths_untouched(echo_client):
+    """
+    Purpose: Ensure the middleware only applies to the configured path prefixes.
+    Scenario: POST a gzip body to a path outside the prefixes.
+    Expected: The endpoint receives the compressed bytes unchanged.
+    """
+    compressed = gzip.compress(b"x" * 1000)
+    resp = echo_client.post("/other", content=compressed, headers={"Content-Encoding": "gzip"})
+    assert resp.json()["size"] == len(compressed)
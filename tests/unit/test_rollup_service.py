@@ -0,0 +1,197 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from uuid import uuid4
+from datetime import datetime, timedelta
+from app.db.connection import Base
+from app.models.control_unit_model import ControlUnitData
+from app.models.sensor_rollup_model import SensorRollup1h, SensorRollup1m
+from app.api.v1.schemas.control_unit_schema import ControlUnitDataCreate, ControlUnitDataUpdate
+from app.services.control_unit_service import (
+    aggregate_control_unit_data,
+    create_control_unit_data,
+    delete_control_unit_data,
+    save_readings,
+    update_control_unit_data,
+)
+from app.services.rollup_service import backfill_rollups, bucket_start
+
+
+# -----------------------------
+# Fixtures
+# -----------------------------
+@pytest.fixture(scope="function")
+def session_factory(tmp_path):
+    """
+    Provides a session factory for a file-based SQLite database usable from worker threads.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'rollups.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+def reading(sensor_id, control_unit_id, ts, temperature, humidity=50.0) -> tuple:
+    return (uuid4(), sensor_id, control_unit_id, ts, humidity, temperature)
+
+
+def rollup_values(db, model) -> list[tuple]:
+    return [
+        (r.sensor_unit_id, r.bucket_start, r.reading_count, r.temperature_min, r.temperature_max, r.temperature_sum)
+        + (r.temperature_last,)
+        for r in db.query(model).order_by(model.sensor_unit_id, model.bucket_start)
+    ]
+
+
+# -----------------------------
+# Tests
+# -----------------------------
+def test_bucket_start_aligns_to_width():
+    """
+    Purpose: Verify timestamps are truncated to the start of their bucket.
+    Scenario: Align one timestamp to 1-minute, 5-minute and 1-hour buckets.
+    Expected: Each result is the start of the enclosing bucket.
+    """
+    ts = datetime(2026, 10, 17, 13, 47, 31, 500)
+    assert bucket_start(ts, timedelta(minutes=1)) == datetime(2026, 10, 17, 13, 47)
+    assert bucket_start(ts, timedelta(minutes=5)) == datetime(2026, 10, 17, 13, 45)
+    assert bucket_start(ts, timedelta(hours=1)) == datetime(2026, 10, 17, 13)
+
+
+def test_save_readings_updates_rollups_incrementally(session_factory):
+    """
+    Purpose: Ensure rollups are merged across batches by the ingest path.
+    Scenario: Save two batches for one sensor within the same minute, the second including a duplicate.
+    Expected: The 1m and 1h buckets hold the combined count/min/max/sum/last; the duplicate is not counted.
+    """
+    sensor_id, control_unit_id = uuid4(), uuid4()
+    minute = datetime(2026, 10, 17, 8, 30)
+    first = [reading(sensor_id, control_unit_id, minute + timedelta(seconds=10), 4.0)]
+    second = [
+        reading(sensor_id, control_unit_id, minute + timedelta(seconds=40), 7.0),
+        reading(sensor_id, control_unit_id, minute + timedelta(seconds=20), 2.0),
+        first[0],
+    ]
+
+    with session_factory() as db:
+        assert save_readings(db, first) == 1
+        assert save_readings(db, second) == 2
+
+        assert rollup_values(db, SensorRollup1m) == [(sensor_id, minute, 3, 2.0, 7.0, 13.0, 7.0)]
+        hourly = db.query(SensorRollup1h).one()
+        assert hourly.bucket_start == datetime(2026, 10, 17, 8)
+        assert hourly.reading_count == 3
+        assert hourly.last_timestamp == minute + timedelta(seconds=40)
+
+
+def test_backfill_rebuilds_rollups_in_parallel_chunks(session_factory):
+    """
+    Purpose: Verify the backfill reproduces the incrementally maintained rollups.
+    Scenario: Ingest readings over several hours, wipe the rollups, then backfill with 1-hour chunks on 3 workers.
+    Expected: Every raw reading is aggregated and the rebuilt rollups equal the incremental ones.
+    """
+    sensors, control_unit_id = [uuid4(), uuid4()], uuid4()
+    start = datetime(2026, 10, 17, 0, 0)
+    rows = [
+        reading(sensor_id, control_unit_id, start + timedelta(minutes=7 * i), float(i % 11))
+        for i in range(60)
+        for sensor_id in sensors
+    ]
+
+    with session_factory() as db:
+        save_readings(db, rows)
+        expected = {model: rollup_values(db, model) for model in (SensorRollup1m, SensorRollup1h)}
+        for model in expected:
+            db.query(model).delete()
+        db.commit()
+
+    total = backfill_rollups(chunk=timedelta(hours=1), workers=3, session_factory=session_factory)
+
+    assert total == len(rows)
+    with session_factory() as db:
+        for model, values in expected.items():
+            assert rollup_values(db, model) == values
+
+
+def test_single_reading_changes_keep_rollups_in_sync(session_factory):
+    """
+    Purpose: Ensure single-reading create, update and delete maintain the rollups like the ingest path.
+    Scenario: Ingest two readings, create a third, move one to another minute with a new temperature, delete another.
+    Expected: The rollups equal a full rebuild from the remaining raw readings.
+    """
+    sensor_id, control_unit_id = uuid4(), uuid4()
+    minute = datetime(2026, 10, 17, 9, 15)
+    kept = reading(sensor_id, control_unit_id, minute, 3.0)
+    removed = reading(sensor_id, control_unit_id, minute + timedelta(seconds=30), 9.0)
+
+    with session_factory() as db:
+        save_readings(db, [kept, removed])
+        created = create_control_unit_data(
+            db,
+            ControlUnitDataCreate(
+                sensor_unit_id=sensor_id,
+                control_unit_id=control_unit_id,
+                humidity={"value": 40.0},
+                temperature={"value": 5.0},
+                timestamp=minute + timedelta(seconds=45),
+            ),
+        )
+        update_control_unit_data(
+            db, kept[0], ControlUnitDataUpdate(temperature={"value": 1.0}, timestamp=minute + timedelta(minutes=2))
+        )
+        delete_control_unit_data(db, removed[0])
+
+        maintained = {model: rollup_values(db, model) for model in (SensorRollup1m, SensorRollup1h)}
+        assert maintained[SensorRollup1m] == [
+            (sensor_id, minute, 1, 5.0, 5.0, 5.0, 5.0),
+            (sensor_id, minute + timedelta(minutes=2), 1, 1.0, 1.0, 1.0, 1.0),
+        ]
+        assert created.temperature_value == 5.0
+        for model in maintained:
+            db.query(model).delete()
+        db.commit()
+
+    backfill_rollups(session_factory=session_factory)
+    with session_factory() as db:
+        for model, values in maintained.items():
+            assert rollup_values(db, model) == values
+
+
+def test_aligned_aggregates_are_served_from_rollups(session_factory):
+    """
+    Purpose: Verify /aggregate reads minute- and hour-aligned ranges from the rollups instead of raw readings.
+    Scenario: Ingest one reading every 20 seconds for two hours, aggregate, then delete the raw readings
+              without touching the rollups and aggregate again.
+    Expected: Aligned 5-minute and 1-hour aggregates are unchanged after the raw readings are gone; an
+              unaligned range and a control unit filter fall back to raw readings and find nothing.
+    """
+    sensor_id, control_unit_id = uuid4(), uuid4()
+    start = datetime(2026, 10, 17, 8)
+    rows = [reading(sensor_id, control_unit_id, start + timedelta(seconds=20 * i), float(i % 30)) for i in range(360)]
+
+    def aggregate(db, range_start, range_end, bucket_seconds, **filters):
+        return aggregate_control_unit_data(
+            db, range_start, range_end, bucket_seconds, ["avg", "min", "max", "sum", "count"], ["temperature"], **filters
+        )
+
+    end = start + timedelta(hours=2)
+    with session_factory() as db:
+        save_readings(db, rows)
+        by_five_minutes = aggregate(db, start, end, 300, sensor_unit_id=sensor_id)
+        hourly = aggregate(db, start, end, 3600)
+        db.query(ControlUnitData).delete()
+        db.commit()
+
+        assert aggregate(db, start, end, 300, sensor_unit_id=sensor_id) == by_five_minutes
+        assert aggregate(db, start, end, 3600) == hourly
+        assert aggregate(db, start + timedelta(seconds=30), end, 300)["bucket_start"] == []
+        assert aggregate(db, start, end, 300, control_unit_id=control_unit_id)["bucket_start"] == []
+
+    assert len(by_five_minutes["bucket_start"]) == 24
+    assert by_five_minutes["values"]["count"][0] == 15
+    assert by_five_minutes["values"]["temperature_avg"][0] == 7.0
+    assert hourly["values"]["count"] == [180, 180]
+    assert hourly["values"]["temperature_min"] == [0.0, 0.0]
+    assert hourly["values"]["temperature_max"] == [29.0, 29.0]
+    assert hourly["values"]["temperature_sum"] == [2610.0, 2610.0]
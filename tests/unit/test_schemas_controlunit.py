@@ -5,7 +5,6 @@ from app.api.v1.schemas.control_unit_schema import (
     ControlUnitDataBase,
     ControlUnitDataCreate,
     ControlUnitDataUpdate,
-    ControlUnitDataRead,
     DeviceData,
     TimestampGroup,
     SensorUnitReading,
@@ -48,6 +47,21 @@ def test_control_unit_base_invalid_empty_dict():
         )
 
 
+def test_control_unit_base_invalid_missing_value():
+    """
+    Purpose: Ensure validation fails when humidity or temperature lack a numeric "value".
+    Scenario: Provide dicts without a "value" key and with a non-numeric value.
+    Expected: Pydantic ValidationError is raised.
+    """
+    with pytest.raises(ValidationError):
+        ControlUnitDataBase(
+            sensor_unit_id=uuid4(),
+            control_unit_id=uuid4(),
+            humidity={"reading": 50},
+            temperature={"value": "warm"}
+        )
+
+
 def test_control_unit_create():
     """
     Purpose: Validate that ControlUnitDataCreate object instantiation works correctly.
@@ -75,6 +89,19 @@ def test_control_unit_update_partial():
     assert update_data.humidity is None
 
 
+def test_control_unit_update_rejects_null():
+    """
+    Purpose: Validate that ControlUnitDataUpdate rejects explicit nulls.
+    Scenario: Pass None for humidity, temperature and timestamp, and a reading without a numeric value.
+    Expected: ValidationError is raised for each.
+    """
+    for field in ("humidity", "temperature", "timestamp"):
+        with pytest.raises(ValidationError):
+            ControlUnitDataUpdate(**{field: None})
+    with pytest.raises(ValidationError):
+        ControlUnitDataUpdate(humidity={"value": "wet"})
+
+
 def test_device_data_structure():
     """
     Purpose: Validate nested DeviceData structure with TimestampGroup and SensorUnitReading.
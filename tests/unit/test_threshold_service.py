@@ -0,0 +1,243 @@
+import threading
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from uuid import uuid4
+from datetime import datetime, timedelta
+from app.db.connection import Base
+from app.models.shipment_model import Shipment
+from app.api.v1.schemas.control_unit_schema import ControlUnitDataCreate
+from app.models.threshold_model import ThresholdExcursion, ThresholdRule
+from app.services.control_unit_service import create_control_unit_data, save_readings
+from app.services.shipment_service import delete_shipment, update_shipment
+from app.services.threshold_service import ThresholdRuleIndex, threshold_rules
+
+NOW = datetime(2026, 10, 17, 12, 0)
+
+
+# -----------------------------
+# Fixtures
+# -----------------------------
+@pytest.fixture(scope="function")
+def db_session():
+    """
+    Provides an in-memory SQLite session and resets the process-wide rule index around each test.
+    """
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    threshold_rules.invalidate()
+    yield session
+    threshold_rules.invalidate()
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+def reading(sensor_id, control_unit_id, minutes: int, temperature: float, humidity: float = 50.0) -> tuple:
+    return (uuid4(), sensor_id, control_unit_id, NOW + timedelta(minutes=minutes), humidity, temperature)
+
+
+def excursions(db) -> list[ThresholdExcursion]:
+    return db.query(ThresholdExcursion).order_by(ThresholdExcursion.started_at).all()
+
+
+# -----------------------------
+# Tests
+# -----------------------------
+def test_excursion_opened_extended_and_closed_across_batches(db_session):
+    """
+    Purpose: Validate incremental excursion tracking for a sensor rule.
+    Scenario: A 2-8 °C rule; batches take the sensor above the band, further above, then back inside.
+    Expected: One excursion row from the first out-of-band reading to the first in-band reading,
+              with the highest temperature as peak and the out-of-band readings counted.
+    """
+    sensor_id, control_unit_id = uuid4(), uuid4()
+    db_session.add(ThresholdRule(sensor_unit_id=sensor_id, temperature_min=2.0, temperature_max=8.0))
+    db_session.commit()
+
+    save_readings(db_session, [reading(sensor_id, control_unit_id, 0, 5.0), reading(sensor_id, control_unit_id, 1, 9.0)])
+    [excursion] = excursions(db_session)
+    started_at = NOW + timedelta(minutes=1)
+    assert (excursion.field, excursion.started_at, excursion.ended_at) == ("temperature", started_at, None)
+    assert excursion.peak_value == 9.0
+
+    save_readings(db_session, [reading(sensor_id, control_unit_id, 3, 8.5), reading(sensor_id, control_unit_id, 2, 11.0)])
+    save_readings(db_session, [reading(sensor_id, control_unit_id, 4, 7.0)])
+    db_session.expire_all()
+    [excursion] = excursions(db_session)
+    assert excursion.ended_at == NOW + timedelta(minutes=4)
+    assert excursion.peak_value == 11.0
+    assert excursion.reading_count == 3
+
+
+def test_shipment_rule_applies_to_shipment_sensor(db_session):
+    """
+    Purpose: Validate that shipment rules are resolved to the shipment's sensor unit.
+    Scenario: A humidity rule on a shipment; readings from its sensor and from an unrelated sensor go below the band.
+    Expected: Only the shipment's sensor gets an open humidity excursion; the other sensor is ignored.
+    """
+    sensor_id, other_sensor_id, control_unit_id = uuid4(), uuid4(), uuid4()
+    shipment = Shipment(shipment_number="P-1", sender_id=uuid4(), receiver_id=uuid4(), sensor_unit_id=sensor_id)
+    db_session.add(shipment)
+    db_session.flush()
+    db_session.add(ThresholdRule(shipment_id=shipment.id, humidity_min=30.0))
+    db_session.commit()
+
+    save_readings(
+        db_session,
+        [
+            reading(sensor_id, control_unit_id, 0, 5.0, humidity=20.0),
+            reading(other_sensor_id, control_unit_id, 0, 5.0, humidity=20.0),
+        ],
+    )
+    [excursion] = excursions(db_session)
+    assert (excursion.sensor_unit_id, excursion.field, excursion.peak_value) == (sensor_id, "humidity", 20.0)
+    assert excursion.ended_at is None
+
+
+def test_shipment_rules_follow_sensor_change_and_deletion(db_session):
+    """
+    Purpose: Validate that shipment updates and deletions keep the rule index in sync.
+    Scenario: A 2-8 °C shipment rule is evaluated once, the shipment is moved to another sensor,
+              and finally deleted, with out-of-band readings from both sensors after each step.
+    Expected: After the move only the new sensor gets an excursion; deleting the shipment removes
+              its rule and excursions and later readings record nothing.
+    """
+    old_sensor_id, new_sensor_id, control_unit_id = uuid4(), uuid4(), uuid4()
+    shipment = Shipment(shipment_number="P-2", sender_id=uuid4(), receiver_id=uuid4(), sensor_unit_id=old_sensor_id)
+    db_session.add(shipment)
+    db_session.flush()
+    db_session.add(ThresholdRule(shipment_id=shipment.id, temperature_min=2.0, temperature_max=8.0))
+    db_session.commit()
+    save_readings(db_session, [reading(old_sensor_id, control_unit_id, 0, 5.0)])
+
+    update_shipment(db_session, shipment.id, sensor_unit_id=new_sensor_id)
+    save_readings(db_session, [reading(sensor, control_unit_id, 1, 12.0) for sensor in (old_sensor_id, new_sensor_id)])
+    assert [excursion.sensor_unit_id for excursion in excursions(db_session)] == [new_sensor_id]
+
+    delete_shipment(db_session, shipment.id)
+    assert db_session.query(ThresholdRule).count() == 0
+    assert excursions(db_session) == []
+    save_readings(db_session, [reading(new_sensor_id, control_unit_id, 2, 1.0)])
+    assert excursions(db_session) == []
+
+
+def test_open_excursions_survive_reload(db_session):
+    """
+    Purpose: Validate that a fresh index continues open excursions from the database.
+    Scenario: Open an excursion with one index, then evaluate an in-band reading with a new index.
+    Expected: The existing excursion is closed instead of a new one being created.
+    """
+    sensor_id, control_unit_id = uuid4(), uuid4()
+    db_session.add(ThresholdRule(sensor_unit_id=sensor_id, temperature_max=8.0))
+    db_session.commit()
+    with ThresholdRuleIndex().evaluating(db_session, [reading(sensor_id, control_unit_id, 0, 12.0)]):
+        db_session.commit()
+
+    with ThresholdRuleIndex().evaluating(db_session, [reading(sensor_id, control_unit_id, 1, 4.0)]) as events:
+        db_session.commit()
+    assert [event["ended_at"] for event in events] == [NOW + timedelta(minutes=1)]
+    [excursion] = excursions(db_session)
+    assert excursion.ended_at == NOW + timedelta(minutes=1)
+
+
+def test_no_rules_records_nothing(db_session):
+    """
+    Purpose: Validate the no-rule fast path.
+    Scenario: Evaluate readings far outside any plausible band without rules.
+    Expected: No events and no excursion rows.
+    """
+    index = ThresholdRuleIndex()
+    with index.evaluating(db_session, [reading(uuid4(), uuid4(), 0, 99.0)]) as events:
+        assert events == []
+    assert excursions(db_session) == []
+
+
+def test_failed_commit_leaves_index_state_unchanged(db_session):
+    """
+    Purpose: Validate that excursion changes reach the index only after their transaction commits.
+    Scenario: Open an excursion, then evaluate a closing reading whose commit fails and is rolled back,
+              then evaluate the same closing reading again.
+    Expected: After the failure the excursion is still open in the database and in the index, and the
+              retried reading closes it.
+    """
+    sensor_id, control_unit_id = uuid4(), uuid4()
+    db_session.add(ThresholdRule(sensor_unit_id=sensor_id, temperature_max=8.0))
+    db_session.commit()
+    index = ThresholdRuleIndex()
+    with index.evaluating(db_session, [reading(sensor_id, control_unit_id, 0, 12.0)]):
+        db_session.commit()
+
+    closing = reading(sensor_id, control_unit_id, 1, 4.0)
+    with pytest.raises(RuntimeError):
+        with index.evaluating(db_session, [closing]):
+            raise RuntimeError("commit failed")
+    db_session.rollback()
+    [excursion] = excursions(db_session)
+    assert excursion.ended_at is None
+
+    with index.evaluating(db_session, [closing]) as events:
+        db_session.commit()
+    assert [event["ended_at"] for event in events] == [NOW + timedelta(minutes=1)]
+
+
+def test_concurrent_batch_waits_for_commit_of_same_sensor(tmp_path):
+    """
+    Purpose: Validate that two batches for the same sensor cannot interleave evaluation and commit.
+    Scenario: One thread opens an excursion and holds its transaction open; another thread evaluates a
+              closing reading for the same sensor meanwhile, then the first thread commits.
+    Expected: The second batch only evaluates after the first committed, so it closes the committed
+              excursion row instead of updating a row that is not visible yet.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'thresholds.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    sensor_id, control_unit_id = uuid4(), uuid4()
+    with Session() as db:
+        db.add(ThresholdRule(sensor_unit_id=sensor_id, temperature_max=8.0))
+        db.commit()
+    index = ThresholdRuleIndex()
+    evaluated = threading.Event()
+
+    def close_excursion():
+        with Session() as db:
+            with index.evaluating(db, [reading(sensor_id, control_unit_id, 1, 4.0)]):
+                evaluated.set()
+                db.commit()
+
+    with Session() as db:
+        with index.evaluating(db, [reading(sensor_id, control_unit_id, 0, 12.0)]):
+            closer = threading.Thread(target=close_excursion)
+            closer.start()
+            assert not evaluated.wait(0.2)
+            db.commit()
+    closer.join(timeout=5)
+
+    with Session() as db:
+        [excursion] = excursions(db)
+        assert excursion.ended_at == NOW + timedelta(minutes=1)
+    engine.dispose()
+
+
+def test_single_reading_create_records_excursions(db_session):
+    """
+    Purpose: Validate that readings created one at a time are evaluated against threshold rules.
+    Scenario: A 2-8 °C rule; create a single out-of-band reading for its sensor.
+    Expected: An open temperature excursion starting at the reading.
+    """
+    sensor_id = uuid4()
+    db_session.add(ThresholdRule(sensor_unit_id=sensor_id, temperature_min=2.0, temperature_max=8.0))
+    db_session.commit()
+    data = ControlUnitDataCreate(
+        sensor_unit_id=sensor_id,
+        control_unit_id=uuid4(),
+        humidity={"value": 50.0},
+        temperature={"value": 11.0},
+        timestamp=NOW,
+    )
+    create_control_unit_data(db_session, data)
+
+    [excursion] = excursions(db_session)
+    assert (excursion.field, excursion.started_at, excursion.ended_at) == ("temperature", NOW, None)
+    assert excursion.peak_value == 11.0
@@ -0,0 +1,34 @@
+from uuid import uuid4
+from app.api.v1.schemas.user_schema import UserCreate
+from app.services.token_versions import token_versions
+from app.services.user_service import create_user, delete_user, update_user
+from app.utils.metrics import metrics
+
+
+def misses() -> int:
+    return metrics.snapshot()["counters"].get("token_versions.misses", 0)
+
+
+def test_version_is_loaded_once_and_reloaded_after_changes(db_session):
+    """
+    Purpose: Validate the token version registry's lazy loading and invalidation.
+    Scenario: Look up a new user's version twice, change its username, then its role, then delete it.
+    Expected: The second lookup needs no query; a username change keeps the version, a role change
+        increments it, and a deleted user has no version.
+    """
+    user = create_user(db_session, UserCreate(username=f"ver_{uuid4()}", password="1234", role="customer"))
+
+    before = misses()
+    assert token_versions.is_current(db_session, user.id, 0)
+    assert token_versions.is_current(db_session, user.id, 0)
+    assert misses() - before == 1
+
+    update_user(db_session, user.id, {"username": f"renamed_{uuid4()}"})
+    assert token_versions.current_version(db_session, user.id) == 0
+
+    update_user(db_session, user.id, {"role": "driver"})
+    assert not token_versions.is_current(db_session, user.id, 0)
+    assert token_versions.is_current(db_session, user.id, 1)
+
+    delete_user(db_session, user.id)
+    assert token_versions.current_version(db_session, user.id) is None
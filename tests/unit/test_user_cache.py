@@ -0,0 +1,103 @@
+import time
+from datetime import datetime
+from uuid import uuid4
+from app.api.v1.schemas.user_schema import UserRead
+from app.services.user_cache import CLEAR_ALL, InvalidationChannel, UserCache
+from app.utils.metrics import metrics
+
+
+def principal(role: str = "customer") -> UserRead:
+    return UserRead(id=uuid4(), username=f"user_{uuid4()}", role=role, created_at=datetime(2026, 10, 17))
+
+
+class RecordingChannel(InvalidationChannel):
+    def __init__(self):
+        self.published = []
+        self.on_invalidate = None
+
+    def start(self, on_invalidate):
+        self.on_invalidate = on_invalidate
+
+    def publish(self, message):
+        self.published.append(message)
+
+
+def test_hits_misses_and_ttl_expiry():
+    """
+    Purpose: Validate hit/miss counting and TTL expiry.
+    Scenario: Look up a user before caching, after caching, and after the TTL elapsed.
+    Expected: Miss, hit, miss; the counters move accordingly.
+    """
+    cache = UserCache(ttl_seconds=0.05, max_size=10)
+    user = principal()
+    before = metrics.snapshot()["counters"]
+
+    assert cache.get(user.id) is None
+    cache.put(user)
+    assert cache.get(user.id) == user
+    time.sleep(0.06)
+    assert cache.get(user.id) is None
+
+    after = metrics.snapshot()["counters"]
+    assert after["user_cache.hits"] - before.get("user_cache.hits", 0) == 1
+    assert after["user_cache.misses"] - before.get("user_cache.misses", 0) == 2
+    assert cache.size == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    """
+    Purpose: Validate the LRU bound.
+    Scenario: Fill a cache of two, touch the oldest entry, then add a third.
+    Expected: The untouched entry is evicted.
+    """
+    cache = UserCache(ttl_seconds=60, max_size=2)
+    first, second, third = principal(), principal(), principal()
+    cache.put(first)
+    cache.put(second)
+    cache.get(first.id)
+    cache.put(third)
+
+    assert cache.size == 2
+    assert cache.get(second.id) is None
+    assert cache.get(first.id) == first
+    assert cache.get(third.id) == third
+
+
+def test_invalidation_is_published_and_received():
+    """
+    Purpose: Validate invalidation across processes through the channel.
+    Scenario: Invalidate one user locally, then deliver a remote invalidation and a clear-all.
+    Expected: Local invalidations are published; remote messages drop the matching entries.
+    """
+    cache = UserCache(ttl_seconds=60, max_size=10)
+    channel = RecordingChannel()
+    cache.attach(channel)
+    local, remote, other = principal(), principal(), principal()
+    for user in (local, remote, other):
+        cache.put(user)
+
+    cache.invalidate(local.id)
+    channel.on_invalidate(str(remote.id))
+    assert channel.published == [str(local.id)]
+    assert cache.get(local.id) is None
+    assert cache.get(remote.id) is None
+    assert cache.get(other.id) == other
+
+    channel.on_invalidate(CLEAR_ALL)
+    assert cache.size == 0
+    cache.detach()
+
+
+def test_load_racing_an_invalidation_is_not_cached():
+    """
+    Purpose: Ensure a principal loaded before an invalidation cannot be cached afterwards.
+    Scenario: Read the generation, invalidate the user, then put the previously loaded principal.
+    Expected: The stale principal is discarded.
+    """
+    cache = UserCache(ttl_seconds=60, max_size=10)
+    user = principal()
+    generation = cache.generation
+    cache.invalidate(user.id)
+    cache.put(user, generation)
+
+    assert cache.get(user.id) is None